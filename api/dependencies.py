@@ -0,0 +1,13 @@
+"""Shared request dependencies for the API routes."""
+
+from fastapi import Header, HTTPException
+
+from entities.hunter import DEFAULT_HUNTER_ID, HUNTER_ID_PATTERN
+
+
+def get_hunter_id(x_hunter_id: str = Header(DEFAULT_HUNTER_ID, description="Hunter the request acts for")) -> str:
+    """Hunter named by the X-Hunter-Id header, or the default hunter."""
+    if not HUNTER_ID_PATTERN.fullmatch(x_hunter_id):
+        raise HTTPException(status_code=400,
+                            detail="Hunter ID must be 1-64 letters, digits, '-' or '_'")
+    return x_hunter_id
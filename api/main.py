@@ -1,18 +1,58 @@
 """FastAPI application for Hunter System."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from api.routes import hunter, quests
+from api.routes import hunter, leaderboard, quests
 from api.middleware import error_handler_middleware, add_exception_handlers
 from api.logging_config import setup_logging, logger
+from repositories.config import storage_config
+from repositories.factory import close_group_commit_writer, get_hunter_store
+from repositories.hunter_store import HunterStore
+from services.leaderboard import LeaderboardRefresher, get_leaderboard_index
+from services.quest_log_writer import close_quest_log_writer, get_quest_log_writer
 
 setup_logging()
 logger.info("Starting Hunter Progression System API...")
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Rebuild the leaderboards on startup and keep refreshing them, and persist pending writes on shutdown."""
+    rebuild_leaderboards()
+    refresher = start_leaderboard_refresher()
+    yield
+    if refresher is not None:
+        refresher.close()
+    flush_pending_writes()
+
+
+def rebuild_leaderboards():
+    """Rank every stored hunter, so the leaderboards start complete."""
+    ranked = get_leaderboard_index().rebuild(get_hunter_store().iter_hunters())
+    logger.info(f"Leaderboards rebuilt with {ranked} hunters.")
+
+
+def start_leaderboard_refresher() -> LeaderboardRefresher | None:
+    """Rebuild the leaderboards periodically, so they include the completions of the other workers."""
+    if storage_config.LEADERBOARD_REFRESH_SECONDS <= 0:
+        return None
+    hunter_store = get_hunter_store()
+    return LeaderboardRefresher(get_leaderboard_index(), hunter_store.iter_hunters,
+                                storage_config.LEADERBOARD_REFRESH_SECONDS)
+
+
+def flush_pending_writes():
+    """Persist queued quest logs, then writes still waiting in the group-commit writer."""
+    close_quest_log_writer()
+    close_group_commit_writer()
+
+
 app = FastAPI(
     title="Hunter Progression System",
     description="API for gamified habit tracking system",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 app.middleware("http")(error_handler_middleware)
@@ -21,6 +61,7 @@ add_exception_handlers(app)
 
 app.include_router(hunter.router)
 app.include_router(quests.router)
+app.include_router(leaderboard.router)
 
 logger.info("Hunter System API started successfully.")
 
@@ -36,5 +77,11 @@ def root():
 
 @app.get("/health")
 def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy"}
\ No newline at end of file
+    """Health check endpoint, with the quest log writer's queue metrics and the hunter cache statistics."""
+    writer = get_quest_log_writer()
+    hunter_store = get_hunter_store()
+    return {
+        "status": "healthy",
+        "quest_log_writer": writer.metrics() if writer is not None else None,
+        "hunter_cache": hunter_store.stats() if isinstance(hunter_store, HunterStore) else None
+    }
\ No newline at end of file
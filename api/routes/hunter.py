@@ -1,17 +1,40 @@
 """Hunter endpoints"""
 
-from fastapi import APIRouter, HTTPException
-from repositories.hunter_repository import HunterRepository
+from datetime import date, datetime, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from api.dependencies import get_hunter_id
+from repositories.config import storage_config
+from repositories.factory import (
+    create_hunter_snapshot_repository,
+    create_quest_log_repository,
+    get_hunter_store,
+)
+from services.activity_service import get_activity_service
+from services.hunter_history_service import HunterHistoryService
+from services.quest_log_writer import get_quest_log_writer
 
 router = APIRouter(prefix="/hunter", tags=["Hunter"])
 
 # Initialize Repository
-hunter_repo = HunterRepository("data/hunter.json")
+hunter_store = get_hunter_store()
+history_service = HunterHistoryService(
+    create_quest_log_repository(),
+    create_hunter_snapshot_repository(),
+    storage_config.HUNTER_SNAPSHOT_INTERVAL
+)
+quest_log_writer = get_quest_log_writer()
+if quest_log_writer is not None:
+    quest_log_writer.add_listener(history_service.refresh_for)
+activity_service = get_activity_service()
+
+# Most days returned by one GET /hunter/activity request
+MAX_ACTIVITY_DAYS = 366
 
 @router.get("/profile")
-def get_gunter_profile():
+def get_gunter_profile(hunter_id: str = Depends(get_hunter_id)):
     """Get hunter profile with all stats."""
-    hunter = hunter_repo.load()
+    hunter = hunter_store.for_hunter(hunter_id).load()
 
     # Convert stats into a serializable format
     stats_data = {}
@@ -26,28 +49,86 @@ def get_gunter_profile():
     return {
         "name": hunter.name,
         "global level": hunter.get_global_level(),
-        "total_XP": stat.total_xp,
+        "total_XP": hunter.get_global_exp(),
+        "xp_for_next_global_level": hunter.get_global_xp_for_next_level(),
         "gold": hunter.gold,
         "stats": stats_data
     }
 
+@router.get("/history")
+def get_hunter_history(at: datetime = None, hunter_id: str = Depends(get_hunter_id)):
+    """Get hunter stats and earned gold rebuilt from the quest log, as of now or as of `at`."""
+    if at is not None and at.tzinfo is not None:
+        # Completion times are stored as naive local time
+        at = at.astimezone().replace(tzinfo=None)
+
+    result = history_service.state_at(hunter_id, at)
+    hunter = result["hunter"]
+
+    stats_data = {}
+    for stat_name, stat in hunter.stats.items():
+        stats_data[stat_name] = {
+            "name": stat.name,
+            "level": stat.get_level(),
+            "total_xp": stat.total_xp
+        }
+
+    return {
+        "at": at.isoformat() if at is not None else None,
+        "completions": result["completions"],
+        "global level": hunter.get_global_level(),
+        "total_XP": hunter.get_global_exp(),
+        "gold_earned": hunter.gold,
+        "stats": stats_data
+    }
+
+@router.get("/streaks")
+def get_hunter_streaks(hunter_id: str = Depends(get_hunter_id)):
+    """Get the hunter's current and longest streaks of consecutive active days."""
+    return activity_service.streaks(hunter_id)
+
+@router.get("/activity")
+def get_hunter_activity(
+    start: date = Query(None, description="First day (default: 29 days before end)"),
+    end: date = Query(None, description="Last day (default: today)"),
+    hunter_id: str = Depends(get_hunter_id)
+):
+    """Get the hunter's completions, XP per stat and gold for each active day of a range."""
+    end = end or date.today()
+    start = start or end - timedelta(days=29)
+
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must not be after end")
+    if (end - start).days + 1 > MAX_ACTIVITY_DAYS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_ACTIVITY_DAYS} days can be requested")
+
+    return {
+        "start": start,
+        "end": end,
+        "days": activity_service.calendar(hunter_id, start, end)
+    }
+
 @router.put("/profile")
-def update_hutner_profile(name: str = None, gold: int = None):
+def update_hutner_profile(name: str = None, gold: int = None, hunter_id: str = Depends(get_hunter_id)):
     """Update hunter name or gold (for testing/admin)"""
-    hunter = hunter_repo.load()
-
-    # Update fields if included
-    if name is not None:
-        if not name.strip():
-            raise HTTPException(status_code=400, detail="Name cannot be empty.")
-        hunter.name = name
-    
-    if gold is not None:
-        if gold < 0:
-            raise HTTPException(status_code=400, detail="Gold cannot be negative")
-        hunter.gold = gold
-
-    hunter_repo.save(hunter)
+    hunter_repo = hunter_store.for_hunter(hunter_id)
+
+    # Hold the profile lock so completions from other workers are not overwritten
+    with hunter_repo.transaction():
+        hunter = hunter_repo.load()
+
+        # Update fields if included
+        if name is not None:
+            if not name.strip():
+                raise HTTPException(status_code=400, detail="Name cannot be empty.")
+            hunter.name = name
+        
+        if gold is not None:
+            if gold < 0:
+                raise HTTPException(status_code=400, detail="Gold cannot be negative")
+            hunter.gold = gold
+
+        hunter_repo.save(hunter)
 
     return {
         "message": "Hunter updated succesfully",
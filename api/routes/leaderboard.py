@@ -0,0 +1,53 @@
+"""Leaderboard endpoints"""
+
+from fastapi import APIRouter, HTTPException, Query
+
+from api.schemas.leaderboard import (
+    MAX_LEADERBOARD_LIMIT,
+    MAX_LEADERBOARD_RADIUS,
+    HunterStandingResponse,
+    LeaderboardResponse,
+)
+from services.leaderboard import GLOBAL_BOARD, get_leaderboard_index
+
+router = APIRouter(prefix="/leaderboard", tags=["Leaderboard"])
+
+leaderboard = get_leaderboard_index()
+
+def _check_board(board: str) -> None:
+    if board not in leaderboard.board_names:
+        raise HTTPException(status_code=404,
+                            detail=f"Leaderboard '{board}' not found. Use one of: {', '.join(leaderboard.board_names)}")
+
+@router.get("/", response_model=LeaderboardResponse)
+def get_global_leaderboard(limit: int = Query(10, ge=1, le=MAX_LEADERBOARD_LIMIT, description="Hunters returned")):
+    """Get the hunters with the most global XP."""
+    return get_leaderboard(GLOBAL_BOARD, limit)
+
+@router.get("/{board}", response_model=LeaderboardResponse)
+def get_leaderboard(board: str, limit: int = Query(10, ge=1, le=MAX_LEADERBOARD_LIMIT, description="Hunters returned")):
+    """Get the hunters with the most XP on a board: 'global' or a stat name."""
+    _check_board(board)
+    entries = leaderboard.top(board, limit)
+    return {
+        "board": board,
+        "total_hunters": leaderboard.size(board),
+        "entries": entries
+    }
+
+@router.get("/{board}/{hunter_id}", response_model=HunterStandingResponse)
+def get_hunter_standing(board: str, hunter_id: str,
+                        radius: int = Query(2, ge=0, le=MAX_LEADERBOARD_RADIUS,
+                                            description="Hunters returned above and below")):
+    """Get a hunter's rank on a board and the hunters ranked around it."""
+    _check_board(board)
+    standing = leaderboard.standing(board, hunter_id, radius)
+
+    if standing is None:
+        raise HTTPException(status_code=404, detail=f"Hunter '{hunter_id}' not found on leaderboard '{board}'")
+
+    return {
+        "board": board,
+        "hunter_id": hunter_id,
+        **standing
+    }
@@ -1,35 +1,82 @@
 """Quest endpoints."""
 
-from fastapi import APIRouter, HTTPException, Query
+import json
+from collections.abc import Iterator
+from itertools import islice
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from typing import Optional
-from repositories.quest_repository import QuestRepository
+from repositories.factory import create_quest_repository, get_hunter_store
 from services.quest_service import QuestService
 from services.progression_service import ProgressionService
-from repositories.hunter_repository import HunterRepository
-from api.schemas.quest import QuestCreate, QuestUpdate, QuestResponse, QuestList 
-from api.schemas.completion import CompleteQuestResponse
+from services.activity_service import get_activity_service
+from services.leaderboard import get_leaderboard_index
+from services.quest_log_writer import get_quest_log_writer
+from api.schemas.quest import QuestCreate, QuestUpdate, QuestResponse, QuestList, QuestDifficultyEnum
+from api.schemas.completion import CompleteQuestResponse, CompleteQuestsRequest, CompleteQuestsResponse
 
+from api.dependencies import get_hunter_id
 from api.exceptions import QuestNotFoundException
 
 
 router = APIRouter(prefix="/quests", tags=["Quests"])
 
-quest_repo = QuestRepository("data/quests.json")
+# Quests serialized per chunk of the streamed GET /quests body
+LIST_STREAM_BATCH = 100
+
+quest_repo = create_quest_repository()
 quest_service = QuestService(quest_repo)
 
-hunter_repo = HunterRepository("data/hunter.json")
-progression_service = ProgressionService(hunter_repo, quest_repo)
+progression_service = ProgressionService(get_hunter_store(), quest_repo, quest_log_writer=get_quest_log_writer(),
+                                         leaderboard=get_leaderboard_index(), activity_service=get_activity_service())
+
+@router.get("/", responses={200: {"model": QuestList, "description": "Quests matching the filters"}})
+def list_quests(
+    stat: Optional[str] = Query(None, description="Filter by stat type"),
+    difficulty: Optional[QuestDifficultyEnum] = Query(None, description="Filter by difficulty"),
+    min_xp: Optional[int] = Query(None, ge=0, description="Minimum XP reward (inclusive)"),
+    max_xp: Optional[int] = Query(None, ge=0, description="Maximum XP reward (inclusive)"),
+    min_gold: Optional[int] = Query(None, ge=0, description="Minimum gold reward (inclusive)"),
+    max_gold: Optional[int] = Query(None, ge=0, description="Maximum gold reward (inclusive)")
+):
+    """
+    List all quests, optionally filtered by stat, difficulty and reward ranges.
+
+    The body is streamed as quests are read from the catalog, so the full list
+    is never built in memory; "total" comes last, once every quest is sent.
+    The first page is read and validated before the response starts, so a
+    catalog that cannot be read still fails with an error response.
+    """
+    from entities.quest_difficulty import QuestDifficulty
 
-@router.get("/", response_model=QuestList)
-def list_quests(stat: Optional[str] = Query(None, description="Filter by stat type")):
-    """List all quests, optionally filtered by stat."""
-    if stat:
-        quests = quest_service.list_by_stat(stat)
+    range_filters = (difficulty, min_xp, max_xp, min_gold, max_gold)
+    if any(value is not None for value in range_filters):
+        quests = quest_service.find_quests(
+            stat_name = stat,
+            difficulty = QuestDifficulty[difficulty.value] if difficulty else None,
+            min_xp = min_xp,
+            max_xp = max_xp,
+            min_gold = min_gold,
+            max_gold = max_gold
+        )
+    elif stat is not None:
+        quests = quest_service.iter_by_stat(stat)
     else:
-        quests = quest_service.get_all()
-    
-    # Convertir a QuestResponse
-    quests_data = [
+        quests = quest_service.iter_all()
+
+    header = {
+        "stat_filter": stat,
+        "difficulty_filter": difficulty.value if difficulty else None
+    }
+    quests = iter(quests)
+    first_page = _quest_page(quests)
+    return StreamingResponse(_stream_quest_list(header, first_page, quests), media_type="application/json")
+
+
+def _quest_page(quests: Iterator) -> list[str]:
+    """Serialize the next LIST_STREAM_BATCH quests as validated QuestResponse JSON."""
+    return [
         QuestResponse(
             id=quest.id,
             name=quest.name,
@@ -38,15 +85,23 @@ def list_quests(stat: Optional[str] = Query(None, description="Filter by stat ty
             xp_reward=quest.xp_reward,
             gold_reward=quest.gold_reward,
             description=quest.description
-        )
-        for quest in quests
+        ).model_dump_json()
+        for quest in islice(quests, LIST_STREAM_BATCH)
     ]
-    
-    return QuestList(
-        total=len(quests_data),
-        stat_filter=stat,
-        quests=quests_data
-    )
+
+
+def _stream_quest_list(header: dict, first_page: list[str], quests: Iterator) -> Iterator[str]:
+    """Yield a QuestList JSON document, one page of LIST_STREAM_BATCH quests at a time."""
+    yield json.dumps(header)[:-1] + ', "quests": ['
+
+    total = 0
+    page = first_page
+    while page:
+        yield ("," if total else "") + ",".join(page)
+        total += len(page)
+        page = _quest_page(quests) if len(page) == LIST_STREAM_BATCH else []
+
+    yield f'], "total": {total}}}'
 
 @router.get("/{quest_id}", response_model=QuestResponse)
 def get_quest(quest_id: str):
@@ -193,10 +248,56 @@ def delete_quest(quest_id: str):
     
     return None
 
+@router.post("/complete", response_model=CompleteQuestsResponse)
+def complete_quests(data: CompleteQuestsRequest, hunter_id: str = Depends(get_hunter_id)):
+    """
+    Complete several quests in order with a single hunter save.
+
+    All-or-nothing: if any quest is unknown, nothing is applied.
+    """
+    result = progression_service.complete_many(data.quest_ids, hunter_id)
+
+    if not result["success"]:
+        error = result.get("error", "Unknown error")
+        if "not found" in error.lower():
+            raise HTTPException(status_code=404, detail=error)
+        else:
+            raise HTTPException(status_code=400, detail=error)
+
+    from api.schemas.completion import RewardSchema, ProgressionSchema, HunterStatusSchema, QuestCompletionSchema
+
+    completed = []
+    for quest, reward in result["completed"]:
+        progress = reward.stats[0]
+        completed.append(QuestCompletionSchema(
+            quest_id = quest.id,
+            quest_name = quest.name,
+            rewards = RewardSchema(
+                xp_gained=progress.xp_gained,
+                stat=progress.stat,
+                gold_gained=reward.gold_gained
+            ),
+            progression = ProgressionSchema(
+                level_before=progress.level_before,
+                level_after=progress.level_after,
+                leveled_up=progress.leveled_up,
+                levels_gained=progress.levels_gained,
+                xp_to_next_level=progress.xp_to_next_level
+            )
+        ))
+
+    return CompleteQuestsResponse(
+        message = f"{len(completed)} quests completed!",
+        completed = completed,
+        hunter_status = HunterStatusSchema(
+            total_gold=result["total_gold"]
+        )
+    )
+
 @router.post("/{quest_id}/complete", response_model=CompleteQuestResponse)
-def complete_quest(quest_id: str):
+def complete_quest(quest_id: str, hunter_id: str = Depends(get_hunter_id)):
     """Complete a quest and apply rewards to hunter."""
-    result = progression_service.complete_quest(quest_id)
+    result = progression_service.complete_quest(quest_id, hunter_id)
     
     if not result["success"]:
         error = result.get("error", "Unknown error")
@@ -206,20 +307,25 @@ def complete_quest(quest_id: str):
             raise HTTPException(status_code=400, detail=error)
         
     from api.schemas.completion import RewardSchema, ProgressionSchema, HunterStatusSchema
+
+    reward = result["result"]
+    progress = reward.stats[0]
     
     return CompleteQuestResponse(
         message = f"Quest '{result['quest_name']}' completed!",
         rewards = RewardSchema(
-            xp_gained=result["xp_gained"],
-            stat=result["stat"],
-            gold_gained=result["gold_gained"]
+            xp_gained=progress.xp_gained,
+            stat=progress.stat,
+            gold_gained=reward.gold_gained
         ),
         progression = ProgressionSchema(
-            level_before=result["level_before"],
-            level_after=result["level_after"],
-            leveled_up=result["leveled_up"]
+            level_before=progress.level_before,
+            level_after=progress.level_after,
+            leveled_up=progress.leveled_up,
+            levels_gained=progress.levels_gained,
+            xp_to_next_level=progress.xp_to_next_level
         ),
         hunter_status=HunterStatusSchema(
-            total_gold=result["total_gold"]
+            total_gold=reward.total_gold
         )
     )
\ No newline at end of file
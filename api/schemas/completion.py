@@ -1,6 +1,9 @@
 """Pydantic schemas for quest completion"""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+# Most quests accepted by one POST /quests/complete request
+MAX_BATCH_COMPLETIONS = 500
 
 class RewardSchema(BaseModel):
     """Rewards obtained from quest completion"""
@@ -13,6 +16,8 @@ class ProgressionSchema(BaseModel):
     level_before: int
     level_after: int
     leveled_up: bool
+    levels_gained: int
+    xp_to_next_level: int
 
 class HunterStatusSchema(BaseModel):
     """Hunter status after quest completion"""
@@ -37,10 +42,37 @@ class CompleteQuestResponse(BaseModel):
                 "progression": {
                     "level_before": 5,
                     "level_after": 6,
-                    "leveled_up": True
+                    "leveled_up": True,
+                    "levels_gained": 1,
+                    "xp_to_next_level": 350
                 },
                 "hunter_status": {
                     "total_gold": 320
                 }
             }
-        }
\ No newline at end of file
+        }
+
+class CompleteQuestsRequest(BaseModel):
+    """Schema for completing several quests at once."""
+    quest_ids: list[str] = Field(..., min_length = 1, max_length = MAX_BATCH_COMPLETIONS,
+                                 description = "Completed quest IDs, in completion order")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "quest_ids": ["abc-123-def-456", "abc-123-def-456", "ghi-789-jkl-012"]
+            }
+        }
+
+class QuestCompletionSchema(BaseModel):
+    """Rewards and progression of one completion in a batch"""
+    quest_id: str
+    quest_name: str
+    rewards: RewardSchema
+    progression: ProgressionSchema
+
+class CompleteQuestsResponse(BaseModel):
+    """Schema for batch quest completion response."""
+    message: str
+    completed: list[QuestCompletionSchema]
+    hunter_status: HunterStatusSchema
@@ -0,0 +1,43 @@
+"""Pydantic schemas for leaderboard endpoints"""
+
+from pydantic import BaseModel
+
+# Most hunters returned by one leaderboard request
+MAX_LEADERBOARD_LIMIT = 100
+
+# Most neighbors returned on each side of a hunter
+MAX_LEADERBOARD_RADIUS = 50
+
+class LeaderboardEntrySchema(BaseModel):
+    """One ranked hunter"""
+    rank: int
+    hunter_id: str
+    xp: int
+    level: int
+
+class LeaderboardResponse(BaseModel):
+    """Schema for the best hunters of a board."""
+    board: str
+    total_hunters: int
+    entries: list[LeaderboardEntrySchema]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "board": "global",
+                "total_hunters": 2,
+                "entries": [
+                    {"rank": 1, "hunter_id": "alice", "xp": 12500, "level": 11},
+                    {"rank": 2, "hunter_id": "default", "xp": 4300, "level": 7}
+                ]
+            }
+        }
+
+class HunterStandingResponse(BaseModel):
+    """Schema for a hunter's rank on a board and the hunters around it."""
+    board: str
+    hunter_id: str
+    rank: int
+    xp: int
+    total_hunters: int
+    neighbors: list[LeaderboardEntrySchema]
@@ -78,6 +78,7 @@ class QuestList(BaseModel):
     """Schema for listing multiple quests."""
     total: int
     stat_filter: str | None
+    difficulty_filter: str | None = None
     quests: List[QuestResponse]
     
     class Config:
@@ -85,6 +86,7 @@ class QuestList(BaseModel):
             "example": {
                 "total": 2,
                 "stat_filter": "Strength",
+                "difficulty_filter": "HARD",
                 "quests": [
                     {
                         "id": "abc-123",
@@ -0,0 +1,5 @@
+"""
+Benchmarks package.
+Standalone scripts measuring memory and throughput of the core components.
+Run from the project root, e.g. `python -m benchmarks.hunter_memory`.
+"""
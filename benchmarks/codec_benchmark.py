@@ -0,0 +1,123 @@
+"""
+Storage codec benchmark.
+
+Writes and reads a generated quest catalog, hunter profile and quest log
+through every installed codec, using the repositories themselves, and reports
+save time, load time and file size per codec.
+
+Usage:
+    python -m benchmarks.codec_benchmark [--quests 20000] [--logs 100000] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from entities.hunter import Hunter
+from entities.quest import Quest
+from entities.quest_difficulty import QuestDifficulty
+from entities.quest_log import QuestLog
+from repositories.codecs import available_codecs
+from repositories.hunter_repository import HunterRepository
+from repositories.quest_log_repository import QuestLogRepository
+from repositories.quest_repository import QuestRepository
+from utils.valid_stats import VALID_STATS
+
+
+def build_catalog(count: int, seed: int = 1) -> dict:
+    """Build a raw quest catalog (as stored by QuestRepository) with `count` quests."""
+    rng = random.Random(seed)
+    repository = QuestRepository(os.devnull)
+    catalog = {}
+    for i in range(count):
+        quest = Quest(
+            f"Quest {i}: {rng.choice(['Run', 'Read', 'Meditate', 'Lift', 'Study'])} session",
+            rng.choice(VALID_STATS),
+            rng.choice(list(QuestDifficulty)),
+            rng.randint(10, 500),
+            rng.randint(5, 250),
+            f"Generated quest number {i} used to benchmark storage codecs."
+        )
+        catalog[quest.id] = repository._quest_to_dict(quest)
+    return catalog
+
+
+def build_logs(count: int, quest_ids: list[str], seed: int = 2) -> list[QuestLog]:
+    """Build `count` quest log entries over the given quests, one minute apart."""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    return [
+        QuestLog.from_record(rng.choice(quest_ids), rng.randint(10, 200), rng.randint(5, 100),
+                             start + timedelta(minutes=i), rng.choice(VALID_STATS))
+        for i in range(count)
+    ]
+
+
+def timed(action, repeat: int) -> float:
+    """Run `action` `repeat` times and return the best wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load/save time and file size per storage codec")
+    parser.add_argument("--quests", type=int, default=20_000, help="Quests in the catalog")
+    parser.add_argument("--logs", type=int, default=100_000, help="Quest log entries")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    catalog = build_catalog(args.quests)
+    logs = build_logs(args.logs, list(catalog))
+    hunter = Hunter("Benchmark")
+    for i, stat_name in enumerate(VALID_STATS):
+        hunter.stats[stat_name].total_xp = 1000 * (i + 1)
+
+    print(f"Quests: {args.quests:,}   Log entries: {args.logs:,}   Best of {args.repeat}")
+    print(f"{'codec':<10}{'file':<10}{'save ms':>10}{'load ms':>10}{'size KiB':>12}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for codec in available_codecs():
+            label = f"{codec.name} ({type(codec).__name__.removesuffix('Codec')})"
+
+            quests = QuestRepository(os.path.join(directory, codec.name + "_quests" + codec.extension), codec)
+            save = timed(lambda: quests._save_all_data(catalog, quests._stored_version()), args.repeat)
+            load = timed(quests._load_all_data, args.repeat)
+            print(f"{label:<24}\n{'':<10}{'catalog':<10}{save:>10.1f}{load:>10.1f}"
+                  f"{os.path.getsize(quests.filepath) / 1024:>12.1f}")
+
+            hunters = HunterRepository(os.path.join(directory, codec.name + "_hunter" + codec.extension), codec)
+            hunter.version = 0  # Fresh file for each codec
+            save = timed(lambda: hunters.save(hunter), args.repeat)
+            load = timed(hunters.load, args.repeat)
+            print(f"{'':<10}{'hunter':<10}{save:>10.3f}{load:>10.3f}"
+                  f"{os.path.getsize(hunters.filepath) / 1024:>12.1f}")
+
+            if not codec.supports_lines:
+                print(f"{'':<10}{'log':<10}{'(line-based log not supported)':>32}")
+                continue
+
+            log_path = os.path.join(directory, codec.name + "_logs.jsonl")
+
+            def save_logs():
+                if os.path.exists(log_path):
+                    os.remove(log_path)
+                log_repository = QuestLogRepository(log_path, codec)
+                for quest_log in logs:
+                    log_repository.add(quest_log)
+
+            save = timed(save_logs, 1)
+            log_repository = QuestLogRepository(log_path, codec)
+            load = timed(log_repository.get_all, args.repeat)
+            print(f"{'':<10}{'log':<10}{save:>10.1f}{load:>10.1f}"
+                  f"{os.path.getsize(log_path) / 1024:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
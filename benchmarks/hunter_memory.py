@@ -0,0 +1,66 @@
+"""
+Hunter memory benchmark.
+
+Measures the per-hunter memory footprint of the slotted, array-backed Hunter
+against the previous layout (a dict of five Stat objects with instance dicts)
+by allocating many hunters under tracemalloc.
+
+Usage:
+    python -m benchmarks.hunter_memory [--count 50000]
+"""
+
+import argparse
+import tracemalloc
+
+from entities.hunter import Hunter
+from utils.valid_stats import VALID_STATS
+
+
+class _DictStat:
+    """Stat with an instance dict, as before the slotted representation."""
+
+    def __init__(self, name: str, total_xp: int) -> None:
+        self.name = name
+        self.total_xp = total_xp
+
+
+class _DictHunter:
+    """Hunter holding a dict of Stat objects, as before the slotted representation."""
+
+    def __init__(self, name: str, gold: int = 0) -> None:
+        self.name = name
+        self.gold = gold
+        self.stats = {stat_name: _DictStat(stat_name, 0) for stat_name in VALID_STATS}
+
+
+def measure(factory, count: int) -> float:
+    """Allocate `count` hunters with `factory` and return the bytes used per hunter."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+
+    hunters = [factory(f"Hunter {i}") for i in range(count)]
+
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Both layouts pay for the same name strings, so the difference is layout only
+    del hunters
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-hunter memory footprint")
+    parser.add_argument("--count", type=int, default=50_000, help="Number of hunters to allocate")
+    args = parser.parse_args()
+
+    compact = measure(Hunter, args.count)
+    legacy = measure(_DictHunter, args.count)
+
+    print(f"Hunters allocated:      {args.count:,}")
+    print(f"Dict-of-Stat layout:    {legacy:8.1f} bytes/hunter")
+    print(f"Slotted array layout:   {compact:8.1f} bytes/hunter")
+    print(f"Reduction:              {(1 - compact / legacy) * 100:8.1f} %")
+
+
+if __name__ == "__main__":
+    main()
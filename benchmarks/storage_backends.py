@@ -0,0 +1,105 @@
+"""
+Storage backend benchmark.
+
+Runs the same workload against the JSON file repositories and the SQLite
+repositories: building a quest catalog, point lookups, filtered queries,
+quest completions (load hunter, apply rewards, save) and quest log writes
+and reads. Reports the time per operation for each backend. The JSON quest
+repository is used without CachedQuestRepository, to compare storage alone.
+
+Usage:
+    python -m benchmarks.storage_backends [--quests 5000] [--lookups 2000] [--completions 500]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from entities.quest import Quest
+from entities.quest_difficulty import QuestDifficulty
+from entities.quest_log import QuestLog
+from repositories.hunter_repository import HunterRepository
+from repositories.quest_log_repository import QuestLogRepository
+from repositories.quest_repository import QuestRepository
+from repositories.sqlite import (
+    HunterRepositorySQLite,
+    QuestLogRepositorySQLite,
+    QuestRepositorySQLite,
+    SQLiteDatabase,
+)
+from services.progression_service import ProgressionService
+from utils.valid_stats import VALID_STATS
+
+
+def build_quests(count: int, seed: int = 1) -> list[Quest]:
+    """Generate `count` quests with random stats, difficulties and rewards."""
+    rng = random.Random(seed)
+    return [
+        Quest(f"Quest {i}", rng.choice(VALID_STATS), rng.choice(list(QuestDifficulty)),
+              rng.randint(10, 500), rng.randint(5, 250), f"Generated quest number {i}.")
+        for i in range(count)
+    ]
+
+
+def per_op_us(action, count: int) -> float:
+    """Run `action(i)` for i in range(count) and return microseconds per call."""
+    started = time.perf_counter()
+    for i in range(count):
+        action(i)
+    return (time.perf_counter() - started) / max(count, 1) * 1_000_000
+
+
+def run_workload(hunters, quests, logs, args) -> dict:
+    """Run the workload against one backend and return microseconds per operation."""
+    catalog = build_quests(args.quests)
+    rng = random.Random(2)
+    ids = [quest.id for quest in catalog]
+    service = ProgressionService(hunters, quests)
+
+    results = {}
+    results["add quest"] = per_op_us(lambda i: quests.add(catalog[i]), len(catalog))
+    results["get_by_id"] = per_op_us(lambda i: quests.get_by_id(rng.choice(ids)), args.lookups)
+    results["find stat+xp range"] = per_op_us(
+        lambda i: quests.find(stat=VALID_STATS[i % len(VALID_STATS)], min_xp=200, max_xp=250), 50)
+    results["complete quest"] = per_op_us(lambda i: service.complete_quest(rng.choice(ids)), args.completions)
+    results["add log"] = per_op_us(
+        lambda i: logs.add(QuestLog(rng.choice(ids), 100, 10, "Strength")), args.completions)
+    results["get_recent(20)"] = per_op_us(lambda i: logs.get_recent(20), args.lookups)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JSON files vs SQLite repositories")
+    parser.add_argument("--quests", type=int, default=5_000, help="Quests added to the catalog")
+    parser.add_argument("--lookups", type=int, default=2_000, help="Point lookups and recent-log reads")
+    parser.add_argument("--completions", type=int, default=500, help="Quest completions and log writes")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_results = run_workload(
+            HunterRepository(os.path.join(directory, "hunter.json")),
+            QuestRepository(os.path.join(directory, "quests.json")),
+            QuestLogRepository(os.path.join(directory, "quest_logs.jsonl")),
+            args
+        )
+
+        database = SQLiteDatabase(os.path.join(directory, "hunter.db"))
+        sqlite_results = run_workload(
+            HunterRepositorySQLite(database),
+            QuestRepositorySQLite(database),
+            QuestLogRepositorySQLite(database),
+            args
+        )
+        database.close()
+
+    print(f"Quests: {args.quests:,}   Lookups: {args.lookups:,}   Completions: {args.completions:,}")
+    print(f"{'operation':<22}{'json us/op':>14}{'sqlite us/op':>14}{'speedup':>10}")
+    for operation, json_us in json_results.items():
+        sqlite_us = sqlite_results[operation]
+        print(f"{operation:<22}{json_us:>14.1f}{sqlite_us:>14.1f}{json_us / sqlite_us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Backfill of the quest log rollups (quest_log_rollups).
+
+Rolls up every quest log that is not counted in the daily and weekly buckets
+yet: logs written before the rollup table existed and logs inserted around
+QuestLogRepositoryDB, such as a `migrate_data import`. Batches are claimed
+transactionally, so the job can be rerun or stopped at any point.
+
+Usage:
+    python -m database.backfill_rollups [--url sqlite:///data/migration.db] [--batch-size 1000] [--hunter-id ID]
+"""
+import argparse
+import time
+
+from sqlalchemy.orm import Session
+
+from database.config import db_config
+from database.migrate_data import create_target_engine
+from repositories.db.quest_log_repository_db import QuestLogRepositoryDB
+
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Roll up the quest logs not counted in the rollups yet")
+    parser.add_argument("--url", default=db_config.database_url,
+                        help="SQLAlchemy database URL (default: the DB_* PostgreSQL settings)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Quest logs per transaction")
+    parser.add_argument("--hunter-id", default=None, help="Only roll up this hunter's logs (default: all)")
+    args = parser.parse_args()
+
+    engine = create_target_engine(args.url, 1)
+    started = time.perf_counter()
+
+    with Session(engine) as session:
+        rolled_up = QuestLogRepositoryDB(session).backfill_rollups(args.batch_size, args.hunter_id)
+
+    seconds = time.perf_counter() - started
+    engine.dispose()
+    print(f"Rolled up {rolled_up:,} quest logs in {seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,617 @@
+"""
+Bulk data transfer between the repositories and the database models.
+
+import  Streams every hunter profile, the quest catalog and the quest log from the
+        configured repositories (HUNTER_STORAGE_BACKEND, QUEST_STORAGE_MODE, ...)
+        into the hunters/stats/quests/quest_logs tables. Records are read in
+        chunks, transformed into model rows and inserted with executemany, one
+        transaction per chunk, across a pool of worker threads. Finished chunks
+        are recorded in a checkpoint file, so an interrupted import resumes
+        where it stopped.
+export  Writes the tables back out as hunter.json, quests.json and
+        quest_logs.jsonl, in the format the JSON file repositories read.
+
+Both directions report rows/sec per table. Any SQLAlchemy URL works; a SQLite
+URL stands in for PostgreSQL locally (its tables are created on demand).
+
+Usage:
+    python -m database.migrate_data import --url sqlite:///data/migration.db [--chunk-size 1000] [--workers 4]
+    python -m database.migrate_data export --url sqlite:///data/migration.db --output-dir data/export
+"""
+import argparse
+import json
+import os
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+
+from sqlalchemy import create_engine, func, insert, select, tuple_
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+
+from database.base import Base
+from database.config import db_config
+from database.models import HunterModel, QuestLogModel, QuestModel, StatModel
+from entities.hunter import DEFAULT_HUNTER_ID, Hunter
+from entities.quest import Quest
+from entities.quest_difficulty import QuestDifficulty
+from entities.quest_log import QuestLog
+from repositories.codecs import JSON_CODEC
+from repositories.factory import (
+    create_quest_log_repository,
+    create_quest_repository,
+    get_hunter_store,
+)
+from repositories.file_lock import atomic_write
+from utils.xp_curve import DEFAULT_XP_CURVE
+
+
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_WORKERS = 4
+DEFAULT_CHECKPOINT = "data/migrate_data.checkpoint.json"
+
+# Namespace of the quest log row IDs. They are derived from the log position so
+# a chunk re-sent after a crash is recognized instead of inserted twice
+QUEST_LOG_NAMESPACE = uuid.UUID("6f7c3c52-2b0e-4a53-9f43-1d4c52a8e7a1")
+
+# Namespace of the hunter row IDs, derived from the repository hunter ID for the same reason
+HUNTER_NAMESPACE = uuid.UUID("0b6e2f4a-8c1d-4f3e-a5b7-2d9c4e6f8a10")
+
+
+class TransferReport:
+    """Row counts and timing of one table transfer."""
+
+    def __init__(self, table: str):
+        self.table = table
+        self.rows = 0
+        self.skipped = 0
+        self.resumed_chunks = 0
+        self.seconds = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self) -> str:
+        line = f"{self.table:<12}{self.rows:>10,} rows {self.seconds:>8.2f}s {self.rows_per_second:>12,.0f} rows/s"
+        if self.skipped:
+            line += f"  ({self.skipped:,} skipped)"
+        if self.resumed_chunks:
+            line += f"  ({self.resumed_chunks:,} chunks already done)"
+        return line
+
+
+class Checkpoint:
+    """
+    Progress of an import, saved to a JSON file after every committed chunk.
+
+    Chunks finish out of order across workers, so the set of finished chunk
+    numbers is kept per table. A checkpoint only applies to the same target
+    URL and chunk size it was written for.
+    """
+
+    def __init__(self, path: str | None, url: str, chunk_size: int):
+        """
+        Args:
+            path (str | None): Checkpoint file; None disables checkpointing
+            url (str): Target database URL
+            chunk_size (int): Records per chunk
+        Raises:
+            ValueError: If the existing checkpoint was written for another URL or chunk size
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self.data = {"url": url, "chunk_size": chunk_size, "hunter_ids": {},
+                     "started_at": datetime.now(timezone.utc).isoformat(), "done": {}}
+
+        if path and os.path.exists(path):
+            with open(path, 'r') as file:
+                saved = json.load(file)
+            if saved.get("url") != url or saved.get("chunk_size") != chunk_size:
+                raise ValueError(
+                    f"Checkpoint {path} was written for {saved.get('url')} with chunk size "
+                    f"{saved.get('chunk_size')}; pass --restart to discard it"
+                )
+            self.data = saved
+            # Checkpoints written when only the default hunter was imported
+            legacy_hunter_id = self.data.pop("hunter_id", None)
+            self.data.setdefault("hunter_ids", {})
+            if legacy_hunter_id is not None:
+                self.data["hunter_ids"].setdefault(DEFAULT_HUNTER_ID, legacy_hunter_id)
+
+        self._done = {table: set(chunks) for table, chunks in self.data["done"].items()}
+
+    @property
+    def started_at(self) -> datetime:
+        """Start of the first run, as the naive UTC time the timestamp columns hold."""
+        started_at = datetime.fromisoformat(self.data["started_at"])
+        # Older checkpoints stored a naive UTC time already
+        if started_at.tzinfo is not None:
+            started_at = started_at.astimezone(timezone.utc).replace(tzinfo=None)
+        return started_at
+
+    def is_done(self, table: str, chunk: int) -> bool:
+        return chunk in self._done.get(table, ())
+
+    def mark_done(self, table: str, chunk: int) -> None:
+        with self._lock:
+            self._done.setdefault(table, set()).add(chunk)
+            self.data["done"][table] = sorted(self._done[table])
+            self.save()
+
+    def set(self, key: str, value) -> None:
+        with self._lock:
+            self.data[key] = value
+            self.save()
+
+    def save(self) -> None:
+        if self.path:
+            atomic_write(self.path, json.dumps(self.data).encode())
+
+    def remove(self) -> None:
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def chunked(items: Iterable, size: int) -> Iterator[list]:
+    """Split an iterable into lists of at most `size` items without materializing it."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def create_target_engine(url: str, workers: int) -> Engine:
+    """
+    Create the engine for a transfer, sized for the worker pool.
+
+    SQLite databases get their tables created and a long busy timeout, since
+    concurrent workers take turns on its single write lock.
+
+    Args:
+        url (str): SQLAlchemy database URL
+        workers (int): Number of worker threads
+    Returns:
+        Engine: The engine
+    """
+    if url.startswith("sqlite"):
+        engine = create_engine(url, connect_args={"timeout": 60})
+        Base.metadata.create_all(bind=engine)
+        return engine
+
+    return create_engine(url, pool_size=workers, max_overflow=0, pool_pre_ping=True,
+                         echo=db_config.ECHO_SQL)
+
+
+# Row transforms
+
+def hunter_to_rows(hunter: Hunter, hunter_id: str) -> tuple[dict, list[dict]]:
+    """Convert a Hunter to a hunters row and its stats rows."""
+    hunter_row = {
+        "id": hunter_id,
+        "name": hunter.name,
+        "global_level": hunter.get_global_level(),
+        "global_exp": hunter.get_global_exp(),
+        "gold": hunter.gold,
+    }
+
+    stat_rows = []
+    for stat_name, stat in hunter.stats.items():
+        level = stat.get_level()
+        stat_rows.append({
+            "hunter_id": hunter_id,
+            "name": stat_name,
+            "level": level,
+            "current_exp": stat.total_xp - DEFAULT_XP_CURVE.threshold(level),
+            "total_exp": stat.total_xp,
+        })
+    return hunter_row, stat_rows
+
+
+def quest_to_row(quest: Quest, created_at: datetime) -> dict:
+    """Convert a Quest to a quests row. created_at carries the catalog order."""
+    return {
+        "id": quest.id,
+        "name": quest.name,
+        "stat_name": quest.stat,
+        "difficulty": quest.difficulty.name,
+        "exp_reward": quest.xp_reward,
+        "gold_reward": quest.gold_reward,
+        "description": quest.description,
+        "created_at": created_at,
+        "updated_at": created_at,
+    }
+
+
+def quest_log_to_row(quest_log: QuestLog, hunter_id: str, position: int) -> dict:
+    """Convert a QuestLog to a quest_logs row with an ID derived from its position in the log."""
+    return {
+        "id": str(uuid.uuid5(QUEST_LOG_NAMESPACE, f"{hunter_id}:{position}")),
+        "quest_id": quest_log.quest_id,
+        "hunter_id": hunter_id,
+        "completed_at": quest_log.completed_at,
+        "exp_gained": quest_log.xp_earned,
+        "gold_gained": quest_log.gold_earned,
+    }
+
+
+class BulkImporter:
+    """Loads repository data into the database models in parallel chunks."""
+
+    def __init__(self, engine: Engine, checkpoint: Checkpoint,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = DEFAULT_WORKERS):
+        """
+        Args:
+            engine (Engine): Target database
+            checkpoint (Checkpoint): Progress of this import
+            chunk_size (int): Records per insert transaction
+            workers (int): Threads inserting chunks concurrently
+        """
+        self.engine = engine
+        self.checkpoint = checkpoint
+        self.chunk_size = chunk_size
+        self.workers = workers
+
+    def import_hunters(self, hunters: Iterable[tuple[str, Hunter]]) -> tuple[dict[str, str], TransferReport]:
+        """
+        Insert every hunter and its stats, skipping those an earlier run already inserted.
+
+        Row IDs are derived from the repository IDs, so a hunter inserted by a
+        run that stopped before checkpointing it is found and not inserted twice.
+
+        Args:
+            hunters (Iterable[tuple[str, Hunter]]): (hunter ID, Hunter) pairs, e.g. a hunter store's iter_hunters()
+        Returns:
+            tuple[dict[str, str], TransferReport]: The row ID of each hunter by
+            its repository ID, and the transfer report
+        """
+        report = TransferReport("hunters")
+        started = time.perf_counter()
+        hunter_ids = dict(self.checkpoint.data["hunter_ids"])
+
+        for repository_id, hunter in hunters:
+            if repository_id in hunter_ids:
+                report.resumed_chunks += 1
+                continue
+
+            row_id = str(uuid.uuid5(HUNTER_NAMESPACE, repository_id))
+            hunter_row, stat_rows = hunter_to_rows(hunter, row_id)
+            with self.engine.begin() as connection:
+                stored = connection.execute(
+                    select(HunterModel.id).where(HunterModel.id == row_id)
+                ).first()
+                if stored is None:
+                    connection.execute(insert(HunterModel), [hunter_row])
+                    connection.execute(insert(StatModel), stat_rows)
+            hunter_ids[repository_id] = row_id
+            self.checkpoint.set("hunter_ids", dict(hunter_ids))
+            if stored is None:
+                report.rows += 1 + len(stat_rows)
+            else:
+                report.resumed_chunks += 1
+
+        report.seconds = time.perf_counter() - started
+        return hunter_ids, report
+
+    def import_quests(self, quests: Iterable[Quest], quest_ids: set[str]) -> TransferReport:
+        """
+        Insert the quest catalog.
+
+        Args:
+            quests (Iterable[Quest]): Quests in catalog order
+            quest_ids (set[str]): Filled with every quest ID seen, for checking the logs
+        Returns:
+            TransferReport: The transfer report
+        """
+        base_time = self.checkpoint.started_at
+
+        def transform(chunk: list[Quest], offset: int) -> list[dict]:
+            return [quest_to_row(quest, base_time + timedelta(microseconds=offset + i))
+                    for i, quest in enumerate(chunk)]
+
+        def remember(quest: Quest) -> bool:
+            quest_ids.add(quest.id)
+            return True
+
+        return self._transfer("quests", QuestModel, quests, remember, transform)
+
+    def import_quest_logs(self, quest_logs: Iterable[QuestLog], hunter_ids: dict[str, str],
+                          quest_ids: set[str]) -> TransferReport:
+        """
+        Insert the quest log, each entry under its hunter's row. Entries whose
+        quest is no longer in the catalog, whose hunter was not imported, or
+        that earned no XP, cannot satisfy the table constraints and are skipped.
+
+        Args:
+            quest_logs (Iterable[QuestLog]): The quest log, oldest first
+            hunter_ids (dict[str, str]): Row ID of each imported hunter by its repository ID
+            quest_ids (set[str]): IDs of the imported quests
+        Returns:
+            TransferReport: The transfer report
+        """
+        def keep(quest_log: QuestLog) -> bool:
+            return (quest_log.quest_id in quest_ids and quest_log.hunter_id in hunter_ids
+                    and quest_log.xp_earned > 0)
+
+        def transform(chunk: list[QuestLog], offset: int) -> list[dict]:
+            return [quest_log_to_row(quest_log, hunter_ids[quest_log.hunter_id], offset + i)
+                    for i, quest_log in enumerate(chunk)]
+
+        return self._transfer("quest_logs", QuestLogModel, quest_logs, keep, transform)
+
+    def _transfer(self, table: str, model, records: Iterable, keep: Callable[[object], bool],
+                  transform: Callable[[list, int], list[dict]]) -> TransferReport:
+        """
+        Chunk the records, skip finished chunks and insert the rest on the worker pool.
+
+        At most twice as many chunks as workers are in flight, so memory stays
+        bounded by the chunk size whatever the source size.
+        """
+        report = TransferReport(table)
+        started = time.perf_counter()
+        statement = insert(model)
+
+        def insert_chunk(number: int, rows: list[dict]) -> int | None:
+            """Insert one chunk; returns None if an earlier run committed it without checkpointing."""
+            try:
+                with self.engine.begin() as connection:
+                    connection.execute(statement, rows)
+            except IntegrityError:
+                if not self._already_inserted(model, rows):
+                    raise
+                self.checkpoint.mark_done(table, number)
+                return None
+            self.checkpoint.mark_done(table, number)
+            return len(rows)
+
+        def collect(futures) -> None:
+            for future in futures:
+                inserted = future.result()
+                if inserted is None:
+                    report.resumed_chunks += 1
+                else:
+                    report.rows += inserted
+
+        kept = (record for record in records if keep(record) or self._skip(report))
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f"import-{table}") as pool:
+            pending = set()
+            offset = 0
+            for number, chunk in enumerate(chunked(kept, self.chunk_size)):
+                if self.checkpoint.is_done(table, number):
+                    report.resumed_chunks += 1
+                else:
+                    pending.add(pool.submit(insert_chunk, number, transform(chunk, offset)))
+                offset += len(chunk)
+
+                if len(pending) >= 2 * self.workers:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(finished)
+
+            collect(pending)
+
+        report.seconds = time.perf_counter() - started
+        return report
+
+    def _already_inserted(self, model, rows: list[dict]) -> bool:
+        """
+        Whether every row of a chunk is already stored.
+
+        Chunks commit atomically and row IDs are deterministic, so this is the
+        case when a run stopped between committing a chunk and checkpointing it.
+        """
+        ids = [row["id"] for row in rows]
+        with self.engine.connect() as connection:
+            stored = connection.execute(
+                select(func.count()).select_from(model).where(model.id.in_(ids))
+            ).scalar_one()
+        return stored == len(ids)
+
+    @staticmethod
+    def _skip(report: TransferReport) -> bool:
+        report.skipped += 1
+        return False
+
+
+class BulkExporter:
+    """Writes the database models back out as the JSON files of the file repositories."""
+
+    def __init__(self, engine: Engine, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Args:
+            engine (Engine): Source database
+            chunk_size (int): Rows fetched per query
+        """
+        self.engine = engine
+        self.chunk_size = chunk_size
+
+    def export_hunter(self, path: str, hunter_id: str | None = None) -> TransferReport:
+        """Write hunter.json from a hunter (the oldest one by default) and its stats."""
+        report = TransferReport("hunters")
+        started = time.perf_counter()
+
+        with self.engine.connect() as connection:
+            query = select(HunterModel.id, HunterModel.name, HunterModel.gold)
+            if hunter_id is not None:
+                query = query.where(HunterModel.id == hunter_id)
+            hunter = connection.execute(query.order_by(HunterModel.created_at).limit(1)).first()
+            if hunter is None:
+                raise ValueError("No hunter found in the database")
+
+            stats = connection.execute(
+                select(StatModel.name, StatModel.total_exp).where(StatModel.hunter_id == hunter.id)
+            ).all()
+
+        data = {
+            "name": hunter.name,
+            "gold": hunter.gold,
+            "stats": {name: {"name": name, "total_xp": int(total_exp)} for name, total_exp in stats}
+        }
+        atomic_write(path, JSON_CODEC.dumps(data))
+
+        report.rows = 1 + len(stats)
+        report.seconds = time.perf_counter() - started
+        return report
+
+    def export_quests(self, path: str) -> TransferReport:
+        """Stream the catalog into quests.json, in catalog (created_at) order."""
+        report = TransferReport("quests")
+        started = time.perf_counter()
+        columns = (QuestModel.id, QuestModel.name, QuestModel.stat_name, QuestModel.difficulty,
+                   QuestModel.exp_reward, QuestModel.gold_reward, QuestModel.description)
+
+        with replace_on_success(path) as file:
+            file.write(b'{"_meta":' + JSON_CODEC.dumps({"version": 1}))
+            for row in self._paged(QuestModel, columns):
+                quest_id, name, stat, difficulty, exp_reward, gold_reward, description = row
+                quest = {
+                    "id": quest_id,
+                    "name": name,
+                    "stat": stat,
+                    "difficulty": QuestDifficulty[difficulty].value,
+                    "xp_reward": int(exp_reward),
+                    "gold_reward": gold_reward,
+                    "description": description or ""
+                }
+                file.write(b"," + JSON_CODEC.dumps(quest_id) + b":" + JSON_CODEC.dumps(quest))
+                report.rows += 1
+            file.write(b"}")
+
+        report.seconds = time.perf_counter() - started
+        return report
+
+    def export_quest_logs(self, path: str, hunter_id: str | None = None) -> TransferReport:
+        """Stream the quest log into quest_logs.jsonl, oldest first, with each quest's stat."""
+        report = TransferReport("quest_logs")
+        started = time.perf_counter()
+        columns = (QuestLogModel.quest_id, QuestLogModel.completed_at, QuestLogModel.exp_gained,
+                   QuestLogModel.gold_gained, QuestModel.stat_name)
+
+        with replace_on_success(path) as file:
+            for quest_id, completed_at, exp_gained, gold_gained, stat in self._paged(
+                    QuestLogModel, columns, QuestLogModel.completed_at, hunter_id):
+                log = {
+                    "quest_id": quest_id,
+                    "completed_at": completed_at.isoformat(),
+                    "xp_earned": int(exp_gained),
+                    "gold_earned": gold_gained,
+                    "stat": stat
+                }
+                file.write(JSON_CODEC.dumps(log) + b"\n")
+                report.rows += 1
+
+        report.seconds = time.perf_counter() - started
+        return report
+
+    def _paged(self, model, columns: tuple, order_column=None, hunter_id: str | None = None) -> Iterator[tuple]:
+        """
+        Yield rows of `columns` ordered by (order_column, id), one keyset page at a time.
+
+        Quest log queries join quests for the stat and are limited to hunter_id when given.
+        """
+        order_column = order_column if order_column is not None else model.created_at
+        last_key = None
+
+        while True:
+            query = select(order_column, model.id, *columns)
+            if model is QuestLogModel:
+                query = query.outerjoin(QuestModel, QuestModel.id == QuestLogModel.quest_id)
+                if hunter_id is not None:
+                    query = query.where(QuestLogModel.hunter_id == hunter_id)
+            if last_key is not None:
+                query = query.where(tuple_(order_column, model.id) > tuple_(*last_key))
+            query = query.order_by(order_column, model.id).limit(self.chunk_size)
+
+            with self.engine.connect() as connection:
+                rows = connection.execute(query).all()
+
+            for row in rows:
+                yield tuple(row[2:])
+            if len(rows) < self.chunk_size:
+                return
+            last_key = (rows[-1][0], rows[-1][1])
+
+
+@contextmanager
+def replace_on_success(path: str) -> Iterator:
+    """Open `path`.tmp for writing and move it into place only if the block completes."""
+    tmp_path = path + ".tmp"
+    file = open(tmp_path, 'wb')
+    try:
+        yield file
+    except BaseException:
+        file.close()
+        os.remove(tmp_path)
+        raise
+    file.close()
+    os.replace(tmp_path, path)
+
+
+def run_import(args: argparse.Namespace) -> list[TransferReport]:
+    """Import the configured repositories into the target database."""
+    if args.restart and args.checkpoint and os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+
+    checkpoint = Checkpoint(args.checkpoint, args.url, args.chunk_size)
+    engine = create_target_engine(args.url, args.workers)
+    importer = BulkImporter(engine, checkpoint, args.chunk_size, args.workers)
+
+    hunter_ids, hunter_report = importer.import_hunters(get_hunter_store().iter_hunters())
+    quest_ids: set[str] = set()
+    reports = [
+        hunter_report,
+        importer.import_quests(create_quest_repository().iter_all(), quest_ids),
+        importer.import_quest_logs(create_quest_log_repository().iter_all(), hunter_ids, quest_ids),
+    ]
+
+    checkpoint.remove()
+    engine.dispose()
+    return reports
+
+
+def run_export(args: argparse.Namespace) -> list[TransferReport]:
+    """Export the database tables to JSON files in the output directory."""
+    os.makedirs(args.output_dir, exist_ok=True)
+    engine = create_target_engine(args.url, 1)
+    exporter = BulkExporter(engine, args.chunk_size)
+
+    reports = [
+        exporter.export_hunter(os.path.join(args.output_dir, "hunter.json"), args.hunter_id),
+        exporter.export_quests(os.path.join(args.output_dir, "quests.json")),
+        exporter.export_quest_logs(os.path.join(args.output_dir, "quest_logs.jsonl"), args.hunter_id),
+    ]
+
+    engine.dispose()
+    return reports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk transfer between the JSON data and the database")
+    parser.add_argument("direction", choices=("import", "export"))
+    parser.add_argument("--url", default=db_config.database_url,
+                        help="SQLAlchemy database URL (default: the DB_* PostgreSQL settings)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Records per chunk")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Import worker threads")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT,
+                        help="Import checkpoint file; an empty value disables resuming")
+    parser.add_argument("--restart", action="store_true", help="Discard the checkpoint and import from scratch")
+    parser.add_argument("--output-dir", default="data/export", help="Export destination directory")
+    parser.add_argument("--hunter-id", default=None, help="Hunter to export (default: the oldest)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    reports = run_import(args) if args.direction == "import" else run_export(args)
+
+    for report in reports:
+        print(report)
+    total_rows = sum(report.rows for report in reports)
+    total_seconds = time.perf_counter() - started
+    print(f"{'total':<12}{total_rows:>10,} rows {total_seconds:>8.2f}s "
+          f"{total_rows / total_seconds if total_seconds else 0:>12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
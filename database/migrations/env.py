@@ -13,7 +13,7 @@ from database.config import db_config
 from database.base import Base
 
 # Import all the models so Alembic can detect them
-from database.models import HunterModel, StatModel, QuestModel, QuestLogModel
+from database.models import HunterModel, StatModel, QuestModel, QuestLogModel, QuestLogRollupModel
 
 # this is the Alembic Config object
 config = context.config
@@ -0,0 +1,96 @@
+"""Initial schema
+
+Revision ID: 3f9c2a7d1b04
+Revises:
+Create Date: 2025-11-03 10:12:41.518302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2a7d1b04'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('hunters',
+    sa.Column('name', sa.String(length=100), nullable=False, comment="Player's name"),
+    sa.Column('global_level', sa.Integer(), nullable=False, comment='Overall level calculated from total XP'),
+    sa.Column('global_exp', sa.Integer(), nullable=False, comment='Total experience across all stats'),
+    sa.Column('gold', sa.Integer(), nullable=False, comment='Current gold amount'),
+    sa.Column('id', sa.String(length=36), nullable=False, comment='Unique identifier (UUID v4)'),
+    sa.Column('created_at', sa.DateTime(), nullable=False, comment='Timestamp when record was created'),
+    sa.Column('updated_at', sa.DateTime(), nullable=False, comment='Timestamp when record was last updated'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_hunters_name'), 'hunters', ['name'], unique=False)
+    op.create_table('quests',
+    sa.Column('name', sa.String(length=200), nullable=False),
+    sa.Column('stat_name', sa.String(length=50), nullable=False),
+    sa.Column('difficulty', sa.String(length=20), nullable=False),
+    sa.Column('exp_reward', sa.Float(), nullable=False),
+    sa.Column('gold_reward', sa.Integer(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('id', sa.String(length=36), nullable=False, comment='Unique identifier (UUID v4)'),
+    sa.Column('created_at', sa.DateTime(), nullable=False, comment='Timestamp when record was created'),
+    sa.Column('updated_at', sa.DateTime(), nullable=False, comment='Timestamp when record was last updated'),
+    sa.CheckConstraint('exp_reward > 0', name='chk_exp_positive'),
+    sa.CheckConstraint('gold_reward >= 0', name='chk_gold_non_negative'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_quests_difficulty'), 'quests', ['difficulty'], unique=False)
+    op.create_index(op.f('ix_quests_stat_name'), 'quests', ['stat_name'], unique=False)
+    op.create_table('quest_logs',
+    sa.Column('quest_id', sa.String(length=36), nullable=False),
+    sa.Column('hunter_id', sa.String(length=36), nullable=False),
+    sa.Column('completed_at', sa.DateTime(), nullable=False),
+    sa.Column('exp_gained', sa.Float(), nullable=False),
+    sa.Column('gold_gained', sa.Integer(), nullable=False),
+    sa.Column('id', sa.String(length=36), nullable=False, comment='Unique identifier (UUID v4)'),
+    sa.Column('created_at', sa.DateTime(), nullable=False, comment='Timestamp when record was created'),
+    sa.Column('updated_at', sa.DateTime(), nullable=False, comment='Timestamp when record was last updated'),
+    sa.CheckConstraint('exp_gained > 0', name='chk_exp_gained_positive'),
+    sa.CheckConstraint('gold_gained >= 0', name='chk_gold_gained_non_negative'),
+    sa.ForeignKeyConstraint(['hunter_id'], ['hunters.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['quest_id'], ['quests.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_quest_logs_completed_at'), 'quest_logs', ['completed_at'], unique=False)
+    op.create_index(op.f('ix_quest_logs_hunter_id'), 'quest_logs', ['hunter_id'], unique=False)
+    op.create_index(op.f('ix_quest_logs_quest_id'), 'quest_logs', ['quest_id'], unique=False)
+    op.create_table('stats',
+    sa.Column('hunter_id', sa.String(length=36), nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('level', sa.Integer(), nullable=False),
+    sa.Column('current_exp', sa.Float(), nullable=False),
+    sa.Column('total_exp', sa.Float(), nullable=False),
+    sa.Column('id', sa.String(length=36), nullable=False, comment='Unique identifier (UUID v4)'),
+    sa.Column('created_at', sa.DateTime(), nullable=False, comment='Timestamp when record was created'),
+    sa.Column('updated_at', sa.DateTime(), nullable=False, comment='Timestamp when record was last updated'),
+    sa.ForeignKeyConstraint(['hunter_id'], ['hunters.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('hunter_id', 'name', name='uq_hunter_stat')
+    )
+    op.create_index(op.f('ix_stats_hunter_id'), 'stats', ['hunter_id'], unique=False)
+    op.create_index(op.f('ix_stats_name'), 'stats', ['name'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_stats_name'), table_name='stats')
+    op.drop_index(op.f('ix_stats_hunter_id'), table_name='stats')
+    op.drop_table('stats')
+    op.drop_index(op.f('ix_quest_logs_quest_id'), table_name='quest_logs')
+    op.drop_index(op.f('ix_quest_logs_hunter_id'), table_name='quest_logs')
+    op.drop_index(op.f('ix_quest_logs_completed_at'), table_name='quest_logs')
+    op.drop_table('quest_logs')
+    op.drop_index(op.f('ix_quests_stat_name'), table_name='quests')
+    op.drop_index(op.f('ix_quests_difficulty'), table_name='quests')
+    op.drop_table('quests')
+    op.drop_index(op.f('ix_hunters_name'), table_name='hunters')
+    op.drop_table('hunters')
@@ -0,0 +1,122 @@
+"""Quest log rollups
+
+Adds the daily and weekly totals of the quest log (quest_log_rollups) and the
+quest_logs.rolled_up flag, then rolls up the quest logs already stored so the
+totals read from the rollups are complete right after the upgrade.
+
+Revision ID: 8d41e6b2c5a9
+Revises: 3f9c2a7d1b04
+Create Date: 2026-10-18 14:20:07.331954
+
+"""
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Sequence, Union
+from uuid import uuid4
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41e6b2c5a9'
+down_revision: Union[str, None] = '3f9c2a7d1b04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    rollups = op.create_table('quest_log_rollups',
+    sa.Column('hunter_id', sa.String(length=36), nullable=False),
+    sa.Column('stat_name', sa.String(length=50), nullable=False),
+    sa.Column('period', sa.String(length=10), nullable=False),
+    sa.Column('bucket_start', sa.Date(), nullable=False),
+    sa.Column('completions', sa.Integer(), nullable=False),
+    sa.Column('exp_gained', sa.Float(), nullable=False),
+    sa.Column('gold_gained', sa.Integer(), nullable=False),
+    sa.Column('id', sa.String(length=36), nullable=False, comment='Unique identifier (UUID v4)'),
+    sa.Column('created_at', sa.DateTime(), nullable=False, comment='Timestamp when record was created'),
+    sa.Column('updated_at', sa.DateTime(), nullable=False, comment='Timestamp when record was last updated'),
+    sa.CheckConstraint("period IN ('day', 'week')", name='chk_rollup_period'),
+    sa.ForeignKeyConstraint(['hunter_id'], ['hunters.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('hunter_id', 'stat_name', 'period', 'bucket_start', name='uq_quest_log_rollup_bucket')
+    )
+    op.create_index(op.f('ix_quest_log_rollups_hunter_id'), 'quest_log_rollups', ['hunter_id'], unique=False)
+    op.add_column('quest_logs', sa.Column('rolled_up', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.create_index('ix_quest_logs_hunter_rolled_up', 'quest_logs', ['hunter_id', 'rolled_up'], unique=False)
+
+    backfill_rollups(rollups)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_quest_logs_hunter_rolled_up', table_name='quest_logs')
+    with op.batch_alter_table('quest_logs') as batch_op:
+        batch_op.drop_column('rolled_up')
+    op.drop_index(op.f('ix_quest_log_rollups_hunter_id'), table_name='quest_log_rollups')
+    op.drop_table('quest_log_rollups')
+
+
+def backfill_rollups(rollups: sa.Table) -> None:
+    """
+    Roll up every quest log stored before this revision.
+
+    The logs are flagged first and only the flagged ones are summed, so a log
+    inserted by an older worker while the migration runs keeps rolled_up false
+    and is picked up later by `python -m database.backfill_rollups`.
+    """
+    quest_logs = sa.table('quest_logs',
+        sa.column('quest_id', sa.String),
+        sa.column('hunter_id', sa.String),
+        sa.column('completed_at', sa.DateTime),
+        sa.column('exp_gained', sa.Float),
+        sa.column('gold_gained', sa.Integer),
+        sa.column('rolled_up', sa.Boolean))
+    quests = sa.table('quests', sa.column('id', sa.String), sa.column('stat_name', sa.String))
+
+    connection = op.get_bind()
+    connection.execute(quest_logs.update().where(quest_logs.c.rolled_up == sa.false()).values(rolled_up=True))
+
+    day = sa.func.date(quest_logs.c.completed_at)
+    days = connection.execute(
+        sa.select(
+            quest_logs.c.hunter_id,
+            quests.c.stat_name,
+            day,
+            sa.func.count(),
+            sa.func.sum(quest_logs.c.exp_gained),
+            sa.func.sum(quest_logs.c.gold_gained)
+        ).select_from(quest_logs.join(quests, quests.c.id == quest_logs.c.quest_id))
+        .where(quest_logs.c.rolled_up == sa.true())
+        .group_by(quest_logs.c.hunter_id, quests.c.stat_name, day)
+    )
+
+    # Weeks start on Monday, like the buckets written by QuestLogRepositoryDB
+    buckets = defaultdict(lambda: [0, 0.0, 0])
+    for hunter_id, stat_name, first_day, completions, exp, gold in days:
+        if isinstance(first_day, str):
+            first_day = date.fromisoformat(first_day)
+        for period, bucket_start in (("day", first_day), ("week", first_day - timedelta(days=first_day.weekday()))):
+            bucket = buckets[(hunter_id, stat_name, period, bucket_start)]
+            bucket[0] += completions
+            bucket[1] += exp
+            bucket[2] += gold
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            "id": str(uuid4()),
+            "hunter_id": hunter_id,
+            "stat_name": stat_name,
+            "period": period,
+            "bucket_start": bucket_start,
+            "completions": completions,
+            "exp_gained": float(exp),
+            "gold_gained": int(gold),
+            "created_at": now,
+            "updated_at": now
+        }
+        for (hunter_id, stat_name, period, bucket_start), (completions, exp, gold) in buckets.items()
+    ]
+    if rows:
+        op.bulk_insert(rollups, rows)
@@ -6,10 +6,12 @@ from database.models.hunter_model import HunterModel
 from database.models.stat_model import StatModel
 from database.models.quest_model import QuestModel
 from database.models.quest_log_model import QuestLogModel
+from database.models.quest_log_rollup_model import QuestLogRollupModel
 
 __all__ = [
     "HunterModel",
     "StatModel",
     "QuestModel",
     "QuestLogModel",
+    "QuestLogRollupModel",
 ]
\ No newline at end of file
@@ -1,7 +1,7 @@
 """
 QuestLog model - Represents completed quest history.
 """
-from sqlalchemy import Column, String, Float, Integer, ForeignKey, CheckConstraint, DateTime
+from sqlalchemy import Column, String, Float, Integer, Boolean, ForeignKey, CheckConstraint, DateTime, Index, false
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -18,6 +18,7 @@ class QuestLogModel(BaseModel):
         completed_at: Timestamp of completion
         exp_gained: Experience gained from this completion
         gold_gained: Gold gained from this completion
+        rolled_up: Whether the completion is counted in quest_log_rollups
         quest: Relationship to QuestModel
         hunter: Relationship to HunterModel
     """
@@ -47,6 +48,10 @@ class QuestLogModel(BaseModel):
     exp_gained = Column(Float, nullable=False)
     gold_gained = Column(Integer, nullable=False)
     
+    # Rows inserted without going through the repository (e.g. bulk imports)
+    # stay unrolled until the rollup backfill picks them up
+    rolled_up = Column(Boolean, nullable=False, default=False, server_default=false())
+    
     # Relationships
     quest = relationship("QuestModel", back_populates="quest_logs")
     hunter = relationship("HunterModel", back_populates="quest_logs")
@@ -55,6 +60,7 @@ class QuestLogModel(BaseModel):
     __table_args__ = (
         CheckConstraint('exp_gained > 0', name='chk_exp_gained_positive'),
         CheckConstraint('gold_gained >= 0', name='chk_gold_gained_non_negative'),
+        Index('ix_quest_logs_hunter_rolled_up', 'hunter_id', 'rolled_up'),
     )
     
     def __repr__(self):
@@ -0,0 +1,55 @@
+"""
+QuestLogRollup model - Daily and weekly totals of the quest log.
+"""
+from sqlalchemy import Column, String, Float, Integer, Date, ForeignKey, CheckConstraint, UniqueConstraint
+
+from database.base import BaseModel
+
+
+# Bucket sizes kept for every hunter and stat
+ROLLUP_PERIODS = ("day", "week")
+
+
+class QuestLogRollupModel(BaseModel):
+    """
+    QuestLogRollup entity holding the totals of the quest logs of one hunter
+    and stat in one day or week.
+    
+    Rows are maintained as completions are logged and by the rollup backfill,
+    which also marks the quest logs it rolls up (QuestLogModel.rolled_up).
+    
+    Attributes:
+        hunter_id: Foreign key to hunters table
+        stat_name: Stat of the completed quests
+        period: Bucket size, "day" or "week"
+        bucket_start: First day of the bucket (weeks start on Monday)
+        completions: Quests completed in the bucket
+        exp_gained: Experience gained in the bucket
+        gold_gained: Gold gained in the bucket
+    """
+    __tablename__ = "quest_log_rollups"
+    
+    hunter_id = Column(
+        String(36),
+        ForeignKey("hunters.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    
+    stat_name = Column(String(50), nullable=False)
+    period = Column(String(10), nullable=False)
+    bucket_start = Column(Date, nullable=False)
+    
+    completions = Column(Integer, nullable=False, default=0)
+    exp_gained = Column(Float, nullable=False, default=0.0)
+    gold_gained = Column(Integer, nullable=False, default=0)
+    
+    # Constraints
+    __table_args__ = (
+        UniqueConstraint('hunter_id', 'stat_name', 'period', 'bucket_start', name='uq_quest_log_rollup_bucket'),
+        CheckConstraint("period IN ('day', 'week')", name='chk_rollup_period'),
+    )
+    
+    def __repr__(self):
+        return (f"<QuestLogRollup(hunter_id={self.hunter_id}, stat={self.stat_name}, period={self.period}, "
+                f"bucket_start={self.bucket_start}, completions={self.completions})>")
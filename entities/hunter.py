@@ -4,12 +4,64 @@ Hunter module
 Defines charactheristics for the hunters, players or users.
 """
 
+import re
+from array import array
+from collections.abc import Iterator, Mapping
+
+from entities.progression_result import RewardResult
 from entities.stats import Stat
-from utils.level_constants import XP_THRESHOLDS
-from utils.valid_stats import VALID_STATS
+from utils import level_resolver
+from utils.xp_curve import DEFAULT_XP_CURVE, XPCurve
+from utils.valid_stats import STAT_INDEX, VALID_STATS
+
+# Hunter used when a request or repository does not name one
+DEFAULT_HUNTER_ID = "default"
+
+# Hunter ids double as file names in the multi-hunter store
+HUNTER_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+class HunterStats(Mapping):
+    """Read-only mapping view of a hunter's stats keyed by stat name.
+
+    Stat objects are created on access as views over the hunter's XP array,
+    so writing `stats[name].total_xp` updates the hunter directly.
+    """
+
+    __slots__ = ("_hunter",)
+
+    def __init__(self, hunter: "Hunter") -> None:
+        self._hunter = hunter
+
+    def __getitem__(self, name: str) -> Stat:
+        return Stat._view(self._hunter, STAT_INDEX[name], name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in STAT_INDEX
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(VALID_STATS)
+
+    def __len__(self) -> int:
+        return len(VALID_STATS)
 
 class Hunter:
-    """Represents an individual player called Hunter"""
+    """Represents an individual player called Hunter
+
+    Stat XP is stored in a fixed-length integer array indexed by the stat
+    ordinal from STAT_INDEX; `stats` exposes it as a mapping of Stat views.
+
+    Global XP, global level and the XP boundary of the next global level are
+    kept as running totals: XP added through apply_rewards/Stat.apply_xp
+    updates them in O(1), while assigning a stat's total_xp directly
+    invalidates them until the next read. The totals are resolved on the XP
+    curve last passed to apply_rewards (DEFAULT_XP_CURVE until then).
+
+    `version` is the storage version the hunter was loaded at; repositories
+    use it to detect concurrent updates when saving.
+    """
+
+    __slots__ = ("name", "gold", "version", "_stat_xp", "_curve", "_global_xp", "_global_level", "_next_level_xp")
+
     def __init__(self, name: str, gold: int = 0) -> None:
         """ Initialize a player with name and gold in zero. 
 
@@ -20,21 +72,37 @@ class Hunter:
 
         self.name = name
         self.gold = gold
+        self.version = 0
         
-        self.stats = {}
-        for stat_name in VALID_STATS:
-            self.stats[stat_name] = Stat(stat_name,  0)
+        self._stat_xp = array('q', [0]) * len(VALID_STATS)
+        self._curve = DEFAULT_XP_CURVE
+        self._global_xp = 0
+        self._global_level = 1
+        self._next_level_xp = DEFAULT_XP_CURVE.threshold(2)
+
+    @property
+    def stats(self) -> HunterStats:
+        """Stats of the hunter keyed by name."""
+        return HunterStats(self)
     
+    def copy(self) -> "Hunter":
+        """Independent copy of the hunter, including its storage version."""
+        clone = Hunter.__new__(Hunter)
+        clone.name = self.name
+        clone.gold = self.gold
+        clone.version = self.version
+        clone._stat_xp = array('q', self._stat_xp)
+        clone._curve = self._curve
+        clone._global_xp = self._global_xp
+        clone._global_level = self._global_level
+        clone._next_level_xp = self._next_level_xp
+        return clone
+
     def get_global_level(self) -> int:
         """Calculate the global level of the player based on the sum of the XP accumulated in each stat."""
-        total_xp: int = self.get_global_exp()
-
-        for i in range(len(XP_THRESHOLDS)):
-            if total_xp >= XP_THRESHOLDS[i]:
-                level: int = i + 1
-            else:
-                break
-        return level
+        if self._global_xp is None:
+            self._refresh_totals()
+        return self._global_level
 
     def get_global_exp(self) -> int:
         """Calculate the global level of the player based on the sum of the XP accumulated in each stat.
@@ -43,11 +111,15 @@ class Hunter:
             The sum of all the XP for each class
         """
 
-        total_xp: int = 0
+        if self._global_xp is None:
+            self._refresh_totals()
+        return self._global_xp
 
-        for stat in self.stats.values():
-            total_xp += stat.total_xp
-        return total_xp
+    def get_global_xp_for_next_level(self) -> int:
+        """Calculate the XP needed to reach the next global level."""
+        if self._global_xp is None:
+            self._refresh_totals()
+        return self._next_level_xp - self._global_xp
     
     def add_gold(self, new_gold: int) -> str:
         """ Add gold to the player gold stat
@@ -66,6 +138,78 @@ class Hunter:
 
         return f'Oro ganado: {new_gold}\nOro Total: {self.gold}'
     
+    def apply_rewards(self, xp_grants: dict[str, int] | list[tuple[str, int]], gold: int = 0,
+                      curve: XPCurve = DEFAULT_XP_CURVE) -> RewardResult:
+        """ Apply one or more XP grants and a gold reward in a single pass
+
+        Grants to the same stat are merged so each stat is leveled once.
+
+        Args:
+            xp_grants: XP per stat name, as a dict or a list of (stat_name, xp) pairs
+            gold: Gold received (ignored if zero)
+            curve: XP curve used to resolve levels
+
+        Returns:
+            RewardResult with the progression of every stat that received XP
+
+        Raises:
+            ValueError: If a stat does not exist, or an XP or gold amount is invalid
+        """
+        pairs = xp_grants.items() if isinstance(xp_grants, dict) else xp_grants
+
+        merged: dict[str, int] = {}
+        for stat_name, xp in pairs:
+            if stat_name not in self.stats:
+                raise ValueError(f'Unknown stat: {stat_name}')
+            if xp <= 0:
+                raise ValueError('Cannot add negative or zero XP')
+            merged[stat_name] = merged.get(stat_name, 0) + xp
+
+        if gold < 0:
+            raise ValueError('Cannot add negative gold')
+
+        if curve is not self._curve:
+            # Global totals resolved on the previous curve are stale
+            self._curve = curve
+            self._global_xp = None
+
+        progress = tuple(
+            self.stats[stat_name].apply_xp(xp, curve) for stat_name, xp in merged.items()
+        )
+        self.gold += gold
+
+        return RewardResult(stats=progress, gold_gained=gold, total_gold=self.gold)
+
+    def _refresh_totals(self) -> None:
+        """Recompute the running global totals from the stat XP array."""
+        total_xp = sum(self._stat_xp)
+        level = level_resolver.get_level(total_xp, self._curve)
+
+        self._global_xp = total_xp
+        self._global_level = level
+        self._next_level_xp = self._curve.threshold(level + 1)
+
+    def _add_stat_xp(self, index: int, exp: int) -> int:
+        """Add XP to the stat at `index`, keeping the global totals current.
+
+        Returns:
+            The new total XP of the stat
+        """
+        self._stat_xp[index] += exp
+
+        if self._global_xp is not None:
+            self._global_xp += exp
+            if self._global_xp >= self._next_level_xp:
+                self._global_level = level_resolver.get_level(self._global_xp, self._curve)
+                self._next_level_xp = self._curve.threshold(self._global_level + 1)
+
+        return self._stat_xp[index]
+
+    def _set_stat_xp(self, index: int, value: int) -> None:
+        """Overwrite the XP of the stat at `index` and invalidate the global totals."""
+        self._stat_xp[index] = value
+        self._global_xp = None
+
     def get_stat(self, name: str) -> Stat | None: 
         """ Get an specific stat by name
 
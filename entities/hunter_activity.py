@@ -0,0 +1,125 @@
+"""HunterActivity module for the Hunter System.
+
+Daily rollups of a hunter's completions and the streaks they form.
+"""
+
+from datetime import date, timedelta
+
+from utils.valid_stats import STAT_INDEX, VALID_STATS
+
+class DailyActivity:
+    """Completions, XP per stat and gold of one hunter on one day."""
+
+    __slots__ = ("completions", "xp_by_stat", "gold")
+
+    def __init__(self, completions: int = 0, xp_by_stat: list[int] | None = None, gold: int = 0) -> None:
+        """Initialize a daily bucket.
+
+        Args:
+            completions: Quests completed that day
+            xp_by_stat: XP earned per stat, indexed like VALID_STATS
+            gold: Gold earned that day
+        """
+        self.completions = completions
+        self.xp_by_stat = xp_by_stat if xp_by_stat is not None else [0] * len(VALID_STATS)
+        self.gold = gold
+
+    @property
+    def total_xp(self) -> int:
+        return sum(self.xp_by_stat)
+
+    def to_dict(self) -> dict:
+        return {
+            "completions": self.completions,
+            "xp_by_stat": list(self.xp_by_stat),
+            "gold": self.gold
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DailyActivity":
+        return cls(data["completions"], list(data["xp_by_stat"]), data["gold"])
+
+
+class HunterActivity:
+    """Daily buckets of one hunter plus its current and longest streaks.
+
+    A streak is a run of consecutive days with at least one completion.
+    Recording a completion updates its day and the streaks in O(1); only a
+    completion older than the last active day makes the streaks be
+    recomputed from the buckets.
+    """
+
+    __slots__ = ("days", "current_streak", "longest_streak", "last_active")
+
+    def __init__(self) -> None:
+        self.days: dict[date, DailyActivity] = {}
+        # Streak ending on last_active
+        self.current_streak = 0
+        self.longest_streak = 0
+        self.last_active: date | None = None
+
+    def record(self, day: date, stat: str | None, xp: int, gold: int) -> None:
+        """Add one completion to its day and update the streaks.
+
+        Args:
+            day: Day the quest was completed
+            stat: Stat that received the XP, if known
+            xp: XP earned
+            gold: Gold earned
+        """
+        bucket = self.days.get(day)
+        if bucket is None:
+            bucket = self.days[day] = DailyActivity()
+        bucket.completions += 1
+        if stat in STAT_INDEX:
+            bucket.xp_by_stat[STAT_INDEX[stat]] += xp
+        bucket.gold += gold
+
+        if self.last_active is None or day - self.last_active > timedelta(days=1):
+            self.current_streak = 1
+            self.last_active = day
+        elif day - self.last_active == timedelta(days=1):
+            self.current_streak += 1
+            self.last_active = day
+        elif day < self.last_active and bucket.completions == 1:
+            # A new day in the past may join two streaks
+            self._recompute_streaks()
+            return
+
+        self.longest_streak = max(self.longest_streak, self.current_streak)
+
+    def streak_on(self, today: date) -> int:
+        """Current streak as of today: it is still alive if the hunter was active today or yesterday."""
+        if self.last_active is None or today - self.last_active > timedelta(days=1):
+            return 0
+        return self.current_streak
+
+    def _recompute_streaks(self) -> None:
+        """Recompute both streaks from the daily buckets."""
+        self.current_streak = self.longest_streak = 0
+        previous = None
+        for day in sorted(self.days):
+            if previous is not None and day - previous == timedelta(days=1):
+                self.current_streak += 1
+            else:
+                self.current_streak = 1
+            self.longest_streak = max(self.longest_streak, self.current_streak)
+            previous = day
+        self.last_active = previous
+
+    def to_dict(self) -> dict:
+        return {
+            "days": {day.isoformat(): bucket.to_dict() for day, bucket in self.days.items()},
+            "current_streak": self.current_streak,
+            "longest_streak": self.longest_streak,
+            "last_active": self.last_active.isoformat() if self.last_active is not None else None
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HunterActivity":
+        activity = cls()
+        activity.days = {date.fromisoformat(day): DailyActivity.from_dict(bucket) for day, bucket in data["days"].items()}
+        activity.current_streak = data["current_streak"]
+        activity.longest_streak = data["longest_streak"]
+        activity.last_active = date.fromisoformat(data["last_active"]) if data["last_active"] else None
+        return activity
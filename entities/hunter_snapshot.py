@@ -0,0 +1,60 @@
+"""HunterSnapshot module for the Hunter System.
+
+Cumulative hunter state derived from the quest log up to a point in time.
+"""
+
+from datetime import datetime
+
+from entities.hunter import DEFAULT_HUNTER_ID
+from utils.valid_stats import VALID_STATS
+
+class HunterSnapshot:
+    """State of one hunter reached by replaying its quest logs stored before `position`.
+
+    `position` is where the quest log continues after the last completion
+    covered, and `until` the latest completion time covered, so a snapshot
+    can stand in for those completions in any query up to a moment at or
+    after `until`.
+    """
+
+    __slots__ = ("hunter_id", "position", "until", "events", "stat_xp", "gold")
+
+    def __init__(self, hunter_id: str, position: int, until: datetime, events: int,
+                 stat_xp: tuple[int, ...], gold: int) -> None:
+        """Initialize a snapshot.
+
+        Args:
+            hunter_id: Hunter whose completions are covered
+            position: Quest log position right after the last completion covered
+            until: Latest completion time covered
+            events: Number of completions covered
+            stat_xp: Total XP per stat, indexed like VALID_STATS
+            gold: Total gold earned from the covered completions
+        """
+        self.hunter_id = hunter_id
+        self.position = position
+        self.until = until
+        self.events = events
+        self.stat_xp = stat_xp
+        self.gold = gold
+
+    @classmethod
+    def empty(cls, hunter_id: str) -> "HunterSnapshot":
+        """Snapshot of a hunter with no completions."""
+        return cls(hunter_id, 0, datetime.min, 0, (0,) * len(VALID_STATS), 0)
+
+    def to_dict(self) -> dict:
+        return {
+            "hunter_id": self.hunter_id,
+            "position": self.position,
+            "until": self.until.isoformat(),
+            "events": self.events,
+            "stat_xp": list(self.stat_xp),
+            "gold": self.gold
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HunterSnapshot":
+        # Snapshots taken before hunters had IDs cover the default hunter
+        return cls(data.get("hunter_id", DEFAULT_HUNTER_ID), data["position"], datetime.fromisoformat(data["until"]),
+                   data["events"], tuple(data["stat_xp"]), data["gold"])
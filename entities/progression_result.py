@@ -0,0 +1,54 @@
+"""Progression result module for the Hunter System.
+
+Structured results returned when XP and gold are applied to stats and hunters.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class StatProgress:
+    """Outcome of applying XP to a single stat."""
+
+    stat: str
+    xp_gained: int
+    total_xp: int
+    level_before: int
+    level_after: int
+    xp_to_next_level: int
+
+    @property
+    def levels_gained(self) -> int:
+        """Number of levels crossed by this XP gain."""
+        return self.level_after - self.level_before
+
+    @property
+    def leveled_up(self) -> bool:
+        """Whether at least one level was gained."""
+        return self.level_after > self.level_before
+
+
+@dataclass(frozen=True, slots=True)
+class RewardResult:
+    """Outcome of applying a set of XP grants and gold to a hunter."""
+
+    stats: tuple[StatProgress, ...]
+    gold_gained: int
+    total_gold: int
+
+    @property
+    def xp_gained(self) -> int:
+        """Total XP gained across all stats."""
+        return sum(progress.xp_gained for progress in self.stats)
+
+    @property
+    def leveled_up(self) -> bool:
+        """Whether any stat gained a level."""
+        return any(progress.leveled_up for progress in self.stats)
+
+    def for_stat(self, stat_name: str) -> StatProgress | None:
+        """Get the progress of a specific stat, or None if it received no XP."""
+        for progress in self.stats:
+            if progress.stat == stat_name:
+                return progress
+        return None
@@ -13,6 +13,8 @@ class Quest:
     and provides XP and gold rewards when completed. 
     """
 
+    __slots__ = ("id", "name", "stat", "difficulty", "xp_reward", "gold_reward", "description")
+
     def __init__(self, name: str, stat: str, difficulty: QuestDifficulty,
                  xp_reward: int, gold_reward: int, description: str) -> None:
         """Initialize a quest with rewards and difficulty
@@ -32,4 +34,33 @@ class Quest:
         self.difficulty = difficulty
         self.xp_reward = xp_reward
         self.gold_reward = gold_reward
-        self.description = description
\ No newline at end of file
+        self.description = description
+
+    @classmethod
+    def from_record(cls, id: str, name: str, stat: str, difficulty: QuestDifficulty,
+                    xp_reward: int, gold_reward: int, description: str) -> "Quest":
+        """Rebuild a stored quest without generating a new ID.
+
+        Used by repositories when materializing persisted quests.
+
+        Args:
+            id: Stored unique identifier of the quest
+            name: Name of the quest
+            stat: Associated stat type
+            difficulty: Difficulty level from QuestDifficulty enum
+            xp_reward: Experience points awarded upon completion
+            gold_reward: Gold awarded upon completion
+            description: Brief description of the quest
+
+        Returns:
+            Quest: The rebuilt Quest object
+        """
+        quest = cls.__new__(cls)
+        quest.id = id
+        quest.name = name
+        quest.stat = stat
+        quest.difficulty = difficulty
+        quest.xp_reward = xp_reward
+        quest.gold_reward = gold_reward
+        quest.description = description
+        return quest
@@ -10,4 +10,7 @@ class QuestDifficulty(Enum):
     NORMAL = "Normal"
     HARD = "Hard"
     EPIC = "Epic"
-    LEGENDARY = "Legendary"
\ No newline at end of file
+    LEGENDARY = "Legendary"
+
+# Lookup of difficulties by stored value, cheaper than QuestDifficulty(value) per row
+DIFFICULTY_BY_VALUE = {difficulty.value: difficulty for difficulty in QuestDifficulty}
@@ -5,22 +5,59 @@ Records historical completion of quests with rewards earned.
 
 from datetime import datetime
 
+from entities.hunter import DEFAULT_HUNTER_ID
+
 class QuestLog:
     """Represents a historical record of a completed quest.
 
-    Logs the quest ID, timestamp, and rewards earned at completion time.
+    Logs the quest ID, the hunter who completed it, timestamp, rewarded stat
+    and rewards earned at completion time.
     """
 
-    def __init__(self, quest_id: str, xp_earned: int, gold_earned: int) -> None:
+    __slots__ = ("quest_id", "xp_earned", "gold_earned", "completed_at", "stat", "hunter_id")
+
+    def __init__(self, quest_id: str, xp_earned: int, gold_earned: int, stat: str | None = None,
+                 hunter_id: str = DEFAULT_HUNTER_ID) -> None:
         """Initialize a quest completion log.
-        
+
         Args:
             quest_id: Unique identifier of the completed quest
             xp_earned: Experience points earned from completion
             gold_earned: Gold earned from completion
+            stat: Stat that received the XP, if known
+            hunter_id: Hunter who completed the quest
         """
         self.quest_id = quest_id
         self.xp_earned = xp_earned
         self.gold_earned = gold_earned
-        
-        self.completed_at = datetime.now()
\ No newline at end of file
+        self.stat = stat
+        self.hunter_id = hunter_id
+
+        self.completed_at = datetime.now()
+
+    @classmethod
+    def from_record(cls, quest_id: str, xp_earned: int, gold_earned: int,
+                    completed_at: datetime, stat: str | None = None,
+                    hunter_id: str = DEFAULT_HUNTER_ID) -> "QuestLog":
+        """Rebuild a stored quest log without reading the clock.
+
+        Args:
+            quest_id: Unique identifier of the completed quest
+            xp_earned: Experience points earned from completion
+            gold_earned: Gold earned from completion
+            completed_at: Stored completion timestamp
+            stat: Stat that received the XP, if stored
+            hunter_id: Hunter who completed the quest; logs written before
+                hunters had IDs belong to the default hunter
+
+        Returns:
+            QuestLog: The rebuilt QuestLog object
+        """
+        quest_log = cls.__new__(cls)
+        quest_log.quest_id = quest_id
+        quest_log.xp_earned = xp_earned
+        quest_log.gold_earned = gold_earned
+        quest_log.completed_at = completed_at
+        quest_log.stat = stat
+        quest_log.hunter_id = hunter_id
+        return quest_log
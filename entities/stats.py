@@ -4,10 +4,18 @@ Stat module
 Defines individual statistics with XP-based leveling.
 """
 
-from utils.level_constants import XP_THRESHOLDS
+from entities.progression_result import StatProgress
+from utils import level_resolver
+from utils.xp_curve import DEFAULT_XP_CURVE, XPCurve
 
 class Stat:
-    """Represents an individual player statistic (Strength, Agility, etc.)."""
+    """Represents an individual player statistic (Strength, Agility, etc.).
+
+    A Stat either holds its own XP or is a lightweight view over one slot of
+    its owning Hunter's XP array (see Hunter.stats).
+    """
+
+    __slots__ = ("name", "_total_xp", "_owner", "_index")
 
     def __init__(self, name: str, total_xp: int) -> None:
         """Initialize a stat with name and total XP accumulated.
@@ -17,31 +25,89 @@ class Stat:
             total_xp: Total experience points accumulated
         """
         self.name = name
-        self.total_xp = total_xp
+        self._total_xp = total_xp
+        self._owner = None
+        self._index = -1
+
+    @classmethod
+    def _view(cls, owner, index: int, name: str) -> "Stat":
+        """Create a stat view backed by slot `index` of owner._stat_xp."""
+        stat = cls.__new__(cls)
+        stat.name = name
+        stat._total_xp = 0
+        stat._owner = owner
+        stat._index = index
+        return stat
+
+    @property
+    def total_xp(self) -> int:
+        """Total experience points accumulated."""
+        if self._owner is None:
+            return self._total_xp
+        return self._owner._stat_xp[self._index]
+
+    @total_xp.setter
+    def total_xp(self, value: int) -> None:
+        if self._owner is None:
+            self._total_xp = value
+        else:
+            self._owner._set_stat_xp(self._index, value)
 
     def get_level(self) -> int:
         """Calculate current level based on total XP accumulated."""
-        level: int = 1
-        for i in range(len(XP_THRESHOLDS)):
-            if self.total_xp >= XP_THRESHOLDS[i]:
-                level = i + 1
-            else:
-                break
-        return level
+        return level_resolver.get_level(self.total_xp)
             
     def xp_for_next_level(self) -> int:
         """Calculate XP needed to reach next level.
         
         Returns:
-            XP needed for next level, or 0 if at max level
+            XP needed for next level
         """
 
-        current_level = self.get_level()
-        if current_level >= len(XP_THRESHOLDS):
-            return 0
-        next_level_threshold = XP_THRESHOLDS[current_level]
-        xp_needed = next_level_threshold - self.total_xp
-        return xp_needed    
+        return level_resolver.xp_for_next_level(self.total_xp)
+
+    def apply_xp(self, exp: int, curve: XPCurve = DEFAULT_XP_CURVE) -> StatProgress:
+        """Add experience points and report the resulting progression.
+
+        Levels are resolved once before and once after the gain; when the gain
+        does not cross the next threshold the second lookup is skipped.
+
+        Args:
+            exp: Amount of XP to add
+            curve: XP curve used to resolve levels
+
+        Returns:
+            StatProgress with levels before/after and XP remaining to next level
+
+        Raises:
+            ValueError: If exp is negative or zero
+        """
+        if exp <= 0:
+            raise ValueError('Cannot add negative or zero XP')
+
+        level_before = curve.level_for_xp(self.total_xp)
+        next_threshold = curve.threshold(level_before + 1)
+
+        if self._owner is None:
+            self._total_xp += exp
+            total_xp = self._total_xp
+        else:
+            total_xp = self._owner._add_stat_xp(self._index, exp)
+
+        if total_xp < next_threshold:
+            level_after = level_before
+        else:
+            level_after = curve.level_for_xp(total_xp)
+            next_threshold = curve.threshold(level_after + 1)
+
+        return StatProgress(
+            stat=self.name,
+            xp_gained=exp,
+            total_xp=total_xp,
+            level_before=level_before,
+            level_after=level_after,
+            xp_to_next_level=next_threshold - total_xp
+        )
 
     def add_exp(self, exp: int) -> str:
         """Add experience points and detect level-ups.
@@ -54,14 +120,12 @@ class Stat:
         """
         if exp <= 0:
             return 'Cannot add negative or zero XP'
-        
-        level_before = self.get_level()
-        self.total_xp += exp
-        level_after = self.get_level()
 
-        if level_after == level_before:
-            return (f'XP gained: {exp} | Total XP: {self.total_xp} | '
-                   f'XP to next level: {self.xp_for_next_level()}')
+        progress = self.apply_xp(exp)
+
+        if not progress.leveled_up:
+            return (f'XP gained: {exp} | Total XP: {progress.total_xp} | '
+                   f'XP to next level: {progress.xp_to_next_level}')
         
         else: 
-            return f'XP gained: {exp} - Level Up! {level_before} -> {level_after}'
\ No newline at end of file
+            return f'XP gained: {exp} - Level Up! {progress.level_before} -> {progress.level_after}'
\ No newline at end of file
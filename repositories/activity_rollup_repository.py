@@ -0,0 +1,308 @@
+"""Activity rollup repository for JSON persistence.
+
+Per-hunter daily activity (see HunterActivity) is stored as a base file plus
+an append-only journal next to it, like JournaledQuestRepository: recording
+a completion appends one small JSON Lines record instead of rewriting the
+rollups, and once the journal grows past a threshold it is compacted into a
+new base file written atomically.
+
+Journal records carry a sequence number and the base file the last number it
+includes, so replaying a journal over a base that already contains part of
+it never counts a completion twice.
+
+A rebuild from the quest log records the log position it read through
+(`rebuilt_through`, for every hunter or per hunter). Batches recorded with a
+log position at or before it are already part of the rebuilt rollups and
+are skipped, so completions persisted while a rebuild runs are counted once.
+
+The rollups are derived from the quest log and can be rebuilt from it, so
+appends are not fsynced.
+"""
+
+import json
+import os
+from datetime import date, datetime, timedelta
+
+from entities.hunter_activity import DailyActivity, HunterActivity
+from repositories.file_lock import atomic_write, get_file_lock
+
+class ActivityRollupRepository:
+    """Daily activity of every hunter, in a base file plus a journal.
+
+    Files used, for a base file `activity_rollups.json`:
+        activity_rollups.json          {"seq": last record included, "hunters": {id: activity},
+                                        "rebuilt_through": log position, "hunters_rebuilt_through": {id: log position}}
+        activity_rollups.json.journal  Completions recorded since the last compaction
+
+    Every operation holds the base file's cross-process lock and first
+    catches up on records appended by other processes.
+    """
+
+    def __init__(self, filepath: str = "data/activity_rollups.json", compact_threshold: int = 1000) -> None:
+        """Initialize repository with file path and journal settings.
+
+        Args:
+            filepath (str): Path to the base file.
+            compact_threshold (int): Journal records that trigger a compaction.
+        """
+        self.filepath = filepath
+        self.journal_path = filepath + ".journal"
+        self.compact_threshold = compact_threshold
+        self.lock = get_file_lock(filepath)
+
+        self._hunters: dict[str, HunterActivity] = {}
+        self._seq = 0
+        self._rebuilt_through = 0
+        self._hunters_rebuilt_through: dict[str, int] = {}
+        self._base_signature = None
+        self._journal_inode = None
+        self._journal_offset = 0
+        self._journal_records = 0
+        self._loaded = False
+        self._ensure_data_directory()
+
+    def _ensure_data_directory(self) -> None:
+        """Create data directory if it doesn't exist."""
+        dir_path = os.path.dirname(self.filepath)
+        if dir_path and not os.path.exists(dir_path):
+            os.makedirs(dir_path)
+
+    # Private methods
+
+    @staticmethod
+    def _file_signature(path: str) -> tuple | None:
+        """(inode, mtime, size) of a file, or None if it does not exist."""
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _catch_up(self) -> None:
+        """Bring the in-memory rollups up to date with the files. Must hold the lock.
+
+        Only new journal records are read unless the base file or the journal
+        were replaced (first load or a compaction by another process), which
+        triggers a full reload.
+        """
+        base_signature = self._file_signature(self.filepath)
+        journal_signature = self._file_signature(self.journal_path)
+        journal_inode = journal_signature[0] if journal_signature else None
+
+        journal_replaced = self._journal_offset > 0 and (
+            journal_inode != self._journal_inode or journal_signature[2] < self._journal_offset)
+
+        if not self._loaded or base_signature != self._base_signature or journal_replaced:
+            self._hunters, self._seq = {}, 0
+            self._rebuilt_through, self._hunters_rebuilt_through = 0, {}
+            if base_signature is not None:
+                with open(self.filepath, 'rb') as file:
+                    data = json.loads(file.read())
+                self._hunters = {
+                    hunter_id: HunterActivity.from_dict(activity)
+                    for hunter_id, activity in data["hunters"].items()
+                }
+                self._seq = data["seq"]
+                self._rebuilt_through = data.get("rebuilt_through", 0)
+                self._hunters_rebuilt_through = data.get("hunters_rebuilt_through", {})
+            self._base_signature = base_signature
+            self._journal_offset = 0
+            self._journal_records = 0
+            self._loaded = True
+
+        self._journal_inode = journal_inode
+        if journal_signature is None or journal_signature[2] == self._journal_offset:
+            return
+
+        with open(self.journal_path, 'rb') as file:
+            file.seek(self._journal_offset)
+            chunk = file.read()
+
+        # A trailing record without a newline is a torn write and is ignored
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            if line.strip():
+                self._apply(json.loads(line))
+                self._journal_records += 1
+        self._journal_offset += end
+
+    def _apply(self, record: dict) -> None:
+        """Apply one journal record unless the base already includes it."""
+        if record["seq"] <= self._seq:
+            return
+        self._seq = record["seq"]
+        self._activity(record["hunter_id"]).record(
+            date.fromisoformat(record["day"]), record["stat"], record["xp"], record["gold"])
+
+    def _activity(self, hunter_id: str) -> HunterActivity:
+        activity = self._hunters.get(hunter_id)
+        if activity is None:
+            activity = self._hunters[hunter_id] = HunterActivity()
+        return activity
+
+    def _rebuilt_after(self, hunter_id: str, position: int) -> bool:
+        """Whether the hunter's rollups were rebuilt from the quest log through position. Must hold the lock."""
+        return position <= max(self._rebuilt_through, self._hunters_rebuilt_through.get(hunter_id, 0))
+
+    def _compact(self) -> None:
+        """Write every rollup to a new base file and start an empty journal. Must hold the lock."""
+        data = {
+            "seq": self._seq,
+            "hunters": {hunter_id: activity.to_dict() for hunter_id, activity in self._hunters.items()},
+            "rebuilt_through": self._rebuilt_through,
+            "hunters_rebuilt_through": self._hunters_rebuilt_through
+        }
+        atomic_write(self.filepath, json.dumps(data).encode(), fsync=False)
+        # The base now includes every journal record, so losing the journal from here on is harmless
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+        self._base_signature = self._file_signature(self.filepath)
+        self._journal_inode = None
+        self._journal_offset = 0
+        self._journal_records = 0
+
+    # Public methods
+
+    def record(self, hunter_id: str, stat: str | None, xp: int, gold: int, completed_at: datetime) -> None:
+        """Add one completion to a hunter's rollups.
+        Args:
+            hunter_id (str): Hunter who completed the quest.
+            stat (str | None): Stat that received the XP, if known.
+            xp (int): XP earned.
+            gold (int): Gold earned.
+            completed_at (datetime): When the quest was completed.
+        """
+
+        self.record_many([(hunter_id, stat, xp, gold, completed_at)])
+
+    def record_many(self, completions: list[tuple[str, str | None, int, int, datetime]],
+                    position: int | None = None) -> None:
+        """Add several completions, of any hunters, with one lock acquisition and one append.
+        Args:
+            completions (list[tuple]): (hunter_id, stat, xp, gold, completed_at) per completion.
+            position (int | None): Quest log position right after the completions, if they
+                come from the log; those a rebuild already read through are skipped.
+        """
+
+        if not completions:
+            return
+
+        with self.lock:
+            self._catch_up()
+            records = []
+            for hunter_id, stat, xp, gold, completed_at in completions:
+                if position is not None and self._rebuilt_after(hunter_id, position):
+                    continue
+                records.append({
+                    "seq": self._seq + len(records) + 1,
+                    "hunter_id": hunter_id,
+                    "day": completed_at.date().isoformat(),
+                    "stat": stat,
+                    "xp": xp,
+                    "gold": gold
+                })
+            if not records:
+                return
+            lines = b"".join(json.dumps(record).encode() + b"\n" for record in records)
+
+            with open(self.journal_path, 'ab') as file:
+                # Drop a torn record left by a crash so the new ones start on their own line
+                if file.tell() > self._journal_offset:
+                    file.truncate(self._journal_offset)
+                file.write(lines)
+            self._journal_inode = self._file_signature(self.journal_path)[0]
+
+            for record in records:
+                self._apply(record)
+            self._journal_offset += len(lines)
+            self._journal_records += len(records)
+
+            if self._journal_records >= self.compact_threshold:
+                self._compact()
+
+    def get(self, hunter_id: str) -> HunterActivity | None:
+        """Get a copy of a hunter's rollups.
+        Args:
+            hunter_id (str): Hunter to look up.
+        Returns:
+            HunterActivity | None: The rollups, or None if the hunter has no recorded completion.
+        """
+
+        with self.lock:
+            self._catch_up()
+            activity = self._hunters.get(hunter_id)
+            return HunterActivity.from_dict(activity.to_dict()) if activity is not None else None
+
+    def streaks(self, hunter_id: str, today: date) -> dict:
+        """Get a hunter's streaks as of today.
+        Args:
+            hunter_id (str): Hunter to look up.
+            today (date): Day the current streak is evaluated on.
+        Returns:
+            dict: current_streak, longest_streak and last_active (None if never active).
+        """
+
+        with self.lock:
+            self._catch_up()
+            activity = self._hunters.get(hunter_id) or HunterActivity()
+            return {
+                "current_streak": activity.streak_on(today),
+                "longest_streak": activity.longest_streak,
+                "last_active": activity.last_active
+            }
+
+    def days(self, hunter_id: str, start: date, end: date) -> list[tuple[date, DailyActivity]]:
+        """Get a hunter's daily buckets from start to end, both included; days without activity are skipped.
+        Args:
+            hunter_id (str): Hunter to look up.
+            start (date): First day.
+            end (date): Last day.
+        Returns:
+            list[tuple[date, DailyActivity]]: Copies of the buckets, oldest first.
+        """
+
+        with self.lock:
+            self._catch_up()
+            activity = self._hunters.get(hunter_id)
+            if activity is None:
+                return []
+
+            days = []
+            day = start
+            while day <= end:
+                bucket = activity.days.get(day)
+                if bucket is not None:
+                    days.append((day, DailyActivity.from_dict(bucket.to_dict())))
+                day += timedelta(days=1)
+            return days
+
+    def replace(self, hunter_id: str, activity: HunterActivity, rebuilt_through: int | None = None) -> None:
+        """Replace a hunter's rollups, e.g. with ones rebuilt from the quest log, and compact.
+        Args:
+            hunter_id (str): Hunter whose rollups are replaced.
+            activity (HunterActivity): The new rollups.
+            rebuilt_through (int | None): Quest log position the rollups were rebuilt through, if any.
+        """
+
+        with self.lock:
+            self._catch_up()
+            self._hunters[hunter_id] = activity
+            if rebuilt_through is not None:
+                self._hunters_rebuilt_through[hunter_id] = rebuilt_through
+            self._compact()
+
+    def replace_all(self, activities: dict[str, HunterActivity], rebuilt_through: int | None = None) -> None:
+        """Replace every hunter's rollups, e.g. with ones rebuilt from the whole quest log, and compact.
+        Args:
+            activities (dict[str, HunterActivity]): The new rollups by hunter id; other hunters are dropped.
+            rebuilt_through (int | None): Quest log position the rollups were rebuilt through, if any.
+        """
+
+        with self.lock:
+            self._catch_up()
+            self._hunters = dict(activities)
+            if rebuilt_through is not None:
+                self._rebuilt_through = rebuilt_through
+                self._hunters_rebuilt_through = {}
+            self._compact()
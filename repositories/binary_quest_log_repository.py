@@ -0,0 +1,454 @@
+"""QuestLog Repository for fixed-width binary persistence.
+
+Stores each completion as a fixed-size record and reads the file through
+`mmap` as a NumPy structured array, so analytics over years of completions
+(sums, time-range scans) run on the mapped memory without parsing or copying.
+"""
+
+import os
+import struct
+from collections.abc import Iterator
+from datetime import datetime
+
+import numpy as np
+
+from entities.hunter import DEFAULT_HUNTER_ID
+from entities.quest_log import QuestLog
+from repositories.file_lock import atomic_write, get_file_lock
+from repositories.quest_log_repository import widen_end, widen_start
+from utils.valid_stats import STAT_INDEX, VALID_STATS
+
+MAGIC = b"HQLOG\x00\x00\x02"
+HEADER = struct.Struct("<8sII")  # magic, record size, reserved
+RECORD = struct.Struct("<IIB7xqqq")  # quest ordinal, hunter ordinal, stat ordinal, pad, timestamp (us), xp, gold
+
+# Mirrors RECORD; fields are read in place from the mapped file
+RECORD_DTYPE = np.dtype([
+    ("quest", "<u4"),
+    ("hunter", "<u4"),
+    ("stat", "u1"),
+    ("_pad", "V7"),
+    ("timestamp_us", "<i8"),
+    ("xp", "<i8"),
+    ("gold", "<i8"),
+])
+
+# Version 1 records had no hunter; they belong to the default hunter
+MAGIC_V1 = b"HQLOG\x00\x00\x01"
+RECORD_V1_DTYPE = np.dtype([
+    ("quest", "<u4"),
+    ("stat", "u1"),
+    ("_pad", "V3"),
+    ("timestamp_us", "<i8"),
+    ("xp", "<i8"),
+    ("gold", "<i8"),
+])
+
+UNKNOWN_STAT = 255
+
+
+def to_timestamp_us(moment: datetime) -> int:
+    """Convert a datetime to epoch microseconds (naive datetimes are local time)."""
+    return round(moment.timestamp() * 1_000_000)
+
+
+def from_timestamp_us(timestamp_us: int) -> datetime:
+    """Convert epoch microseconds back to a naive local datetime."""
+    return datetime.fromtimestamp(timestamp_us / 1_000_000)
+
+
+class IdDictionary:
+    """Append-only file of IDs, one per line; the line number is the ID's ordinal.
+
+    Records store ordinals instead of ID strings, which keeps them fixed-width.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._ids: list[str] = []
+        self._ordinals: dict[str, int] = {}
+        self.load()
+
+    def load(self) -> None:
+        """Read the IDs registered so far, including those added by other processes."""
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, 'r') as file:
+            self._ids = [line.rstrip("\n") for line in file if line.endswith("\n")]
+        self._ordinals = {id_: i for i, id_ in enumerate(self._ids)}
+
+    def find(self, id_: str) -> int | None:
+        """Get the ordinal of an ID, or None if it was never registered."""
+        ordinal = self._ordinals.get(id_)
+        if ordinal is None:
+            # Another process may have registered it since we loaded
+            self.load()
+            ordinal = self._ordinals.get(id_)
+        return ordinal
+
+    def register(self, id_: str) -> int:
+        """Get the ordinal of an ID, registering it if new. Must hold the log's lock."""
+        ordinal = self.find(id_)
+        if ordinal is not None:
+            return ordinal
+
+        with open(self.path, 'a') as file:
+            file.write(id_ + "\n")
+        ordinal = len(self._ids)
+        self._ids.append(id_)
+        self._ordinals[id_] = ordinal
+        return ordinal
+
+    def id(self, ordinal: int) -> str:
+        """Get the ID stored under an ordinal."""
+        if ordinal >= len(self._ids):
+            self.load()
+        return self._ids[ordinal]
+
+
+class BinaryQuestLogRepository:
+    """Handles quest logs stored as fixed-width binary records.
+
+    Files used, for `quest_logs.bin`:
+        quest_logs.bin          Header followed by one RECORD per completion
+        quest_logs.bin.quests   Quest IDs, one per line; the line number is the quest ordinal
+        quest_logs.bin.hunters  Hunter IDs, one per line; the line number is the hunter ordinal
+
+    Records are expected to be appended in completion order, give or take
+    MAX_DISORDER, which keeps the timestamp column sorted enough for time
+    ranges to be found by binary search.
+    """
+
+    def __init__(self, filepath: str = "data/quest_logs.bin"):
+        """Initialize repository with file path.
+
+        A log in the version 1 format (no hunter per record) is converted
+        once, its records assigned to the default hunter.
+        Args:
+            filepath (str): Path to the binary log file.
+        """
+
+        self.filepath = filepath
+        self._ensure_data_directory()
+
+        self.lock = get_file_lock(filepath)
+        self._quests = IdDictionary(filepath + ".quests")
+        self._hunters = IdDictionary(filepath + ".hunters")
+        self._upgrade_v1_file()
+
+        self._mapped_signature = None
+        self._mapped: np.ndarray = np.empty(0, dtype=RECORD_DTYPE)
+
+    def _ensure_data_directory(self) -> None:
+        """Create data directory if it doesn't exist."""
+        dir_path = os.path.dirname(self.filepath)
+        if dir_path and not os.path.exists(dir_path):
+            os.makedirs(dir_path)
+
+    def _read_magic(self) -> bytes | None:
+        """Magic of the log file, or None if it has no complete header yet."""
+        try:
+            with open(self.filepath, 'rb') as file:
+                header = file.read(HEADER.size)
+        except FileNotFoundError:
+            return None
+        return HEADER.unpack(header)[0] if len(header) == HEADER.size else None
+
+    def _upgrade_v1_file(self) -> None:
+        """Rewrite a version 1 log in the current format, giving its records to the default hunter."""
+        if self._read_magic() != MAGIC_V1:
+            return
+
+        with self.lock:
+            if self._read_magic() != MAGIC_V1:
+                return
+
+            size = os.path.getsize(self.filepath)
+            count = (size - HEADER.size) // RECORD_V1_DTYPE.itemsize
+            old = np.fromfile(self.filepath, dtype=RECORD_V1_DTYPE, count=count, offset=HEADER.size)
+
+            records = np.zeros(count, dtype=RECORD_DTYPE)
+            for field in ("quest", "stat", "timestamp_us", "xp", "gold"):
+                records[field] = old[field]
+            records["hunter"] = self._hunters.register(DEFAULT_HUNTER_ID)
+
+            atomic_write(self.filepath, HEADER.pack(MAGIC, RECORD.size, 0) + records.tobytes())
+
+    def quest_id(self, ordinal: int) -> str:
+        """Get the quest ID stored under a quest ordinal."""
+        return self._quests.id(ordinal)
+
+    def hunter_id(self, ordinal: int) -> str:
+        """Get the hunter ID stored under a hunter ordinal."""
+        return self._hunters.id(ordinal)
+
+    # Writing
+
+    def _pack(self, quest_log: QuestLog) -> bytes:
+        """Encode a QuestLog as one binary record. Must hold the lock."""
+        return RECORD.pack(
+            self._quests.register(quest_log.quest_id),
+            self._hunters.register(quest_log.hunter_id),
+            STAT_INDEX.get(quest_log.stat, UNKNOWN_STAT),
+            to_timestamp_us(quest_log.completed_at),
+            quest_log.xp_earned,
+            quest_log.gold_earned
+        )
+
+    def add(self, quest_log: QuestLog) -> int:
+        """Add a quest log entry by appending one record.
+        Args:
+            quest_log (QuestLog): The quest log entry to add.
+        Returns:
+            int: Log position right after the entry, as for iter_from().
+        """
+
+        return self.add_many([quest_log])
+
+    def add_many(self, quest_logs: list[QuestLog]) -> int:
+        """Append several quest log entries with a single write.
+        Args:
+            quest_logs (list[QuestLog]): The quest log entries to add, in completion order.
+        Returns:
+            int: Log position right after the last entry, as for iter_from().
+        """
+
+        if not quest_logs:
+            return self.end_position()
+
+        with self.lock:
+            payload = b"".join(self._pack(quest_log) for quest_log in quest_logs)
+
+            with open(self.filepath, 'ab') as file:
+                size = file.tell()
+                if size == 0:
+                    payload = HEADER.pack(MAGIC, RECORD.size, 0) + payload
+                else:
+                    # Drop a torn record left by a crash so records stay aligned
+                    torn = (size - HEADER.size) % RECORD.size
+                    if torn:
+                        size -= torn
+                        file.truncate(size)
+                try:
+                    file.write(payload)
+                    file.flush()
+                except BaseException:
+                    # Leave no partial records behind, so a retry does not log them twice
+                    file.truncate(size)
+                    raise
+                return (file.tell() - HEADER.size) // RECORD.size
+
+    def end_position(self) -> int:
+        """Position where the next record will be stored; no append is in progress while it is read."""
+        with self.lock:
+            try:
+                size = os.path.getsize(self.filepath)
+            except FileNotFoundError:
+                return 0
+            return max(0, size - HEADER.size) // RECORD.size
+
+    # Reading
+
+    def records(self) -> np.ndarray:
+        """Get every stored record as a read-only structured array mapped from the file.
+
+        The array is a view over the memory-mapped file, not a copy. It is
+        remapped when the file has grown since the last call.
+
+        Returns:
+            np.ndarray: Array of RECORD_DTYPE, in completion order.
+        """
+        try:
+            stat = os.stat(self.filepath)
+        except FileNotFoundError:
+            return np.empty(0, dtype=RECORD_DTYPE)
+
+        # The inode changes when another process upgrades the file in place
+        signature = (stat.st_ino, stat.st_size)
+        if signature != self._mapped_signature:
+            self._check_header()
+            count = (stat.st_size - HEADER.size) // RECORD.size
+            if count > 0:
+                self._mapped = np.memmap(self.filepath, dtype=RECORD_DTYPE, mode='r',
+                                         offset=HEADER.size, shape=(count,))
+            else:
+                self._mapped = np.empty(0, dtype=RECORD_DTYPE)
+            self._mapped_signature = signature
+
+        return self._mapped
+
+    def _check_header(self) -> None:
+        """Validate the file header.
+
+        Raises:
+            ValueError: If the file is not a quest log in this format
+        """
+        with open(self.filepath, 'rb') as file:
+            header = file.read(HEADER.size)
+
+        if len(header) < HEADER.size:
+            return
+
+        magic, record_size, _ = HEADER.unpack(header)
+        if magic != MAGIC or record_size != RECORD.size:
+            raise ValueError(f"{self.filepath} is not a binary quest log in the expected format")
+
+    def between(self, start: datetime | None = None, end: datetime | None = None,
+                hunter_id: str | None = None) -> np.ndarray:
+        """Get the records completed in [start, end), located by binary search.
+
+        The search bounds are widened by MAX_DISORDER and the records between
+        them filtered exactly, so records logged slightly out of order are kept.
+        Args:
+            start (datetime | None): Inclusive lower bound, or None for the beginning.
+            end (datetime | None): Exclusive upper bound, or None for the end.
+            hunter_id (str | None): Only this hunter's records, or None for every hunter.
+        Returns:
+            np.ndarray: Slice of records() within the time range; a filtered
+            copy of that slice when hunter_id is given or records near the
+            bounds fall outside the range.
+        """
+
+        records = self.records()
+        timestamps = records["timestamp_us"]
+
+        lo, hi = 0, len(records)
+        if start is not None:
+            lo = int(np.searchsorted(timestamps, to_timestamp_us(widen_start(start)), side="left"))
+        if end is not None:
+            hi = int(np.searchsorted(timestamps, to_timestamp_us(widen_end(end)), side="left"))
+        records = records[lo:max(lo, hi)]
+
+        keep = np.ones(len(records), dtype=bool)
+        if start is not None:
+            keep &= records["timestamp_us"] >= to_timestamp_us(start)
+        if end is not None:
+            keep &= records["timestamp_us"] < to_timestamp_us(end)
+        if hunter_id is not None:
+            ordinal = self._hunters.find(hunter_id)
+            if ordinal is None:
+                return records[:0]
+            keep &= records["hunter"] == ordinal
+        return records if keep.all() else records[keep]
+
+    def total_rewards(self, start: datetime | None = None, end: datetime | None = None,
+                      hunter_id: str | None = None) -> dict:
+        """Sum completions, XP and gold over a time range.
+        Args:
+            start (datetime | None): Inclusive lower bound, or None for the beginning.
+            end (datetime | None): Exclusive upper bound, or None for the end.
+            hunter_id (str | None): Only this hunter's records, or None for every hunter.
+        Returns:
+            dict: completions, total_xp, total_gold and XP per stat.
+        """
+
+        records = self.between(start, end, hunter_id)
+        xp_by_stat = np.bincount(records["stat"], weights=records["xp"], minlength=len(VALID_STATS))
+
+        return {
+            "completions": int(len(records)),
+            "total_xp": int(records["xp"].sum()),
+            "total_gold": int(records["gold"].sum()),
+            "xp_by_stat": {
+                stat_name: int(xp_by_stat[index]) for index, stat_name in enumerate(VALID_STATS)
+            }
+        }
+
+    def iter_between(self, start: datetime | None = None, end: datetime | None = None,
+                     hunter_id: str | None = None) -> Iterator[QuestLog]:
+        """Iterate over the quest logs completed in [start, end), located by binary search as in between().
+        Args:
+            start (datetime | None): Inclusive lower bound, or None for the beginning.
+            end (datetime | None): Exclusive upper bound, or None for the end.
+            hunter_id (str | None): Only this hunter's logs, or None for every hunter.
+        Yields:
+            QuestLog: Each quest log in the range, oldest first.
+        """
+
+        for record in self.between(start, end, hunter_id):
+            yield self._record_to_quest_log(record)
+
+    def iter_from(self, position: int = 0, hunter_id: str | None = None) -> Iterator[tuple[int, QuestLog]]:
+        """Iterate over the quest logs stored at or after a position (a record index), in log order.
+        Args:
+            position (int): Position to start at: 0, or one returned by this method.
+            hunter_id (str | None): Only this hunter's logs, or None for every hunter.
+        Yields:
+            tuple[int, QuestLog]: Position right after each quest log, and the quest log.
+        """
+
+        records = self.records()[position:]
+        if hunter_id is None:
+            indexes = range(len(records))
+        else:
+            ordinal = self._hunters.find(hunter_id)
+            if ordinal is None:
+                return
+            indexes = np.flatnonzero(records["hunter"] == ordinal)
+
+        for index in indexes:
+            yield position + int(index) + 1, self._record_to_quest_log(records[index])
+
+    def count_from(self, position: int = 0, hunter_id: str | None = None) -> int:
+        """Number of quest logs stored at or after a position, as for iter_from()."""
+        records = self.records()[position:]
+        if hunter_id is None:
+            return int(len(records))
+        ordinal = self._hunters.find(hunter_id)
+        return 0 if ordinal is None else int(np.count_nonzero(records["hunter"] == ordinal))
+
+    def _record_to_quest_log(self, record) -> QuestLog:
+        """Convert one structured record to a QuestLog object."""
+        stat_index = int(record["stat"])
+        return QuestLog.from_record(
+            self.quest_id(int(record["quest"])),
+            int(record["xp"]),
+            int(record["gold"]),
+            from_timestamp_us(int(record["timestamp_us"])),
+            VALID_STATS[stat_index] if stat_index < len(VALID_STATS) else None,
+            self.hunter_id(int(record["hunter"]))
+        )
+
+    def get_all(self) -> list[QuestLog]:
+        """Get the whole completion history as QuestLog objects, oldest first.
+        Returns:
+            list[QuestLog]: All stored quest logs.
+        """
+
+        return [self._record_to_quest_log(record) for record in self.records()]
+
+    def iter_all(self) -> Iterator[QuestLog]:
+        """Iterate over the completion history one record at a time, oldest first.
+        Yields:
+            QuestLog: Each stored quest log.
+        """
+
+        for record in self.records():
+            yield self._record_to_quest_log(record)
+
+    def get_recent(self, n: int = 10) -> list[dict]:
+        """Get the N most recent quest logs, oldest first.
+        Args:
+            n (int): Number of recent logs to retrieve.
+        Returns:
+            list[dict]: List of recent quest log entries.
+        """
+
+        if n <= 0:
+            return []
+
+        logs = []
+        for record in self.records()[-n:]:
+            quest_log = self._record_to_quest_log(record)
+            log = {
+                "quest_id": quest_log.quest_id,
+                "hunter_id": quest_log.hunter_id,
+                "completed_at": quest_log.completed_at.isoformat(),
+                "xp_earned": quest_log.xp_earned,
+                "gold_earned": quest_log.gold_earned
+            }
+            if quest_log.stat is not None:
+                log["stat"] = quest_log.stat
+            logs.append(log)
+        return logs
@@ -0,0 +1,227 @@
+"""In-process cache over a QuestRepository."""
+
+import threading
+from collections.abc import Iterator
+
+from entities.quest import Quest
+from entities.quest_difficulty import QuestDifficulty
+from repositories.quest_index import QuestIndex
+from repositories.quest_repository import QuestRepository
+
+
+class CachedQuestRepository:
+    """Keeps the parsed quest catalog in memory, keyed by quest ID.
+
+    Exposes the same methods as QuestRepository. Before each read the cache
+    compares the storage files' inode/mtime/size with the ones it loaded, so
+    edits made by the CLI or another process are picked up on the next call;
+    writes go through the wrapped repository and are applied to the cache.
+
+    The cache also maintains a QuestIndex, so filtered lookups (get_by_stat,
+    get_by_difficulty, find) cost O(matches) rather than O(catalog).
+
+    Callers receive copies of the cached quests, so mutating a returned quest
+    has no effect until it is passed to update().
+    """
+
+    def __init__(self, repository: QuestRepository) -> None:
+        """Initialize the cache over a quest repository.
+
+        Args:
+            repository (QuestRepository): The repository holding the catalog.
+        """
+        self.repository = repository
+
+        self._quests: dict[str, Quest] = {}
+        self._index = QuestIndex()
+        self._signature = None
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.reloads = 0
+
+    # Private methods
+
+    def _copy(self, quest: Quest) -> Quest:
+        """Return a detached copy of a quest."""
+        return Quest.from_record(quest.id, quest.name, quest.stat, quest.difficulty,
+                                 quest.xp_reward, quest.gold_reward, quest.description)
+
+    def _revalidate(self) -> None:
+        """Reload the catalog if its storage files changed since it was cached."""
+        signature = self.repository.storage_signature()
+        if signature == self._signature:
+            self.hits += 1
+            return
+
+        data = self.repository._load_all_data()
+        to_quest = self.repository._dict_to_quest
+        self._quests = {quest_id: to_quest(quest_data) for quest_id, quest_data in data.items()}
+        self._index = QuestIndex.build(self._quests.values())
+        self._signature = signature
+        self.reloads += 1
+
+    def _store(self, quest: Quest) -> None:
+        """Put a copy of a written quest in the cache and its indexes."""
+        cached = self._copy(quest)
+        self._quests[quest.id] = cached
+        self._index.add(cached)
+
+    def _is_current(self) -> bool:
+        """Whether the cache matches the storage files right now."""
+        return self._signature is not None and self.repository.storage_signature() == self._signature
+
+    def _after_write(self, was_current: bool) -> None:
+        """Adopt the post-write file signature if the cache was current before our write."""
+        self._signature = self.repository.storage_signature() if was_current else None
+
+    # Public methods
+
+    def add(self, quest: Quest) -> None:
+        """Add a new quest to the repository.
+
+        Args:
+            quest (Quest): The Quest object to add.
+        """
+        with self._lock:
+            was_current = self._is_current()
+            self.repository.add(quest)
+            self._store(quest)
+            self._after_write(was_current)
+
+    def get_by_id(self, quest_id: str) -> Quest | None:
+        """Get a quest by its ID. Returns None if not found.
+
+        Args:
+            quest_id (str): The ID of the quest to retrieve.
+        Returns:
+            Quest | None: The Quest object if found, None otherwise.
+        """
+        with self._lock:
+            self._revalidate()
+            quest = self._quests.get(quest_id)
+            return self._copy(quest) if quest is not None else None
+
+    def get_many(self, quest_ids: list[str]) -> dict[str, Quest]:
+        """Get copies of several quests by ID.
+
+        Args:
+            quest_ids (list[str]): The IDs of the quests to retrieve.
+        Returns:
+            dict[str, Quest]: The quests found, keyed by ID. Unknown IDs are left out.
+        """
+        with self._lock:
+            self._revalidate()
+            return {quest_id: self._copy(self._quests[quest_id])
+                    for quest_id in quest_ids if quest_id in self._quests}
+
+    def get_all(self) -> list[Quest]:
+        """Get all quests as a list of Quest objects.
+
+        Returns:
+            list[Quest]: A list of all Quest objects.
+        """
+        with self._lock:
+            self._revalidate()
+            return [self._copy(quest) for quest in self._quests.values()]
+
+    def iter_all(self) -> Iterator[Quest]:
+        """Iterate over copies of all cached quests, copying one at a time.
+
+        Yields:
+            Quest: Each quest, in catalog order.
+        """
+        with self._lock:
+            self._revalidate()
+            quests = list(self._quests.values())
+
+        for quest in quests:
+            yield self._copy(quest)
+
+    def iter_by_stat(self, stat_name: str) -> Iterator[Quest]:
+        """Iterate over copies of the quests of a specific stat, from the stat index.
+
+        Args:
+            stat_name (str): The name of the stat to filter quests by.
+        Yields:
+            Quest: Each matching quest, in catalog order.
+        """
+        with self._lock:
+            self._revalidate()
+            quests = [self._quests[quest_id] for quest_id in self._index.query(stat=stat_name)]
+
+        for quest in quests:
+            yield self._copy(quest)
+
+    def update(self, quest: Quest) -> bool:
+        """Update an existing quest. Returns True if found and updated.
+
+        Args:
+            quest (Quest): The Quest object with updated data.
+        Returns:
+            bool: True if the quest was found and updated, False otherwise.
+        """
+        with self._lock:
+            was_current = self._is_current()
+            if not self.repository.update(quest):
+                return False
+            self._store(quest)
+            self._after_write(was_current)
+            return True
+
+    def delete(self, quest_id: str) -> bool:
+        """Delete a quest by its ID. Returns True if found and deleted.
+
+        Args:
+            quest_id (str): The ID of the quest to delete.
+        Returns:
+            bool: True if the quest was found and deleted, False otherwise.
+        """
+        with self._lock:
+            was_current = self._is_current()
+            if not self.repository.delete(quest_id):
+                return False
+            self._quests.pop(quest_id, None)
+            self._index.remove(quest_id)
+            self._after_write(was_current)
+            return True
+
+    def get_by_stat(self, stat_name: str) -> list[Quest]:
+        """Get all quests for a specific stat.
+
+        Args:
+            stat_name (str): The name of the stat to filter quests by.
+        Returns:
+            list[Quest]: A list of Quest objects that match the stat.
+        """
+        return self.find(stat=stat_name)
+
+    def get_by_difficulty(self, difficulty: QuestDifficulty) -> list[Quest]:
+        """Get all quests with a specific difficulty.
+
+        Args:
+            difficulty (QuestDifficulty): The difficulty to filter quests by.
+        Returns:
+            list[Quest]: A list of Quest objects with that difficulty.
+        """
+        return self.find(difficulty=difficulty)
+
+    def find(self, stat: str | None = None, difficulty: QuestDifficulty | None = None,
+             min_xp: int | None = None, max_xp: int | None = None,
+             min_gold: int | None = None, max_gold: int | None = None) -> list[Quest]:
+        """Get all quests matching every given filter, answered from the indexes.
+
+        Args:
+            stat (str | None): Stat name to match.
+            difficulty (QuestDifficulty | None): Difficulty to match.
+            min_xp (int | None): Minimum XP reward (inclusive).
+            max_xp (int | None): Maximum XP reward (inclusive).
+            min_gold (int | None): Minimum gold reward (inclusive).
+            max_gold (int | None): Maximum gold reward (inclusive).
+        Returns:
+            list[Quest]: A list of Quest objects that match all filters.
+        """
+        with self._lock:
+            self._revalidate()
+            quest_ids = self._index.query(stat, difficulty, min_xp, max_xp, min_gold, max_gold)
+            return [self._copy(self._quests[quest_id]) for quest_id in quest_ids]
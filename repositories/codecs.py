@@ -0,0 +1,339 @@
+"""Serialization codecs shared by the file-based repositories.
+
+A codec turns plain Python data (dicts, lists, strings, numbers) into bytes
+and back. Repositories read and write whole files through a codec, so the
+on-disk format can be switched by configuration without touching them.
+
+Available codecs:
+    json     Compact stdlib JSON (default)
+    fast     JSON through orjson or msgspec, whichever is installed
+    msgpack  MessagePack binary format (requires msgpack)
+"""
+
+import json
+from abc import ABC, abstractmethod
+from codecs import getincrementaldecoder
+from collections.abc import Iterator
+from typing import Any, BinaryIO
+
+from repositories.file_lock import atomic_write
+
+# Bytes read at a time when iterating over a file incrementally
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class CodecError(ValueError):
+    """Raised when a codec cannot decode its input."""
+
+
+class Codec(ABC):
+    """Base class of the serialization codecs.
+
+    Attributes:
+        name: Name the codec is selected by
+        extension: File extension used for files written with this codec
+        supports_lines: Whether encoded values never contain a newline, so
+            records can be stored one per line (JSON Lines style)
+    """
+
+    name: str = ""
+    extension: str = ""
+    supports_lines: bool = False
+
+    @abstractmethod
+    def dumps(self, data: Any) -> bytes:
+        """Encode data to bytes."""
+
+    @abstractmethod
+    def loads(self, raw: bytes) -> Any:
+        """
+        Decode bytes produced by dumps().
+
+        Raises:
+            CodecError: If the input is not valid for this codec
+        """
+
+    def iter_object(self, file: BinaryIO) -> Iterator[tuple[Any, Any]]:
+        """
+        Iterate over the (key, value) pairs of an encoded top-level mapping.
+
+        Codecs that can decode incrementally only hold one entry in memory
+        at a time; the default decodes the whole file first.
+
+        Raises:
+            CodecError: If the input is not a valid mapping for this codec
+        """
+        data = self.loads(file.read())
+        if not isinstance(data, dict):
+            raise CodecError("Expected a mapping at the top level")
+        yield from data.items()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class JsonCodec(Codec):
+    """Compact JSON through the standard library json module."""
+
+    name = "json"
+    extension = ".json"
+    supports_lines = True
+
+    def dumps(self, data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def loads(self, raw: bytes) -> Any:
+        try:
+            return json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError) as error:
+            raise CodecError(str(error)) from error
+
+    def iter_object(self, file: BinaryIO) -> Iterator[tuple[Any, Any]]:
+        return _JsonObjectReader(file).items()
+
+
+class _JsonObjectReader:
+    """Incremental reader of the members of a top-level JSON object.
+
+    The file is read in STREAM_CHUNK_SIZE pieces and each member value is
+    decoded as soon as it is complete, so memory stays bounded by one chunk
+    plus the largest value.
+    """
+
+    _WHITESPACE = " \t\n\r"
+
+    def __init__(self, file: BinaryIO) -> None:
+        self._file = file
+        self._decoder = json.JSONDecoder()
+        self._text = getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        try:
+            if self._peek() != "{":
+                raise CodecError("Expected a JSON object at the top level")
+            self._pos += 1
+            if self._peek() == "}":
+                return
+
+            while True:
+                self._peek()
+                key = self._value()
+                if self._peek() != ":":
+                    raise CodecError(f"Expected ':' after key {key!r}")
+                self._pos += 1
+                self._peek()
+                yield key, self._value()
+
+                separator = self._peek()
+                if separator == "}":
+                    return
+                if separator != ",":
+                    raise CodecError("Expected ',' or '}' between object members")
+                self._pos += 1
+        except UnicodeDecodeError as error:
+            raise CodecError(str(error)) from error
+
+    def _fill(self) -> bool:
+        """Read the next chunk, dropping what was already consumed. Returns False at EOF."""
+        if self._eof:
+            return False
+        chunk = self._file.read(STREAM_CHUNK_SIZE)
+        self._eof = not chunk
+        self._buffer = self._buffer[self._pos:] + self._text.decode(chunk, final=self._eof)
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str | None:
+        """Skip whitespace and return the next character, or None at EOF."""
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in self._WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return None
+
+    def _value(self) -> Any:
+        """Decode the JSON value starting at the current position, reading more input as needed."""
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # A value ending exactly at the buffer end may continue in the next chunk
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError as error:
+                if self._eof:
+                    raise CodecError(str(error)) from error
+            if not self._fill():
+                raise CodecError("Unexpected end of JSON input")
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON through orjson. Incremental iteration uses the stdlib reader."""
+
+    name = "fast"
+    extension = ".json"
+    supports_lines = True
+
+    def __init__(self) -> None:
+        import orjson
+        self._orjson = orjson
+
+    def dumps(self, data: Any) -> bytes:
+        return self._orjson.dumps(data)
+
+    def loads(self, raw: bytes) -> Any:
+        try:
+            return self._orjson.loads(raw)
+        except self._orjson.JSONDecodeError as error:
+            raise CodecError(str(error)) from error
+
+
+class MsgspecJsonCodec(JsonCodec):
+    """JSON through msgspec. Incremental iteration uses the stdlib reader."""
+
+    name = "fast"
+    extension = ".json"
+    supports_lines = True
+
+    def __init__(self) -> None:
+        import msgspec
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, data: Any) -> bytes:
+        return self._encoder.encode(data)
+
+    def loads(self, raw: bytes) -> Any:
+        try:
+            return self._decoder.decode(raw)
+        except self._msgspec.DecodeError as error:
+            raise CodecError(str(error)) from error
+
+
+class MsgpackCodec(Codec):
+    """MessagePack binary format through msgpack."""
+
+    name = "msgpack"
+    extension = ".msgpack"
+    supports_lines = False
+
+    def __init__(self) -> None:
+        import msgpack
+        self._msgpack = msgpack
+
+    def dumps(self, data: Any) -> bytes:
+        return self._msgpack.packb(data, use_bin_type=True)
+
+    def loads(self, raw: bytes) -> Any:
+        try:
+            return self._msgpack.unpackb(raw, raw=False)
+        except (ValueError, self._msgpack.UnpackException) as error:
+            raise CodecError(str(error)) from error
+
+    def iter_object(self, file: BinaryIO) -> Iterator[tuple[Any, Any]]:
+        unpacker = self._msgpack.Unpacker(file, raw=False, read_size=STREAM_CHUNK_SIZE)
+        try:
+            size = unpacker.read_map_header()
+            for _ in range(size):
+                key = unpacker.unpack()
+                yield key, unpacker.unpack()
+        except (ValueError, self._msgpack.UnpackException, self._msgpack.OutOfData) as error:
+            raise CodecError(str(error)) from error
+
+
+JSON_CODEC = JsonCodec()
+
+CODEC_NAMES = ("json", "fast", "msgpack")
+
+
+def get_codec(name: str) -> Codec:
+    """
+    Get a codec by name.
+
+    Args:
+        name (str): One of CODEC_NAMES
+
+    Returns:
+        Codec: The codec instance
+
+    Raises:
+        ValueError: If the codec is unknown or its library is not installed
+    """
+    name = name.lower()
+
+    if name == "json":
+        return JSON_CODEC
+
+    if name == "fast":
+        try:
+            return OrjsonCodec()
+        except ImportError:
+            pass
+        try:
+            return MsgspecJsonCodec()
+        except ImportError:
+            raise ValueError("The 'fast' codec requires orjson or msgspec to be installed")
+
+    if name == "msgpack":
+        try:
+            return MsgpackCodec()
+        except ImportError:
+            raise ValueError("The 'msgpack' codec requires msgpack to be installed")
+
+    raise ValueError(f"Unknown storage codec: {name}")
+
+
+def available_codecs() -> list[Codec]:
+    """Get every codec whose library is installed."""
+    codecs = []
+    for name in CODEC_NAMES:
+        try:
+            codecs.append(get_codec(name))
+        except ValueError:
+            continue
+    return codecs
+
+
+def codec_for_extension(extension: str) -> Codec:
+    """
+    Get a codec that reads files written with the given extension.
+
+    Raises:
+        ValueError: If no codec writes that extension, or its library is not installed
+    """
+    if extension == JsonCodec.extension:
+        return JSON_CODEC
+    if extension == MsgpackCodec.extension:
+        return get_codec("msgpack")
+    raise ValueError(f"No storage codec writes {extension} files")
+
+
+# Extensions of the files written by any codec
+CODEC_EXTENSIONS = (JsonCodec.extension, MsgpackCodec.extension)
+
+
+def transcode(source_path: str, source_codec: Codec, target_path: str, target_codec: Codec) -> None:
+    """
+    Rewrite a whole-file data file in another codec, e.g. after changing HUNTER_STORAGE_CODEC.
+
+    The target is written atomically; the source is left in place.
+
+    Args:
+        source_path (str): File to read
+        source_codec (Codec): Codec the source file is written in
+        target_path (str): File to create or replace
+        target_codec (Codec): Codec to write the target file in
+    """
+    with open(source_path, 'rb') as file:
+        data = source_codec.loads(file.read())
+
+    atomic_write(target_path, target_codec.dumps(data))
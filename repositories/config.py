@@ -0,0 +1,66 @@
+"""
+Storage configuration for the file-based repositories.
+Environment variables select the data directory and storage modes.
+"""
+import os
+
+
+class StorageConfig:
+    """Storage configuration class for the JSON and SQLite repositories."""
+    
+    def __init__(self):
+        self.DATA_DIR: str = os.getenv("HUNTER_DATA_DIR", "data")
+        
+        # Repository backend: "file" (JSON files in DATA_DIR) or "sqlite" (embedded database)
+        self.STORAGE_BACKEND: str = os.getenv("HUNTER_STORAGE_BACKEND", "file").lower()
+        self.SQLITE_PATH: str = os.getenv("HUNTER_SQLITE_PATH", os.path.join(self.DATA_DIR, "hunter.db"))
+        self.SQLITE_SYNCHRONOUS: str = os.getenv("HUNTER_SQLITE_SYNCHRONOUS", "NORMAL").upper()
+        
+        # File format of the repositories: "json", "fast" (orjson/msgspec) or "msgpack"
+        self.STORAGE_CODEC: str = os.getenv("HUNTER_STORAGE_CODEC", "json").lower()
+        
+        # Quest catalog storage: "json" (whole-file rewrite) or "journal" (append-only journal)
+        self.QUEST_STORAGE_MODE: str = os.getenv("QUEST_STORAGE_MODE", "json").lower()
+        self.JOURNAL_COMPACT_THRESHOLD: int = int(os.getenv("QUEST_JOURNAL_COMPACT_THRESHOLD", "1000"))
+        self.JOURNAL_FSYNC: bool = os.getenv("QUEST_JOURNAL_FSYNC", "True").lower() == "true"
+        
+        # Keep parsed quests in memory, revalidated against file changes
+        self.QUEST_CACHE_ENABLED: bool = os.getenv("QUEST_CACHE_ENABLED", "True").lower() == "true"
+        
+        # Quest log storage: "jsonl" (JSON Lines) or "binary" (fixed-width records, needs numpy)
+        self.QUEST_LOG_STORAGE_MODE: str = os.getenv("QUEST_LOG_STORAGE_MODE", "jsonl").lower()
+        
+        # Completions recorded to the quest log by a background writer, in batches
+        self.QUEST_LOG_ENABLED: bool = os.getenv("QUEST_LOG_ENABLED", "True").lower() == "true"
+        self.QUEST_LOG_QUEUE_SIZE: int = int(os.getenv("QUEST_LOG_QUEUE_SIZE", "10000"))
+        self.QUEST_LOG_BATCH_SIZE: int = int(os.getenv("QUEST_LOG_BATCH_SIZE", "256"))
+        self.QUEST_LOG_MAX_DELAY_MS: float = float(os.getenv("QUEST_LOG_MAX_DELAY_MS", "50"))
+        
+        # Completions between two hunter snapshots used to rebuild state from the quest log
+        self.HUNTER_SNAPSHOT_INTERVAL: int = int(os.getenv("HUNTER_SNAPSHOT_INTERVAL", "1000"))
+        
+        # Hunters kept loaded by the multi-hunter file store
+        self.HUNTER_CACHE_SIZE: int = int(os.getenv("HUNTER_CACHE_SIZE", "1024"))
+        
+        # Seconds between two rebuilds of the leaderboards from storage, to pick up
+        # the completions of other workers; 0 rebuilds them only on startup
+        self.LEADERBOARD_REFRESH_SECONDS: float = float(os.getenv("LEADERBOARD_REFRESH_SECONDS", "60"))
+        
+        # Group commit of hunter saves and quest log appends
+        self.GROUP_COMMIT_ENABLED: bool = os.getenv("GROUP_COMMIT_ENABLED", "False").lower() == "true"
+        self.GROUP_COMMIT_MAX_DELAY_MS: float = float(os.getenv("GROUP_COMMIT_MAX_DELAY_MS", "2"))
+        self.GROUP_COMMIT_MAX_BATCH: int = int(os.getenv("GROUP_COMMIT_MAX_BATCH", "512"))
+        self.GROUP_COMMIT_FSYNC: bool = os.getenv("GROUP_COMMIT_FSYNC", "True").lower() == "true"
+    
+    def data_path(self, filename: str) -> str:
+        """
+        Build the path of a data file inside the data directory.
+        
+        Returns:
+            str: Path to the data file
+        """
+        return os.path.join(self.DATA_DIR, filename)
+
+
+# Singleton instance
+storage_config = StorageConfig()
@@ -1,15 +1,42 @@
 """
 QuestLog repository using PostgreSQL + SQLAlchemy.
+
+Completion counts and reward totals are answered from the quest_log_rollups
+table (daily and weekly buckets per hunter and stat) plus the quest logs not
+rolled up yet, so they cost one read per bucket instead of one per
+completion. log_completion rolls each new log up in the same transaction;
+rows inserted around the repository (e.g. by database.migrate_data) are
+rolled up by backfill_rollups:
+
+    python -m database.backfill_rollups [--url ...] [--batch-size 1000]
 """
-from typing import List, Optional
-from datetime import datetime, timedelta
+from collections import defaultdict
+from typing import Iterable, List, Optional
+from datetime import date, datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, select, union_all, update, false
+from sqlalchemy.dialects import postgresql, sqlite
 
-from database.models import QuestLogModel
+from database.models import QuestLogModel, QuestLogRollupModel, QuestModel
+from database.models.quest_log_rollup_model import ROLLUP_PERIODS
 from repositories.db.base_repository import BaseRepository
 
 
+# Dialects with INSERT ... ON CONFLICT DO UPDATE, so concurrent completions
+# add to a bucket atomically
+UPSERT_DIALECTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def bucket_start(day: date, period: str) -> date:
+    """First day of the day or week (starting on Monday) bucket holding a day."""
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    return day
+
+
 class QuestLogRepositoryDB(BaseRepository[QuestLogModel]):
     """
     QuestLog repository with database persistence.
@@ -73,9 +100,7 @@ class QuestLogRepositoryDB(BaseRepository[QuestLogModel]):
         Returns:
             Total completion count
         """
-        return self.session.query(QuestLogModel).filter(
-            QuestLogModel.hunter_id == hunter_id
-        ).count()
+        return self._totals(hunter_id)["completions"]
     
     def get_total_rewards(self, hunter_id: str) -> dict:
         """
@@ -87,37 +112,273 @@ class QuestLogRepositoryDB(BaseRepository[QuestLogModel]):
         Returns:
             Dictionary with total_exp and total_gold
         """
-        result = self.session.query(
-            func.sum(QuestLogModel.exp_gained).label('total_exp'),
-            func.sum(QuestLogModel.gold_gained).label('total_gold')
-        ).filter(
-            QuestLogModel.hunter_id == hunter_id
-        ).first()
-        
+        totals = self._totals(hunter_id)
         return {
-            "total_exp": float(result.total_exp or 0),
-            "total_gold": int(result.total_gold or 0)
+            "total_exp": totals["exp_gained"],
+            "total_gold": totals["gold_gained"]
         }
     
     def log_completion(self, quest_id: str, hunter_id: str, 
-                      exp_gained: float, gold_gained: int) -> QuestLogModel:
+                      exp_gained: float, gold_gained: int,
+                      stat_name: Optional[str] = None) -> QuestLogModel:
         """
-        Create a new quest completion log.
+        Create a new quest completion log and add it to the hunter's rollups.
         
         Args:
             quest_id: The completed quest's ID
             hunter_id: The hunter's ID
             exp_gained: Experience gained
             gold_gained: Gold gained
+            stat_name: Stat of the quest; looked up from the quest when omitted
             
         Returns:
             Created QuestLogModel
         """
+        if stat_name is None:
+            stat_name = self.session.query(QuestModel.stat_name).filter(
+                QuestModel.id == quest_id
+            ).scalar()
+        
         log = QuestLogModel(
             quest_id=quest_id,
             hunter_id=hunter_id,
             exp_gained=exp_gained,
             gold_gained=gold_gained,
-            completed_at=datetime.utcnow()
+            completed_at=datetime.utcnow(),
+            # Without a stat the log stays in the unrolled tail
+            rolled_up=stat_name is not None
+        )
+        
+        try:
+            self.session.add(log)
+            if log.rolled_up:
+                self._add_to_rollups([(hunter_id, stat_name, log.completed_at, exp_gained, gold_gained)])
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        
+        self.session.refresh(log)
+        return log
+    
+    def get_rollups(self, hunter_id: str, period: str = "day",
+                    start: Optional[date] = None, end: Optional[date] = None) -> List[dict]:
+        """
+        Get a hunter's totals per bucket and stat, including logs not rolled up yet.
+        
+        Args:
+            hunter_id: The hunter's ID
+            period: Bucket size, "day" or "week"
+            start: First bucket to include (by its first day); unbounded when omitted
+            end: Last bucket to include (by its first day); unbounded when omitted
+            
+        Returns:
+            List of dictionaries with bucket_start, stat_name, completions,
+            exp_gained and gold_gained, oldest bucket first
+            
+        Raises:
+            ValueError: If the period is not "day" or "week"
+        """
+        if period not in ROLLUP_PERIODS:
+            raise ValueError(f"Unknown rollup period '{period}', expected one of {ROLLUP_PERIODS}")
+        
+        query = self.session.query(QuestLogRollupModel).filter(
+            QuestLogRollupModel.hunter_id == hunter_id,
+            QuestLogRollupModel.period == period
+        )
+        if start is not None:
+            query = query.filter(QuestLogRollupModel.bucket_start >= start)
+        if end is not None:
+            query = query.filter(QuestLogRollupModel.bucket_start <= end)
+        
+        buckets = defaultdict(lambda: [0, 0.0, 0])
+        for rollup in query:
+            bucket = buckets[(rollup.bucket_start, rollup.stat_name)]
+            bucket[0] += rollup.completions
+            bucket[1] += rollup.exp_gained
+            bucket[2] += rollup.gold_gained
+        
+        tail = self.session.query(
+            QuestModel.stat_name,
+            QuestLogModel.completed_at,
+            QuestLogModel.exp_gained,
+            QuestLogModel.gold_gained
+        ).join(QuestModel, QuestModel.id == QuestLogModel.quest_id).filter(
+            QuestLogModel.hunter_id == hunter_id,
+            QuestLogModel.rolled_up == false()
+        )
+        for stat_name, completed_at, exp, gold in tail:
+            first_day = bucket_start(completed_at.date(), period)
+            if (start is None or first_day >= start) and (end is None or first_day <= end):
+                bucket = buckets[(first_day, stat_name)]
+                bucket[0] += 1
+                bucket[1] += exp
+                bucket[2] += gold
+        
+        return [
+            {
+                "bucket_start": first_day,
+                "stat_name": stat_name,
+                "completions": completions,
+                "exp_gained": float(exp),
+                "gold_gained": int(gold)
+            }
+            for (first_day, stat_name), (completions, exp, gold) in sorted(buckets.items())
+        ]
+    
+    def backfill_rollups(self, batch_size: int = 1000, hunter_id: Optional[str] = None) -> int:
+        """
+        Roll up the quest logs that are not counted in the rollups yet.
+        
+        Each batch claims its logs by flagging them in the same transaction
+        that adds them to the buckets, so the job can be interrupted, rerun
+        or run alongside the API without counting a completion twice.
+        
+        Args:
+            batch_size: Logs rolled up per transaction
+            hunter_id: Only roll up this hunter's logs; all hunters when omitted
+            
+        Returns:
+            Number of quest logs rolled up
+        """
+        total = 0
+        
+        while True:
+            pending = select(QuestLogModel.id).where(QuestLogModel.rolled_up == false())
+            if hunter_id is not None:
+                pending = pending.where(QuestLogModel.hunter_id == hunter_id)
+            
+            claim = update(QuestLogModel).where(
+                QuestLogModel.id.in_(pending.limit(batch_size).scalar_subquery()),
+                QuestLogModel.rolled_up == false()
+            ).values(rolled_up=True).returning(
+                QuestLogModel.hunter_id,
+                QuestLogModel.quest_id,
+                QuestLogModel.completed_at,
+                QuestLogModel.exp_gained,
+                QuestLogModel.gold_gained
+            ).execution_options(synchronize_session=False)
+            
+            try:
+                claimed = self.session.execute(claim).all()
+                if not claimed:
+                    self.session.rollback()
+                    return total
+                
+                quest_ids = {row.quest_id for row in claimed}
+                stat_names = dict(self.session.query(QuestModel.id, QuestModel.stat_name).filter(
+                    QuestModel.id.in_(quest_ids)
+                ).all())
+                self._add_to_rollups(
+                    (row.hunter_id, stat_names[row.quest_id], row.completed_at, row.exp_gained, row.gold_gained)
+                    for row in claimed
+                )
+                self.session.commit()
+            except Exception:
+                self.session.rollback()
+                raise
+            
+            total += len(claimed)
+    
+    # Private methods
+    
+    def _totals(self, hunter_id: str) -> dict:
+        """
+        Completions, XP and gold of a hunter: its weekly buckets plus its unrolled logs.
+        
+        Both parts are read by a single statement, so a backfill committing in
+        between can neither hide a log nor count it twice.
+        """
+        rolled = select(
+            func.sum(QuestLogRollupModel.completions).label('completions'),
+            func.sum(QuestLogRollupModel.exp_gained).label('exp_gained'),
+            func.sum(QuestLogRollupModel.gold_gained).label('gold_gained')
+        ).where(
+            QuestLogRollupModel.hunter_id == hunter_id,
+            QuestLogRollupModel.period == "week"
+        )
+        tail = select(
+            func.count(QuestLogModel.id),
+            func.sum(QuestLogModel.exp_gained),
+            func.sum(QuestLogModel.gold_gained)
+        ).where(
+            QuestLogModel.hunter_id == hunter_id,
+            QuestLogModel.rolled_up == false()
         )
-        return self.create(log)
\ No newline at end of file
+        parts = union_all(rolled, tail).subquery()
+        
+        result = self.session.execute(select(
+            func.sum(parts.c.completions),
+            func.sum(parts.c.exp_gained),
+            func.sum(parts.c.gold_gained)
+        )).one()
+        
+        return {
+            "completions": int(result[0] or 0),
+            "exp_gained": float(result[1] or 0),
+            "gold_gained": int(result[2] or 0)
+        }
+    
+    def _add_to_rollups(self, logs: Iterable[tuple]) -> None:
+        """
+        Add quest logs to their daily and weekly buckets, within the current transaction.
+        
+        Args:
+            logs: (hunter_id, stat_name, completed_at, exp_gained, gold_gained) tuples
+        """
+        buckets = defaultdict(lambda: [0, 0.0, 0])
+        for hunter_id, stat_name, completed_at, exp, gold in logs:
+            for period in ROLLUP_PERIODS:
+                bucket = buckets[(hunter_id, stat_name, period, bucket_start(completed_at.date(), period))]
+                bucket[0] += 1
+                bucket[1] += exp
+                bucket[2] += gold
+        
+        rows = [
+            {
+                "hunter_id": hunter_id,
+                "stat_name": stat_name,
+                "period": period,
+                "bucket_start": first_day,
+                "completions": completions,
+                "exp_gained": exp,
+                "gold_gained": gold
+            }
+            for (hunter_id, stat_name, period, first_day), (completions, exp, gold) in buckets.items()
+        ]
+        
+        insert = UPSERT_DIALECTS.get(self.session.get_bind().dialect.name)
+        if insert is None:
+            self._add_to_rollups_by_query(rows)
+            return
+        
+        statement = insert(QuestLogRollupModel)
+        table = QuestLogRollupModel.__table__
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.hunter_id, table.c.stat_name, table.c.period, table.c.bucket_start],
+            set_={
+                "completions": table.c.completions + statement.excluded.completions,
+                "exp_gained": table.c.exp_gained + statement.excluded.exp_gained,
+                "gold_gained": table.c.gold_gained + statement.excluded.gold_gained,
+                "updated_at": datetime.utcnow()
+            }
+        )
+        self.session.execute(statement, rows)
+    
+    def _add_to_rollups_by_query(self, rows: List[dict]) -> None:
+        """Add to the buckets one at a time, for dialects without an upsert."""
+        for row in rows:
+            rollup = self.session.query(QuestLogRollupModel).filter(
+                QuestLogRollupModel.hunter_id == row["hunter_id"],
+                QuestLogRollupModel.stat_name == row["stat_name"],
+                QuestLogRollupModel.period == row["period"],
+                QuestLogRollupModel.bucket_start == row["bucket_start"]
+            ).with_for_update().first()
+            
+            if rollup is None:
+                self.session.add(QuestLogRollupModel(**row))
+                self.session.flush()
+            else:
+                rollup.completions += row["completions"]
+                rollup.exp_gained += row["exp_gained"]
+                rollup.gold_gained += row["gold_gained"]
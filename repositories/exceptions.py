@@ -0,0 +1,13 @@
+"""Exceptions raised by the file repositories."""
+
+
+class ConcurrentUpdateError(Exception):
+    """Raised when saving data that another writer changed since it was loaded."""
+
+    def __init__(self, filepath: str, expected_version: int, stored_version: int):
+        self.filepath = filepath
+        self.expected_version = expected_version
+        self.stored_version = stored_version
+        super().__init__(
+            f"{filepath} is at version {stored_version}, expected {expected_version}; reload and retry"
+        )
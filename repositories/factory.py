@@ -0,0 +1,272 @@
+"""
+Repository factory.
+Builds the file-based or SQLite repositories selected by the storage configuration.
+
+Whole-file data written in another codec than HUNTER_STORAGE_CODEC (hunter
+profiles and the quest catalog) is converted to it before the first file
+repository of the process is built, so changing the codec never orphans data.
+"""
+import logging
+import os
+
+from repositories.activity_rollup_repository import ActivityRollupRepository
+from repositories.cached_quest_repository import CachedQuestRepository
+from repositories.codecs import CODEC_EXTENSIONS, JSON_CODEC, Codec, codec_for_extension, get_codec, transcode
+from repositories.config import StorageConfig, storage_config
+from repositories.file_lock import get_file_lock
+from repositories.group_commit import GroupCommitWriter
+from repositories.hunter_repository import HunterRepository
+from repositories.hunter_snapshot_repository import HunterSnapshotRepository
+from repositories.hunter_store import HunterStore
+from repositories.journaled_quest_repository import JournaledQuestRepository
+from repositories.quest_log_repository import QuestLogRepository
+from repositories.quest_repository import QuestRepository
+from repositories.sqlite import (
+    HunterRepositorySQLite,
+    QuestLogRepositorySQLite,
+    QuestRepositorySQLite,
+    SQLiteDatabase,
+)
+
+
+# Shared by every repository of the process, so their writes are grouped together
+_group_commit_writer: GroupCommitWriter | None = None
+
+# One SQLite connection manager per database file
+_sqlite_databases: dict[str, SQLiteDatabase] = {}
+
+# Shared by the API routes, so they use one cache of loaded hunters
+_hunter_store: HunterStore | HunterRepositorySQLite | None = None
+
+# (DATA_DIR, codec name) pairs whose files were already converted by this process
+_converted_codecs: set[tuple[str, str]] = set()
+
+logger = logging.getLogger(__name__)
+
+
+def _use_sqlite(config: StorageConfig) -> bool:
+    """
+    Whether the SQLite backend is selected.
+    
+    Raises:
+        ValueError: If HUNTER_STORAGE_BACKEND is not a known backend
+    """
+    if config.STORAGE_BACKEND not in ("file", "sqlite"):
+        raise ValueError(f"Unknown storage backend: {config.STORAGE_BACKEND}")
+    return config.STORAGE_BACKEND == "sqlite"
+
+
+def get_sqlite_database(config: StorageConfig = storage_config) -> SQLiteDatabase:
+    """Get the process-wide SQLite database for HUNTER_SQLITE_PATH."""
+    database = _sqlite_databases.get(config.SQLITE_PATH)
+    if database is None:
+        database = _sqlite_databases[config.SQLITE_PATH] = SQLiteDatabase(
+            config.SQLITE_PATH, synchronous=config.SQLITE_SYNCHRONOUS)
+    return database
+
+
+def convert_storage_codec(config: StorageConfig = storage_config) -> list[str]:
+    """
+    Rewrite the hunter profiles and quest catalog stored in another codec in HUNTER_STORAGE_CODEC.
+
+    Each file is transcoded next to the original, which is removed once the
+    new file is in place. The catalog's journals hold JSON in every codec and
+    are only renamed. Runs under a file lock, so processes starting together
+    convert each file once.
+
+    Returns:
+        list[str]: Paths of the files converted
+
+    Raises:
+        ValueError: If the codec is unknown, a file was written with a codec
+            that is not installed, or a file exists in both codecs (e.g. a
+            conversion interrupted by a crash) and has to be resolved by hand
+    """
+    codec = get_codec(config.STORAGE_CODEC)
+    if _use_sqlite(config) or not os.path.isdir(config.DATA_DIR):
+        return []
+
+    converted = []
+    with get_file_lock(config.data_path(".storage_codec")):
+        for extension in CODEC_EXTENSIONS:
+            if extension == codec.extension:
+                continue
+
+            for source_path in _codec_files(config, extension):
+                target_path = source_path[:-len(extension)] + codec.extension
+                journals = [(source_path + suffix, target_path + suffix)
+                            for suffix in (".journal", ".journal.old") if os.path.exists(source_path + suffix)]
+
+                for path in [target_path] + [target for _, target in journals]:
+                    if os.path.exists(path):
+                        raise ValueError(f"{source_path} and {path} both exist; keep one of them "
+                                         f"before starting with HUNTER_STORAGE_CODEC={config.STORAGE_CODEC}")
+
+                if os.path.exists(source_path):
+                    transcode(source_path, codec_for_extension(extension), target_path, codec)
+                for journal_path, target_journal_path in journals:
+                    os.replace(journal_path, target_journal_path)
+                if os.path.exists(source_path):
+                    os.remove(source_path)
+                converted.append(source_path)
+
+    for path in converted:
+        logger.info("Converted %s to the %s codec", path, codec.name)
+    return converted
+
+
+def _codec_files(config: StorageConfig, extension: str) -> list[str]:
+    """Paths of the whole-file data files written with the given extension, including catalogs only journaled so far."""
+    paths = [
+        path for path in (config.data_path("hunter" + extension), config.data_path("quests" + extension))
+        if any(os.path.exists(path + suffix) for suffix in ("", ".journal", ".journal.old"))
+    ]
+
+    hunters_directory = config.data_path("hunters")
+    if os.path.isdir(hunters_directory):
+        for shard in os.scandir(hunters_directory):
+            if shard.is_dir():
+                paths.extend(entry.path for entry in os.scandir(shard.path) if entry.name.endswith(extension))
+
+    return paths
+
+
+def _storage_codec(config: StorageConfig) -> Codec:
+    """Get the configured codec, converting files stored in another codec the first time."""
+    key = (config.DATA_DIR, config.STORAGE_CODEC)
+    if key not in _converted_codecs:
+        convert_storage_codec(config)
+        _converted_codecs.add(key)
+    return get_codec(config.STORAGE_CODEC)
+
+
+def get_group_commit_writer(config: StorageConfig = storage_config) -> GroupCommitWriter | None:
+    """Get the process-wide group-commit writer, or None when GROUP_COMMIT_ENABLED is off."""
+    global _group_commit_writer
+    
+    if not config.GROUP_COMMIT_ENABLED:
+        return None
+    
+    if _group_commit_writer is None:
+        _group_commit_writer = GroupCommitWriter(
+            max_delay=config.GROUP_COMMIT_MAX_DELAY_MS / 1000,
+            max_batch=config.GROUP_COMMIT_MAX_BATCH,
+            fsync=config.GROUP_COMMIT_FSYNC
+        )
+    
+    return _group_commit_writer
+
+
+def close_group_commit_writer() -> None:
+    """Flush and stop the group-commit writer, if one was started."""
+    global _group_commit_writer
+    
+    if _group_commit_writer is not None:
+        _group_commit_writer.close()
+        _group_commit_writer = None
+
+
+def create_hunter_repository(config: StorageConfig = storage_config):
+    """Create the hunter profile repository for the configured backend."""
+    if _use_sqlite(config):
+        return HunterRepositorySQLite(get_sqlite_database(config))
+    
+    codec = _storage_codec(config)
+    return HunterRepository(config.data_path("hunter" + codec.extension), codec,
+                            get_group_commit_writer(config))
+
+
+def get_hunter_store(config: StorageConfig = storage_config) -> HunterStore | HunterRepositorySQLite:
+    """
+    Get the process-wide store of every hunter's profile, for the configured backend.
+    Use for_hunter(hunter_id) on it to get the repository of one hunter.
+
+    The file store keeps the default hunter in the single-profile file of
+    create_hunter_repository() and every other hunter under DATA_DIR/hunters.
+    """
+    global _hunter_store
+
+    if _hunter_store is None:
+        if _use_sqlite(config):
+            _hunter_store = HunterRepositorySQLite(get_sqlite_database(config))
+        else:
+            codec = _storage_codec(config)
+            _hunter_store = HunterStore(
+                config.data_path("hunters"),
+                codec,
+                cache_size=config.HUNTER_CACHE_SIZE,
+                default_path=config.data_path("hunter" + codec.extension),
+                writer=get_group_commit_writer(config)
+            )
+
+    return _hunter_store
+
+
+def create_quest_repository(config: StorageConfig = storage_config):
+    """
+    Create the quest catalog repository for the configured backend and storage mode.
+    File repositories are wrapped in the in-process cache when QUEST_CACHE_ENABLED is set.
+    
+    Raises:
+        ValueError: If HUNTER_STORAGE_BACKEND, QUEST_STORAGE_MODE or HUNTER_STORAGE_CODEC is not known
+    """
+    if _use_sqlite(config):
+        return QuestRepositorySQLite(get_sqlite_database(config))
+    
+    codec = _storage_codec(config)
+    filepath = config.data_path("quests" + codec.extension)
+    
+    if config.QUEST_STORAGE_MODE == "json":
+        repository = QuestRepository(filepath, codec)
+    elif config.QUEST_STORAGE_MODE == "journal":
+        repository = JournaledQuestRepository(
+            filepath,
+            compact_threshold=config.JOURNAL_COMPACT_THRESHOLD,
+            fsync=config.JOURNAL_FSYNC,
+            codec=codec
+        )
+    else:
+        raise ValueError(f"Unknown quest storage mode: {config.QUEST_STORAGE_MODE}")
+    
+    if config.QUEST_CACHE_ENABLED:
+        return CachedQuestRepository(repository)
+    
+    return repository
+
+
+def create_quest_log_repository(config: StorageConfig = storage_config):
+    """
+    Create the quest completion log repository for the configured backend and storage mode.
+    The JSON Lines log uses the storage codec when it is line-oriented and
+    compact JSON otherwise.
+    
+    Raises:
+        ValueError: If HUNTER_STORAGE_BACKEND, QUEST_LOG_STORAGE_MODE or HUNTER_STORAGE_CODEC is not known
+    """
+    if _use_sqlite(config):
+        return QuestLogRepositorySQLite(get_sqlite_database(config))
+    
+    if config.QUEST_LOG_STORAGE_MODE == "jsonl":
+        codec = get_codec(config.STORAGE_CODEC)
+        return QuestLogRepository(
+            config.data_path("quest_logs.jsonl"),
+            codec if codec.supports_lines else JSON_CODEC,
+            get_group_commit_writer(config)
+        )
+    
+    if config.QUEST_LOG_STORAGE_MODE == "binary":
+        # Imported here so numpy is only required when the binary store is used
+        from repositories.binary_quest_log_repository import BinaryQuestLogRepository
+        return BinaryQuestLogRepository(config.data_path("quest_logs.bin"))
+    
+    raise ValueError(f"Unknown quest log storage mode: {config.QUEST_LOG_STORAGE_MODE}")
+
+
+def create_hunter_snapshot_repository(config: StorageConfig = storage_config) -> HunterSnapshotRepository:
+    """Create the repository of hunter snapshots taken over the quest log, for every backend."""
+    return HunterSnapshotRepository(config.data_path("hunter_snapshots.jsonl"))
+
+
+def create_activity_rollup_repository(config: StorageConfig = storage_config) -> ActivityRollupRepository:
+    """Create the repository of per-hunter daily activity rollups, for every backend."""
+    return ActivityRollupRepository(config.data_path("activity_rollups.json"))
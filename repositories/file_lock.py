@@ -0,0 +1,119 @@
+"""Cross-process file locking and atomic file replacement for the file repositories.
+
+Locks are advisory `fcntl.flock` locks taken on a `<file>.lock` sidecar, so
+every process going through the repositories (API workers, the CLI) agrees
+on who may read-modify-write a data file. On platforms without fcntl the
+lock still serializes threads of the current process.
+"""
+
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class FileLock:
+    """Reentrant exclusive lock on a data file, shared across threads and processes.
+
+    Use get_file_lock() rather than creating instances directly, so that every
+    repository of a process uses the same lock object for a given file.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path (str): Path of the data file to protect; the lock file is `<path>.lock`
+        """
+        self.lock_path = path + ".lock"
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._owner: int | None = None
+        self._fd: int | None = None
+
+    def acquire(self) -> None:
+        """Block until the lock is held by the calling thread."""
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+            except BaseException:
+                self._thread_lock.release()
+                raise
+            self._fd = fd
+            self._owner = threading.get_ident()
+        self._depth += 1
+
+    def release(self) -> None:
+        """Release one level of the lock."""
+        self._depth -= 1
+        if self._depth == 0:
+            fd, self._fd = self._fd, None
+            self._owner = None
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+        self._thread_lock.release()
+
+    def held_by_current_thread(self) -> bool:
+        """Whether the calling thread holds the lock."""
+        return self._owner == threading.get_ident()
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
+
+
+_locks: dict[str, FileLock] = {}
+_locks_guard = threading.Lock()
+
+
+def get_file_lock(path: str) -> FileLock:
+    """
+    Get the process-wide lock of a data file.
+
+    Args:
+        path (str): Path of the data file
+
+    Returns:
+        FileLock: The same instance for every call with the same file
+    """
+    key = os.path.abspath(path)
+    with _locks_guard:
+        lock = _locks.get(key)
+        if lock is None:
+            lock = _locks[key] = FileLock(path)
+        return lock
+
+
+def atomic_write(path: str, data: bytes, fsync: bool = True) -> None:
+    """
+    Replace a file's contents atomically: readers see either the old or the new file, never a partial one.
+
+    The data is written to a temporary file in the same directory, optionally
+    fsynced, and renamed over the target.
+
+    Args:
+        path (str): File to replace
+        data (bytes): New contents
+        fsync (bool): Whether to flush the data to disk before the rename
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as file:
+            file.write(data)
+            if fsync:
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
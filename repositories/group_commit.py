@@ -0,0 +1,252 @@
+"""Group commit for the file repositories.
+
+Under bursty load every request used to pay for its own open/write/fsync.
+GroupCommitWriter collects the writes submitted by concurrent callers during
+a short window and persists them together: appends to the same file become
+a single write, successive whole-file replacements of the same file collapse
+into the newest one, and each touched file is fsynced once per flush. Callers
+block on a Future that resolves only after their data is on disk (or after
+the flush containing it failed).
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from contextlib import nullcontext
+from typing import BinaryIO
+
+from repositories.file_lock import FileLock, atomic_write
+
+
+class _Replace:
+    """Pending whole-file replacement of one file."""
+
+    __slots__ = ("data", "lock", "preconditions", "futures")
+
+    def __init__(self, data: bytes, lock: FileLock | None) -> None:
+        self.data = data
+        self.lock = lock
+        self.preconditions: list[Callable[[], None]] = []
+        self.futures: list[Future] = []
+
+
+class _Append:
+    """Pending appends to one file."""
+
+    __slots__ = ("chunks", "lock", "separator", "futures")
+
+    def __init__(self, lock: FileLock | None, separator: Callable[[BinaryIO], bytes] | None) -> None:
+        self.chunks: list[bytes] = []
+        self.lock = lock
+        self.separator = separator
+        self.futures: list[Future] = []
+
+
+class GroupCommitWriter:
+    """Background writer that persists concurrent writes in batches.
+
+    Attributes:
+        max_delay: Seconds a flush waits after its first write for more to join (latency bound)
+        max_batch: Pending writes that trigger a flush before max_delay elapses
+        fsync: Whether each flushed file is fsynced before callers are released
+        batches / requests: Number of flushes and of writes they carried
+    """
+
+    def __init__(self, max_delay: float = 0.002, max_batch: int = 512, fsync: bool = True) -> None:
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self.fsync = fsync
+
+        self.batches = 0
+        self.requests = 0
+
+        self._cond = threading.Condition()
+        self._replaces: dict[str, _Replace] = {}
+        self._appends: dict[str, _Append] = {}
+        self._count = 0
+        # Newest replacement data per file, until it is flushed
+        self._unflushed: dict[str, bytes] = {}
+        self._closing = False
+
+        self._thread = threading.Thread(target=self._run, name="group-commit-writer", daemon=True)
+        self._thread.start()
+
+    # Public methods
+
+    def replace(self, path: str, data: bytes, lock: FileLock | None = None,
+                precondition: Callable[[], None] | None = None) -> Future:
+        """
+        Schedule an atomic replacement of a file's contents.
+
+        If a replacement of the same file is already waiting, the new data
+        supersedes it and both callers are released by the same write.
+
+        Args:
+            path (str): File to replace
+            data (bytes): New contents
+            lock (FileLock | None): Lock held while the file is written
+            precondition (Callable | None): Called under the lock right before
+                writing; if it raises, the write is skipped and every caller
+                waiting on it receives the exception. When replacements are
+                merged, every one of their preconditions must pass.
+
+        Returns:
+            Future: Resolves to None once the data is persisted
+        """
+        future = Future()
+        with self._cond:
+            self._check_open()
+            pending = self._replaces.get(path)
+            if pending is None:
+                pending = self._replaces[path] = _Replace(data, lock)
+            else:
+                pending.data = data
+            if precondition is not None:
+                pending.preconditions.append(precondition)
+            pending.futures.append(future)
+            self._unflushed[path] = data
+            self._submitted()
+        return future
+
+    def append(self, path: str, data: bytes, lock: FileLock | None = None,
+               separator: Callable[[BinaryIO], bytes] | None = None) -> Future:
+        """
+        Schedule bytes to be appended to a file.
+
+        Appends to the same file are written in submission order with one
+        write. If that write fails, the file is truncated back to its previous
+        size and every caller receives the error, so a retry appends nothing twice.
+
+        Args:
+            path (str): File to append to
+            data (bytes): Bytes to append
+            lock (FileLock | None): Lock held while the file is written
+            separator (Callable | None): Called with the file opened in 'ab+'
+                mode before writing; returns bytes to write first (e.g. a
+                newline after a torn record)
+
+        Returns:
+            Future: Resolves to the file offset right after data once it is persisted
+        """
+        future = Future()
+        with self._cond:
+            self._check_open()
+            pending = self._appends.get(path)
+            if pending is None:
+                pending = self._appends[path] = _Append(lock, separator)
+            pending.chunks.append(data)
+            pending.futures.append(future)
+            self._submitted()
+        return future
+
+    def unflushed(self, path: str) -> bytes | None:
+        """Newest replacement data submitted for a file that is not on disk yet, or None."""
+        with self._cond:
+            return self._unflushed.get(path)
+
+    def wait_for(self, path: str) -> None:
+        """Block until every replacement submitted so far for a file has been flushed."""
+        with self._cond:
+            while path in self._unflushed:
+                self._cond.wait()
+
+    def close(self) -> None:
+        """Flush every pending write and stop the writer thread. Later writes raise RuntimeError."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    # Private methods
+
+    def _check_open(self) -> None:
+        if self._closing:
+            raise RuntimeError("GroupCommitWriter is closed")
+
+    def _submitted(self) -> None:
+        """Account for a new pending write. Must hold the condition."""
+        self._count += 1
+        self._cond.notify_all()
+
+    def _run(self) -> None:
+        """Writer loop: wait for a write, let the batch fill for max_delay, flush it."""
+        while True:
+            with self._cond:
+                while self._count == 0 and not self._closing:
+                    self._cond.wait()
+                if self._count == 0:
+                    return
+
+                deadline = time.monotonic() + self.max_delay
+                while self._count < self.max_batch and not self._closing:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                replaces, appends = self._replaces, self._appends
+                self.requests += self._count
+                self.batches += 1
+                self._replaces, self._appends, self._count = {}, {}, 0
+
+            self._flush(replaces, appends)
+
+    def _flush(self, replaces: dict[str, _Replace], appends: dict[str, _Append]) -> None:
+        """Persist one batch and release its callers."""
+        for path, pending in replaces.items():
+            try:
+                with pending.lock or nullcontext():
+                    try:
+                        for precondition in pending.preconditions:
+                            precondition()
+                        atomic_write(path, pending.data, self.fsync)
+                    finally:
+                        # Cleared before the lock is released, so whoever takes it next
+                        # finds the outcome on disk rather than data that was rejected
+                        self._clear_unflushed(path, pending.data)
+                error = None
+            except Exception as exc:
+                error = exc
+                self._clear_unflushed(path, pending.data)
+            self._resolve(pending.futures, error)
+
+        for path, pending in appends.items():
+            try:
+                with pending.lock or nullcontext(), open(path, 'ab+') as file:
+                    size = file.seek(0, os.SEEK_END)
+                    try:
+                        prefix = pending.separator(file) if pending.separator is not None else b""
+                        file.write(prefix + b"".join(pending.chunks))
+                        file.flush()
+                        if self.fsync:
+                            os.fsync(file.fileno())
+                    except BaseException:
+                        # Leave no part of the batch behind, so callers can retry without duplicating it
+                        file.truncate(size)
+                        raise
+                offsets = []
+                end = size + len(prefix)
+                for chunk in pending.chunks:
+                    end += len(chunk)
+                    offsets.append(end)
+                error = None
+            except Exception as exc:
+                offsets, error = None, exc
+            self._resolve(pending.futures, error, offsets)
+
+    def _clear_unflushed(self, path: str, data: bytes) -> None:
+        """Forget the unflushed replacement of a file if data is still the newest one."""
+        with self._cond:
+            if self._unflushed.get(path) is data:
+                del self._unflushed[path]
+            self._cond.notify_all()
+
+    def _resolve(self, futures: list[Future], error: Exception | None, results: list | None = None) -> None:
+        for index, future in enumerate(futures):
+            if error is None:
+                future.set_result(results[index] if results is not None else None)
+            else:
+                future.set_exception(error)
+
@@ -1,12 +1,39 @@
-from entities.hunter import Hunter
+from collections.abc import Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+from functools import partial
+from entities.hunter import DEFAULT_HUNTER_ID, Hunter
+from repositories.codecs import JSON_CODEC, Codec
+from repositories.exceptions import ConcurrentUpdateError
+from repositories.file_lock import atomic_write, get_file_lock
+from repositories.group_commit import GroupCommitWriter
 import os
-import json
 
 class HunterRepository:
 
-    def __init__(self, filepath: str = "data/hunter_profile.json") -> None:
-        """Repository for saving and loading Hunter profiles to/from JSON files."""
+    def __init__(self, filepath: str = "data/hunter_profile.json", codec: Codec = JSON_CODEC,
+                 writer: GroupCommitWriter | None = None, hunter_id: str = DEFAULT_HUNTER_ID) -> None:
+        """Repository for saving and loading Hunter profiles to/from files written with a codec.
+
+        Saves are atomic and guarded by a cross-process file lock. The file
+        carries a version counter: saving a hunter loaded at an older version
+        than the stored one raises ConcurrentUpdateError instead of silently
+        overwriting another writer's changes.
+
+        With a group-commit writer, concurrent saves are persisted together
+        by one write. Saves of the same profile made before the previous one
+        is flushed build on it and are coalesced: only the latest state is
+        written, with one fsync. Loads first wait for a pending save of the
+        profile to be persisted, so they only ever read a durable file.
+
+        hunter_id identifies the stored profile to services that keep
+        per-hunter state.
+        """
         self.filepath = filepath
+        self.hunter_id = hunter_id
+        self.codec = codec
+        self.writer = writer
+        self.lock = get_file_lock(filepath)
         self._ensure_data_directory()
 
     def _ensure_data_directory(self) -> None:
@@ -17,6 +44,22 @@ class HunterRepository:
             os.makedirs(dir_path)
             
 
+    def for_hunter(self, hunter_id: str) -> "HunterRepository":
+        """Get the repository of a hunter; a profile file only stores its own hunter.
+
+        Raises:
+            ValueError: If hunter_id is not the hunter stored in this file
+        """
+        if hunter_id != self.hunter_id:
+            raise ValueError(f"Unknown hunter: {hunter_id}")
+        return self
+
+    def iter_hunters(self) -> Iterator[tuple[str, Hunter]]:
+        """Iterate over the stored hunter as a (hunter_id, Hunter) pair, if the profile exists."""
+        data = self._read_data()
+        if data is not None:
+            yield self.hunter_id, self._dict_to_hunter(data)
+
     def _hunter_to_dict(self, hunter: Hunter) -> dict:
         """Create a base dictionary with simple data from a Hunter object."""
         data = {
@@ -43,27 +86,150 @@ class HunterRepository:
 
         hunter = Hunter(name)
         hunter.gold = gold
+        hunter.version = data.get("version", 0)
 
         for stat_name, stat_data in data["stats"].items():
             hunter.stats[stat_name].total_xp = stat_data["total_xp"]
         
         return hunter
     
-    def save(self, hunter: Hunter) -> None:
-        """Save a Hunter object to a JSON file."""
+    def _read_data(self) -> dict | None:
+        """Read the raw profile data, or None if the file does not exist.
+
+        A save still waiting in the group-commit writer is waited for, so
+        nothing that is not on disk yet is returned. Must not be called with
+        the lock held while a save may be pending, as the flush needs it.
+        """
+        if self.writer is not None:
+            self.writer.wait_for(self.filepath)
+
+        return self._read_file()
+
+    def _read_file(self) -> dict | None:
+        """Read the raw profile data from disk, or None if the file does not exist."""
+        if not os.path.exists(self.filepath):
+            return None
+
+        with open(self.filepath, 'rb') as file:
+            return self.codec.loads(file.read())
+
+    def _expect_stored_version(self, versions: tuple[int, ...], after: Future | None = None) -> None:
+        """Raise ConcurrentUpdateError unless the profile on disk is at one of `versions` and `after` was not rejected."""
+        stored = self._read_file()
+        stored_version = stored.get("version", 0) if stored is not None else 0
+        if stored_version not in versions or self._failed(after):
+            raise ConcurrentUpdateError(self.filepath, versions[-1], stored_version)
+
+    @staticmethod
+    def _failed(future: Future | None) -> bool:
+        """Whether a save's Future is resolved with an error."""
+        return future is not None and future.done() and future.exception() is not None
+
+    @contextmanager
+    def transaction(self):
+        """Hold the profile lock, so a load-modify-save sequence cannot interleave with other writers.
+
+        Usage:
+            with repository.transaction():
+                hunter = repository.load()
+                ...
+                repository.save(hunter)
+        """
+        # Saves inside the transaction are written directly, so start from a flushed file
+        with self._flushed_lock():
+            yield
+
+    @contextmanager
+    def _flushed_lock(self):
+        """Hold the profile lock with no save of the profile pending in the group-commit writer."""
+        if self.writer is None or self.lock.held_by_current_thread():
+            with self.lock:
+                yield
+            return
+
+        while True:
+            self.writer.wait_for(self.filepath)
+            self.lock.acquire()
+            if self.writer.unflushed(self.filepath) is None:
+                break
+            self.lock.release()
+        try:
+            yield
+        finally:
+            self.lock.release()
+
+    def save(self, hunter: Hunter, wait: bool = True, after: Future | None = None) -> Future | None:
+        """Save a Hunter object to the profile file.
+
+        With a group-commit writer the save is queued. A save of this
+        profile still waiting to be flushed is superseded when the hunter
+        builds on it, and both are released by the same write, so bursts of
+        saves of one profile cost one write and one fsync. Inside
+        transaction() the file is written directly.
+
+        Args:
+            hunter: Hunter to save, as loaded or as passed to a previous save
+            wait: Return only once the save is persisted; otherwise return its Future
+            after: Future of the save the hunter builds on, if it may not be persisted
+                yet; this save is rejected if that one is
+
+        Returns:
+            The Future of a queued save when wait is False, else None
+
+        Raises:
+            ConcurrentUpdateError: If the stored profile changed since the hunter
+                was loaded, or the save in after was rejected. The hunter must then
+                be reloaded. With wait=False, a rejection at flush time is raised by the Future.
+        """
+        if self.writer is None or self.lock.held_by_current_thread():
+            with self._flushed_lock():
+                stored = self._read_file()
+                self._check_version(hunter, stored.get("version", 0) if stored is not None else 0, after)
+                atomic_write(self.filepath, self._encode(hunter))
+            return None
+
+        # The writer needs the lock to flush, so a pending save cannot be written while it is held
+        with self.lock:
+            stored = self._read_file()
+            stored_version = stored.get("version", 0) if stored is not None else 0
+            pending = self.writer.unflushed(self.filepath)
+            current_version = self.codec.loads(pending).get("version", 0) if pending is not None else stored_version
+            self._check_version(hunter, current_version, after)
+
+            # The pending save is either superseded by this one, so the file stays at
+            # stored_version, or flushed first. Another process may write the file
+            # before the flush; the write is then rejected.
+            future = self.writer.replace(self.filepath, self._encode(hunter), self.lock,
+                                         partial(self._expect_stored_version, (stored_version, current_version), after))
+
+        if not wait:
+            return future
+        future.result()
+        return None
+
+    def _check_version(self, hunter: Hunter, current_version: int, after: Future | None = None) -> None:
+        """Raise ConcurrentUpdateError unless the hunter is at the current profile version and `after` was not rejected."""
+        if current_version != hunter.version or self._failed(after):
+            raise ConcurrentUpdateError(self.filepath, hunter.version, current_version)
+
+    def _encode(self, hunter: Hunter) -> bytes:
+        """Encode the hunter at its next version, and move it to that version."""
         data = self._hunter_to_dict(hunter)
-        with open(self.filepath, 'w') as file:
-            json.dump(data, file, indent = 2)
+        data["version"] = hunter.version + 1
+        hunter.version += 1
+        return self.codec.dumps(data)
 
     def load(self) -> Hunter:
-        """Load a Hunter object from a JSON file."""
-        if not os.path.exists(self.filepath):
-            default_hunter = Hunter("Player")
-            self.save(default_hunter)
-            return default_hunter
-        
-        with open(self.filepath, 'r') as file:
-            data = json.load(file)
+        """Load a Hunter object from the profile file."""
+        data = self._read_data()
+        if data is None:
+            with self._flushed_lock():
+                # Another process or thread may have created the profile while we waited
+                data = self._read_file()
+                if data is None:
+                    default_hunter = Hunter("Player")
+                    self.save(default_hunter)
+                    return default_hunter
             
         hunter = self._dict_to_hunter(data)
 
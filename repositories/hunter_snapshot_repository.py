@@ -0,0 +1,118 @@
+"""HunterSnapshot repository for JSON Lines persistence."""
+
+import json
+import os
+from bisect import bisect_right
+from datetime import datetime
+
+from entities.hunter_snapshot import HunterSnapshot
+from repositories.file_lock import get_file_lock
+
+class HunterSnapshotRepository:
+    """Stores hunter snapshots as JSON Lines, one snapshot per line.
+
+    Snapshots are kept in memory per hunter, in quest log order (by
+    `position`, which also orders their `until`), so the one to start a
+    replay from is found by binary search. Lines appended by other processes
+    are picked up on the next read. Snapshots written before they recorded
+    their quest log position are ignored.
+    """
+
+    def __init__(self, filepath: str = "data/hunter_snapshots.jsonl"):
+        """Initialize repository with file path.
+        Args:
+            filepath (str): Path to the JSON Lines file.
+        """
+
+        self.filepath = filepath
+        self.lock = get_file_lock(filepath)
+        self._snapshots: dict[str, list[HunterSnapshot]] = {}
+        self._untils: dict[str, list[datetime]] = {}
+        self._offset = 0
+        self._ensure_data_directory()
+
+    def _ensure_data_directory(self) -> None:
+        """Create data directory if it doesn't exist."""
+        dir_path = os.path.dirname(self.filepath)
+        if dir_path and not os.path.exists(dir_path):
+            os.makedirs(dir_path)
+
+    def _catch_up(self) -> None:
+        """Read snapshot lines appended since the last read."""
+        try:
+            size = os.path.getsize(self.filepath)
+        except FileNotFoundError:
+            size = 0
+
+        if size == self._offset:
+            return
+
+        with self.lock:
+            if size < self._offset:
+                # The file was cleared or replaced; start over
+                self._snapshots, self._untils, self._offset = {}, {}, 0
+            if size == 0:
+                return
+
+            with open(self.filepath, 'rb') as file:
+                file.seek(self._offset)
+                for line in file:
+                    if not line.endswith(b"\n"):
+                        break
+                    self._offset += len(line)
+                    if line.strip():
+                        data = json.loads(line)
+                        if "position" in data:
+                            self._insert(HunterSnapshot.from_dict(data))
+
+    def _insert(self, snapshot: HunterSnapshot) -> None:
+        """Add a snapshot to its hunter's in-memory list, ignoring duplicates and out-of-order ones."""
+        snapshots = self._snapshots.setdefault(snapshot.hunter_id, [])
+        untils = self._untils.setdefault(snapshot.hunter_id, [])
+
+        # Snapshots are appended under the lock, each after the latest one of its hunter
+        if snapshots and snapshot.position <= snapshots[-1].position:
+            return
+        snapshots.append(snapshot)
+        untils.append(snapshot.until)
+
+    def add(self, snapshot: HunterSnapshot) -> None:
+        """Append a snapshot.
+        Args:
+            snapshot (HunterSnapshot): The snapshot to store.
+        """
+
+        with self.lock:
+            self._catch_up()
+            with open(self.filepath, 'ab') as file:
+                file.write(json.dumps(snapshot.to_dict()).encode() + b"\n")
+            self._catch_up()
+
+    def at_or_before(self, hunter_id: str, moment: datetime | None = None) -> HunterSnapshot | None:
+        """Get a hunter's latest snapshot whose `until` is at or before moment, by binary search.
+        Args:
+            hunter_id (str): Hunter the snapshot covers.
+            moment (datetime | None): Point in time, or None for the latest snapshot.
+        Returns:
+            HunterSnapshot | None: The snapshot, or None if there is none that early.
+        """
+
+        self._catch_up()
+        snapshots = self._snapshots.get(hunter_id, [])
+        untils = self._untils.get(hunter_id, [])
+        index = len(untils) if moment is None else bisect_right(untils, moment)
+        return snapshots[index - 1] if index > 0 else None
+
+    def count(self, hunter_id: str | None = None) -> int:
+        """Number of stored snapshots of a hunter, or of every hunter when hunter_id is None."""
+        self._catch_up()
+        if hunter_id is not None:
+            return len(self._snapshots.get(hunter_id, []))
+        return sum(len(snapshots) for snapshots in self._snapshots.values())
+
+    def clear(self) -> None:
+        """Delete every snapshot, e.g. after the quest log was rewritten."""
+        with self.lock:
+            if os.path.exists(self.filepath):
+                os.remove(self.filepath)
+            self._snapshots, self._untils, self._offset = {}, {}, 0
@@ -0,0 +1,226 @@
+"""Multi-hunter profile store for the file backend.
+
+Each hunter is kept in its own profile file, so loading or saving one hunter
+costs the same however many hunters there are. Files are spread over 256
+shard directories (`<directory>/<2 hex chars>/<hunter id><ext>`) to keep
+directories small. The default hunter keeps the single-profile file used
+before the store existed, so existing data and the CLI are unaffected.
+
+Loaded hunters are kept in an LRU cache. A cached hunter is only served
+while its file is unchanged (same inode, size and modification time), so
+saves made by other processes are picked up on the next load; serving a hit
+costs one stat() instead of a read and decode. File timestamps are coarse,
+so like git's racy-entry check, a hunter read from a file modified less than
+RACY_WINDOW_NS before it was cached is never served from the cache.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+from entities.hunter import DEFAULT_HUNTER_ID, HUNTER_ID_PATTERN, Hunter
+from repositories.codecs import JSON_CODEC, Codec
+from repositories.group_commit import GroupCommitWriter
+from repositories.hunter_repository import HunterRepository
+
+# Identifies one version of a profile file: (inode, size, mtime in ns)
+FileSignature = tuple[int, int, int]
+
+# A save within this long of a read may not change the file's signature
+RACY_WINDOW_NS = 50_000_000
+
+
+class HunterStore:
+    """Hunter profiles keyed by hunter id, one file each, with an LRU of loaded hunters.
+
+    Attributes:
+        directory: Root of the shard directories
+        cache_size: Most hunters kept in the LRU cache
+    """
+
+    def __init__(self, directory: str = "data/hunters", codec: Codec = JSON_CODEC,
+                 cache_size: int = 1024, default_path: str | None = None,
+                 writer: GroupCommitWriter | None = None) -> None:
+        """
+        Args:
+            directory (str): Root of the shard directories
+            codec (Codec): Codec of the profile files
+            cache_size (int): Most hunters kept in the LRU cache
+            default_path (str | None): Profile file of the default hunter, if it
+                lives outside the shard directories
+            writer (GroupCommitWriter | None): Batches concurrent profile saves into one flush
+        """
+        self.directory = directory
+        self.codec = codec
+        self.cache_size = cache_size
+        self.default_path = default_path
+        self.writer = writer
+
+        # hunter id -> (signature of the file read, time it was read in ns, hunter)
+        self._cache: OrderedDict[str, tuple[FileSignature, int, Hunter]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    # Public methods
+
+    def path_for(self, hunter_id: str) -> str:
+        """
+        Get the profile file of a hunter.
+
+        Raises:
+            ValueError: If the hunter id is not valid
+        """
+        if not HUNTER_ID_PATTERN.fullmatch(hunter_id):
+            raise ValueError(f"Invalid hunter id: {hunter_id!r}")
+
+        if hunter_id == DEFAULT_HUNTER_ID and self.default_path is not None:
+            return self.default_path
+
+        shard = hashlib.sha1(hunter_id.encode()).hexdigest()[:2]
+        return os.path.join(self.directory, shard, hunter_id + self.codec.extension)
+
+    def for_hunter(self, hunter_id: str) -> "StoredHunterRepository":
+        """
+        Get a repository of one hunter, with the load/save/transaction interface of HunterRepository.
+
+        Raises:
+            ValueError: If the hunter id is not valid
+        """
+        self.path_for(hunter_id)
+        return StoredHunterRepository(self, hunter_id)
+
+    def load(self, hunter_id: str) -> Hunter:
+        """Load a hunter, creating a default profile on first use. The caller gets its own copy."""
+        repository = self._repository(hunter_id)
+        # Taken before reading, so a save racing with the read only makes the entry look stale
+        signature = self._signature(repository.filepath)
+        read_at = time.time_ns()
+
+        with self._cache_lock:
+            entry = self._cache.get(hunter_id)
+            if entry is not None and entry[0] == signature and signature[2] + RACY_WINDOW_NS < entry[1]:
+                self._cache.move_to_end(hunter_id)
+                self._hits += 1
+                return entry[2].copy()
+            self._misses += 1
+
+        hunter = repository.load()
+        self._remember(hunter_id, signature, read_at, hunter.copy())
+        return hunter
+
+    def save(self, hunter_id: str, hunter: Hunter, wait: bool = True, after: Future | None = None) -> Future | None:
+        """
+        Save a hunter to its profile file; wait and after are as for HunterRepository.save().
+
+        Returns:
+            Future | None: The Future of a queued save when wait is False, else None
+
+        Raises:
+            ConcurrentUpdateError: If the stored profile changed since the hunter
+                was loaded. The hunter must then be reloaded.
+        """
+        # The saved file is too recent to be trusted by signature; the next load reads it
+        self._forget(hunter_id)
+        return self._repository(hunter_id).save(hunter, wait, after)
+
+    @contextmanager
+    def transaction(self, hunter_id: str):
+        """Hold a hunter's profile lock for a load-modify-save sequence."""
+        with self._repository(hunter_id).transaction():
+            yield
+
+    def iter_hunters(self) -> Iterator[tuple[str, Hunter]]:
+        """
+        Iterate over every stored hunter as (hunter_id, Hunter) pairs.
+        Files are read directly, without going through the cache.
+        """
+        if self.default_path is not None:
+            yield from self._repository(DEFAULT_HUNTER_ID).iter_hunters()
+
+        if not os.path.isdir(self.directory):
+            return
+
+        for shard in sorted(os.scandir(self.directory), key=lambda entry: entry.name):
+            if not shard.is_dir():
+                continue
+            for entry in sorted(os.scandir(shard.path), key=lambda entry: entry.name):
+                hunter_id, extension = os.path.splitext(entry.name)
+                if extension != self.codec.extension or not HUNTER_ID_PATTERN.fullmatch(hunter_id):
+                    continue
+                yield from self._repository(hunter_id).iter_hunters()
+
+    def stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: cached hunters, cache_size, hits, misses, evictions and hit_rate
+        """
+        with self._cache_lock:
+            lookups = self._hits + self._misses
+            return {
+                "cached": len(self._cache),
+                "cache_size": self.cache_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": self._hits / lookups if lookups else 0.0
+            }
+
+    # Private methods
+
+    def _repository(self, hunter_id: str) -> HunterRepository:
+        """Single-profile repository over a hunter's file."""
+        return HunterRepository(self.path_for(hunter_id), self.codec, self.writer, hunter_id=hunter_id)
+
+    @staticmethod
+    def _signature(filepath: str) -> FileSignature | None:
+        """Identify the current version of a file, or None if it does not exist."""
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def _remember(self, hunter_id: str, signature: FileSignature | None, read_at: int, hunter: Hunter) -> None:
+        """Cache a hunter as read at read_at from the file version identified by signature."""
+        if signature is None or self.cache_size <= 0:
+            return
+
+        with self._cache_lock:
+            self._cache[hunter_id] = (signature, read_at, hunter)
+            self._cache.move_to_end(hunter_id)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+
+    def _forget(self, hunter_id: str) -> None:
+        with self._cache_lock:
+            self._cache.pop(hunter_id, None)
+
+
+class StoredHunterRepository:
+    """One hunter of a HunterStore, behind the interface of HunterRepository."""
+
+    def __init__(self, store: HunterStore, hunter_id: str) -> None:
+        self.store = store
+        self.hunter_id = hunter_id
+
+    def load(self) -> Hunter:
+        return self.store.load(self.hunter_id)
+
+    def save(self, hunter: Hunter, wait: bool = True, after: Future | None = None) -> Future | None:
+        return self.store.save(self.hunter_id, hunter, wait, after)
+
+    def transaction(self):
+        return self.store.transaction(self.hunter_id)
+
+    def for_hunter(self, hunter_id: str) -> "StoredHunterRepository":
+        return self.store.for_hunter(hunter_id)
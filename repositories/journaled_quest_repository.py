@@ -0,0 +1,289 @@
+"""Journaled Quest Repository for JSON persistence.
+
+Mutations are appended as small JSON Lines records to a journal next to the
+base quests file instead of rewriting the whole catalog. Reads replay the
+base file plus the journal tail, and once the journal grows past a threshold
+a background thread compacts it into a new base file written atomically.
+"""
+
+import os
+import threading
+from collections.abc import Iterator
+
+from entities.quest import Quest
+from repositories.codecs import JSON_CODEC, Codec
+from repositories.file_lock import atomic_write, get_file_lock
+from repositories.quest_repository import QuestRepository
+
+
+class JournaledQuestRepository(QuestRepository):
+    """QuestRepository storing mutations in an append-only journal.
+
+    Files used, for a base file `quests.json`:
+        quests.json              Compacted base (same format as QuestRepository)
+        quests.json.journal      Records appended since the last compaction
+        quests.json.journal.old  Journal being compacted (only during compaction)
+
+    The base file is written with the repository codec. Journal records use
+    it too when it is line-oriented, and compact JSON otherwise.
+
+    Appends hold the catalog's cross-process file lock, and compactions hold a
+    separate lock, so several processes can share the files: writers are not
+    blocked while a new base file is being written.
+
+    Journal records are idempotent `put`/`delete` operations, so replaying a
+    journal over a base that already contains it is harmless: a crash at any
+    point of a compaction leaves a state that replays correctly.
+    """
+
+    def __init__(self, filepath: str = "data/quests.json", compact_threshold: int = 1000,
+                 fsync: bool = True, codec: Codec = JSON_CODEC) -> None:
+        """Initialize repository with file path and journal settings.
+
+        Args:
+            filepath (str): Path to the base file.
+            compact_threshold (int): Journal records that trigger a background compaction.
+            fsync (bool): Whether each journal append is fsynced before returning.
+            codec (Codec): Codec of the base file.
+        """
+        super().__init__(filepath, codec)
+        self.journal_codec = codec if codec.supports_lines else JSON_CODEC
+        self.journal_path = filepath + ".journal"
+        self.old_journal_path = self.journal_path + ".old"
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+
+        self._lock = threading.RLock()
+        self._compact_lock = get_file_lock(self.old_journal_path)
+        self._compactor: threading.Thread | None = None
+
+        # Replayed state and where it was read up to
+        self._state: dict = {}
+        self._base_version = 0
+        self._base_signature = None
+        self._journal_inode = None
+        self._journal_offset = 0
+        self._journal_records = 0
+        self._loaded = False
+
+    # Private methods
+
+    def _load_all_data(self) -> dict:
+        """Return the replayed catalog (base + journal), catching up on new journal records.
+
+        Journal records replace whole entries, so a shallow copy taken under the
+        lock is a stable snapshot that callers may iterate and mutate.
+
+        Returns:
+            dict: A dictionary with quest_id as keys and quest data as values.
+        """
+        with self._lock:
+            self._catch_up()
+            return dict(self._state)
+
+    def _storage_files(self) -> list[str]:
+        """Paths of the base file and both journals."""
+        return [self.filepath, self.journal_path, self.old_journal_path]
+
+    def _catch_up(self) -> None:
+        """Bring the in-memory state up to date with the files on disk.
+
+        Only new journal records are read when the base and journal are the
+        ones already replayed; anything else (first load, a compaction by this
+        or another process) triggers a full replay.
+        """
+        base_signature = self._file_signature(self.filepath)
+        journal_signature = self._file_signature(self.journal_path)
+        journal_inode = journal_signature[0] if journal_signature else None
+
+        if (self._loaded and base_signature == self._base_signature
+                and journal_inode == self._journal_inode):
+            if journal_signature and journal_signature[2] > self._journal_offset:
+                self._journal_offset, count = self._replay(
+                    self.journal_path, self._journal_offset, self._state)
+                self._journal_records += count
+            return
+
+        # Full replay; retried if a compaction swapped files while they were being read
+        while True:
+            state, base_version = self._read_catalog()
+            if os.path.exists(self.old_journal_path):
+                self._replay(self.old_journal_path, 0, state)
+            offset, count = self._replay(self.journal_path, 0, state)
+
+            signatures = (self._file_signature(self.filepath), self._file_signature(self.journal_path))
+            current_inode = signatures[1][0] if signatures[1] else None
+            if signatures[0] == base_signature and current_inode == journal_inode:
+                break
+            base_signature = signatures[0]
+            journal_inode = current_inode
+
+        self._state = state
+        self._base_version = base_version
+        self._base_signature = base_signature
+        self._journal_inode = journal_inode
+        self._journal_offset = offset
+        self._journal_records = count
+        self._loaded = True
+
+    def _replay(self, path: str, offset: int, state: dict) -> tuple[int, int]:
+        """Apply the complete journal records of `path` found after `offset` to `state`.
+
+        A trailing record without a newline is a torn write and is ignored.
+
+        Returns:
+            tuple[int, int]: Offset after the last complete record, and number of records applied.
+        """
+        if not os.path.exists(path):
+            return 0, 0
+
+        with open(path, 'rb') as file:
+            file.seek(offset)
+            chunk = file.read()
+
+        end = chunk.rfind(b"\n") + 1
+        count = 0
+        for line in chunk[:end].splitlines():
+            if not line.strip():
+                continue
+            self._apply(state, self.journal_codec.loads(line))
+            count += 1
+
+        return offset + end, count
+
+    def _apply(self, state: dict, record: dict) -> None:
+        """Apply a single journal record to a state dict."""
+        if record["op"] == "put":
+            quest_dict = record["quest"]
+            state[quest_dict["id"]] = quest_dict
+        elif record["op"] == "delete":
+            state.pop(record["id"], None)
+
+    def _append(self, record: dict) -> None:
+        """Append one record to the journal and apply it to the in-memory state.
+
+        Must be called with the lock held and the state caught up.
+        """
+        line = self.journal_codec.dumps(record) + b"\n"
+
+        with open(self.journal_path, 'ab') as file:
+            # Drop a torn record left by a crash so the new one starts on its own line
+            if file.tell() > self._journal_offset:
+                file.truncate(self._journal_offset)
+            file.write(line)
+            file.flush()
+            if self.fsync:
+                os.fsync(file.fileno())
+
+        self._apply(self._state, record)
+        self._journal_inode = self._file_signature(self.journal_path)[0]
+        self._journal_offset += len(line)
+        self._journal_records += 1
+
+        if self._journal_records >= self.compact_threshold:
+            self._start_compaction()
+
+    def _start_compaction(self) -> None:
+        """Compact the journal on a background thread unless one is already running."""
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+
+        self._compactor = threading.Thread(
+            target=self.compact, name="quest-journal-compactor", daemon=True)
+        self._compactor.start()
+
+    def _write_base(self, quest_dict: dict, version: int) -> None:
+        """Atomically replace the base file, read at `version`, with the next catalog version.
+
+        Must be called with the compaction lock held, as compactions are the
+        only writers of the base file.
+        """
+        atomic_write(self.filepath, self._encode_catalog(quest_dict, version))
+
+    # Public methods
+
+    def add(self, quest: Quest) -> None:
+        """Add a new quest to the repository.
+
+        Args:
+            quest (Quest): The Quest object to add.
+        """
+        with self._lock, self.lock:
+            self._catch_up()
+            self._append({"op": "put", "quest": self._quest_to_dict(quest)})
+
+    def update(self, quest: Quest) -> bool:
+        """Update an existing quest. Returns True if found and updated.
+
+        Args:
+            quest (Quest): The Quest object with updated data.
+        Returns:
+            bool: True if the quest was found and updated, False otherwise.
+        """
+        with self._lock, self.lock:
+            self._catch_up()
+            if quest.id not in self._state:
+                return False
+            self._append({"op": "put", "quest": self._quest_to_dict(quest)})
+            return True
+
+    def delete(self, quest_id: str) -> bool:
+        """Delete a quest by its ID. Returns True if found and deleted.
+
+        Args:
+            quest_id (str): The ID of the quest to delete.
+        Returns:
+            bool: True if the quest was found and deleted, False otherwise.
+        """
+        with self._lock, self.lock:
+            self._catch_up()
+            if quest_id not in self._state:
+                return False
+            self._append({"op": "delete", "id": quest_id})
+            return True
+
+    def iter_all(self) -> Iterator[Quest]:
+        """Iterate over all quests of the replayed catalog.
+
+        The catalog is already held in memory, so this only avoids building
+        every Quest object at once.
+
+        Yields:
+            Quest: Each quest, in catalog order.
+        """
+        with self._lock:
+            self._catch_up()
+            quest_data = list(self._state.values())
+
+        for data in quest_data:
+            yield self._dict_to_quest(data)
+
+    def compact(self) -> None:
+        """Fold the journal into a new base file.
+
+        The journal is rotated aside under the lock so writers can keep
+        appending to a fresh journal while the new base is written; the
+        rotated journal is removed only once the base has been replaced.
+        A rotated journal left behind by a crash is folded in first, without
+        rotating again, so it is never overwritten before reaching the base.
+        """
+        with self._compact_lock:
+            with self._lock, self.lock:
+                self._catch_up()
+                leftover = os.path.exists(self.old_journal_path)
+                if self._journal_records == 0 and not leftover:
+                    return
+                if not leftover and os.path.exists(self.journal_path):
+                    os.replace(self.journal_path, self.old_journal_path)
+                    self._journal_inode = None
+                    self._journal_offset = 0
+                    self._journal_records = 0
+                snapshot = dict(self._state)
+                version = self._base_version
+
+            self._write_base(snapshot, version)
+
+            with self._lock:
+                os.remove(self.old_journal_path)
+                self._base_version = version + 1
+                self._base_signature = self._file_signature(self.filepath)
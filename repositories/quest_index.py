@@ -0,0 +1,154 @@
+"""Secondary indexes over the quest catalog."""
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable
+
+from entities.quest import Quest
+from entities.quest_difficulty import QuestDifficulty
+
+
+def _reward(entry: tuple[int, str]) -> int:
+    """Sort key of a reward index entry."""
+    return entry[0]
+
+
+class QuestIndex:
+    """In-memory secondary indexes for filtering quests.
+
+    Maintains hash indexes by stat and by difficulty, and sorted indexes on
+    xp_reward and gold_reward. Combined queries start from the most selective
+    filter and check the remaining ones on its candidates only, so a query
+    costs O(matches of the most selective filter) rather than O(catalog).
+    Results keep catalog insertion order.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[int, str, QuestDifficulty, int, int]] = {}
+        self._by_stat: dict[str, dict[str, None]] = {}
+        self._by_difficulty: dict[QuestDifficulty, dict[str, None]] = {}
+        self._by_xp: list[tuple[int, str]] = []
+        self._by_gold: list[tuple[int, str]] = []
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @classmethod
+    def build(cls, quests: Iterable[Quest]) -> "QuestIndex":
+        """Index a whole catalog at once, sorting each reward index once instead of inserting into it.
+
+        A quest ID that repeats keeps its first position and its last values, as with add().
+        """
+        index = cls()
+        for quest in quests:
+            previous = index._entries.get(quest.id)
+            if previous is not None:
+                position = previous[0]
+            else:
+                position = index._sequence
+                index._sequence += 1
+            index._entries[quest.id] = (position, quest.stat, quest.difficulty,
+                                        quest.xp_reward, quest.gold_reward)
+
+        for quest_id, (_, stat, difficulty, xp_reward, gold_reward) in index._entries.items():
+            index._by_stat.setdefault(stat, {})[quest_id] = None
+            index._by_difficulty.setdefault(difficulty, {})[quest_id] = None
+            index._by_xp.append((xp_reward, quest_id))
+            index._by_gold.append((gold_reward, quest_id))
+        index._by_xp.sort()
+        index._by_gold.sort()
+        return index
+
+    def add(self, quest: Quest) -> None:
+        """Index a quest, replacing its previous entry if it was already indexed."""
+        previous = self._entries.get(quest.id)
+        if previous is not None:
+            self._unindex(quest.id, previous)
+            position = previous[0]
+        else:
+            position = self._sequence
+            self._sequence += 1
+
+        self._entries[quest.id] = (position, quest.stat, quest.difficulty,
+                                   quest.xp_reward, quest.gold_reward)
+        self._by_stat.setdefault(quest.stat, {})[quest.id] = None
+        self._by_difficulty.setdefault(quest.difficulty, {})[quest.id] = None
+        insort(self._by_xp, (quest.xp_reward, quest.id))
+        insort(self._by_gold, (quest.gold_reward, quest.id))
+
+    def remove(self, quest_id: str) -> None:
+        """Remove a quest from every index. Unknown IDs are ignored."""
+        entry = self._entries.pop(quest_id, None)
+        if entry is not None:
+            self._unindex(quest_id, entry)
+
+    def query(self, stat: str | None = None, difficulty: QuestDifficulty | None = None,
+              min_xp: int | None = None, max_xp: int | None = None,
+              min_gold: int | None = None, max_gold: int | None = None) -> list[str]:
+        """Find the IDs of quests matching every given filter.
+
+        Args:
+            stat: Exact stat name
+            difficulty: Exact difficulty
+            min_xp / max_xp: Inclusive bounds on xp_reward
+            min_gold / max_gold: Inclusive bounds on gold_reward
+
+        Returns:
+            list[str]: Matching quest IDs in catalog insertion order.
+        """
+        candidates = []
+        if stat is not None:
+            bucket = self._by_stat.get(stat, {})
+            candidates.append((len(bucket), bucket))
+        if difficulty is not None:
+            bucket = self._by_difficulty.get(difficulty, {})
+            candidates.append((len(bucket), bucket))
+        if min_xp is not None or max_xp is not None:
+            lo, hi = self._range(self._by_xp, min_xp, max_xp)
+            candidates.append((hi - lo, (quest_id for _, quest_id in self._by_xp[lo:hi])))
+        if min_gold is not None or max_gold is not None:
+            lo, hi = self._range(self._by_gold, min_gold, max_gold)
+            candidates.append((hi - lo, (quest_id for _, quest_id in self._by_gold[lo:hi])))
+
+        if not candidates:
+            return list(self._entries)
+
+        _, driver = min(candidates, key=lambda candidate: candidate[0])
+
+        matches = []
+        for quest_id in driver:
+            position, quest_stat, quest_difficulty, xp_reward, gold_reward = self._entries[quest_id]
+            if stat is not None and quest_stat != stat:
+                continue
+            if difficulty is not None and quest_difficulty != difficulty:
+                continue
+            if (min_xp is not None and xp_reward < min_xp) or (max_xp is not None and xp_reward > max_xp):
+                continue
+            if (min_gold is not None and gold_reward < min_gold) or (max_gold is not None and gold_reward > max_gold):
+                continue
+            matches.append((position, quest_id))
+
+        matches.sort()
+        return [quest_id for _, quest_id in matches]
+
+    # Private methods
+
+    def _unindex(self, quest_id: str, entry: tuple[int, str, QuestDifficulty, int, int]) -> None:
+        """Remove a quest's entry from the secondary indexes (not from _entries)."""
+        _, stat, difficulty, xp_reward, gold_reward = entry
+        self._by_stat[stat].pop(quest_id, None)
+        self._by_difficulty[difficulty].pop(quest_id, None)
+        self._remove_sorted(self._by_xp, (xp_reward, quest_id))
+        self._remove_sorted(self._by_gold, (gold_reward, quest_id))
+
+    def _range(self, index: list[tuple[int, str]], low: int | None, high: int | None) -> tuple[int, int]:
+        """Slice bounds of the entries of a sorted index whose value is within [low, high]."""
+        lo = 0 if low is None else bisect_left(index, low, key=_reward)
+        hi = len(index) if high is None else bisect_right(index, high, key=_reward)
+        return lo, max(lo, hi)
+
+    def _remove_sorted(self, index: list[tuple[int, str]], item: tuple[int, str]) -> None:
+        """Remove an item from a sorted index."""
+        position = bisect_left(index, item)
+        if position < len(index) and index[position] == item:
+            del index[position]
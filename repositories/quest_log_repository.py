@@ -1,70 +1,455 @@
-"""QuestLog Repository for JSON persistence."""
+"""QuestLog Repository for JSON Lines persistence."""
 
 import json
 import os
-from datetime import datetime
+import threading
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from entities.hunter import DEFAULT_HUNTER_ID
 from entities.quest_log import QuestLog
+from repositories.codecs import JSON_CODEC, Codec, CodecError
+from repositories.file_lock import get_file_lock
+from repositories.group_commit import GroupCommitWriter
+from utils.valid_stats import VALID_STATS
+
+# How far a completion may be logged behind one logged before it. Writers
+# append completions with their real timestamps, and concurrent writers
+# (threads of a batch, other processes) can interleave them slightly out of
+# order, so range reads widen their binary search bounds by this much and
+# filter exactly.
+MAX_DISORDER = timedelta(seconds=30)
+
+
+def widen_start(start: datetime) -> datetime:
+    """Earliest timestamp a scan for completions at or after start has to begin at."""
+    return start - MAX_DISORDER if start - datetime.min > MAX_DISORDER else datetime.min
+
+
+def widen_end(end: datetime) -> datetime:
+    """Timestamp past which a scan can stop looking for completions before end."""
+    return end + MAX_DISORDER if datetime.max - end > MAX_DISORDER else datetime.max
+
 
 class QuestLogRepository:
-    """Handles loading and saving QuestLog data to JSON file."""
-    
-    def __init__(self, filepath: str = "data/quest_logs.json"):
+    """Handles loading and saving QuestLog data to a JSON Lines file.
+
+    Each completion is one line, so adding a log appends a single line and
+    reading the most recent logs only reads the end of the file.
+
+    Positions in the log (see iter_from()) are byte offsets. The offsets of
+    each hunter's lines are indexed in memory, so reading one hunter's
+    entries from a position seeks straight to them; the index is extended
+    with the lines appended since it was last used.
+    """
+
+    READ_BLOCK_SIZE = 8192
+
+    def __init__(self, filepath: str = "data/quest_logs.jsonl", codec: Codec = JSON_CODEC,
+                 writer: GroupCommitWriter | None = None):
         """Initialize repository with file path.
+
+        A legacy JSON array file next to it (same name with a .json
+        extension) is converted once, when the JSON Lines file does not exist yet.
         Args:
-            filepath (str): Path to the JSON file.
+            filepath (str): Path to the JSON Lines file.
+            codec (Codec): Line-oriented codec each entry is written with.
+            writer (GroupCommitWriter | None): Batches concurrent appends into one write and fsync.
+        Raises:
+            ValueError: If the codec cannot store one record per line.
         """
 
+        if not codec.supports_lines:
+            raise ValueError(f"The '{codec.name}' codec cannot be used for a line-based quest log")
+
         self.filepath = filepath
+        self.codec = codec
+        self.writer = writer
+        self.lock = get_file_lock(filepath)
+        self._index_lock = threading.Lock()
+        self._hunter_offsets: dict[str, array] = {}
+        self._indexed = 0
+        self._indexed_inode = None
         self._ensure_data_directory()
-    
+        self._convert_legacy_file()
+
     def _ensure_data_directory(self) -> None:
         """Create data directory if it doesn't exist."""
         dir_path = os.path.dirname(self.filepath)
         if dir_path and not os.path.exists(dir_path):
             os.makedirs(dir_path)
-    
-    def add(self, quest_log: QuestLog) -> None:
-        """Add a quest log entry.
-        Args:
-            quest_log (QuestLog): The quest log entry to add.
-        """
 
-        logs = self._load_all()
-        
-        log_dict = {
+    def _convert_legacy_file(self) -> None:
+        """Convert the legacy JSON array log to JSON Lines if this is the first run."""
+        root, extension = os.path.splitext(self.filepath)
+        legacy_path = root + ".json"
+        if extension == ".jsonl" and os.path.exists(legacy_path) and not os.path.exists(self.filepath):
+            with self.lock:
+                if not os.path.exists(self.filepath):
+                    convert_json_to_jsonl(legacy_path, self.filepath)
+
+    def _quest_log_to_dict(self, quest_log: QuestLog) -> dict:
+        """Convert a QuestLog object to a dictionary for JSON serialization."""
+        data = {
             "quest_id": quest_log.quest_id,
+            "hunter_id": quest_log.hunter_id,
             "completed_at": quest_log.completed_at.isoformat(),
             "xp_earned": quest_log.xp_earned,
             "gold_earned": quest_log.gold_earned
         }
-        
-        logs.append(log_dict)
-        self._save_all(logs)
-    
+
+        if quest_log.stat is not None:
+            data["stat"] = quest_log.stat
+
+        return data
+
+    def add(self, quest_log: QuestLog) -> int:
+        """Add a quest log entry by appending one line.
+        Args:
+            quest_log (QuestLog): The quest log entry to add.
+        Returns:
+            int: Log position right after the entry, as for iter_from().
+        """
+
+        return self.add_many([quest_log])
+
+    def add_many(self, quest_logs: list[QuestLog]) -> int:
+        """Add several quest log entries with a single append.
+        Args:
+            quest_logs (list[QuestLog]): The quest log entries to add, in completion order.
+        Returns:
+            int: Log position right after the last entry, as for iter_from().
+        """
+
+        if not quest_logs:
+            return self.end_position()
+
+        lines = b"".join(self.codec.dumps(self._quest_log_to_dict(quest_log)) + b"\n" for quest_log in quest_logs)
+
+        if self.writer is not None:
+            return self.writer.append(self.filepath, lines, self.lock, self._line_separator).result()
+
+        return self._append(lines)
+
+    def _append(self, data: bytes) -> int:
+        """Append lines in one write, removing whatever part of it was written if it fails.
+
+        A failed append then leaves no partial lines behind, so retrying it
+        cannot log an entry twice. Returns the file offset after the lines.
+        """
+        with self.lock, open(self.filepath, 'ab+') as file:
+            size = file.seek(0, os.SEEK_END)
+            try:
+                file.write(self._line_separator(file) + data)
+                file.flush()
+            except BaseException:
+                file.truncate(size)
+                raise
+            return file.tell()
+
+    def end_position(self) -> int:
+        """Position where the next entry will be stored; no append is in progress while it is read."""
+        with self.lock:
+            try:
+                return os.path.getsize(self.filepath)
+            except FileNotFoundError:
+                return 0
+
+    def _line_separator(self, file) -> bytes:
+        """Newline to write first if the file (opened in 'ab+' mode) ends with a torn line."""
+        if file.tell() > 0:
+            file.seek(-1, os.SEEK_END)
+            if file.read(1) != b"\n":
+                return b"\n"
+        return b""
+
+    def _dict_to_quest_log(self, data: dict) -> QuestLog:
+        """Convert a stored log entry back into a QuestLog object.
+        Args:
+            data (dict): The stored quest log entry.
+        Returns:
+            QuestLog: The rebuilt QuestLog, keeping its stored timestamp.
+        """
+
+        return QuestLog.from_record(
+            data["quest_id"],
+            data["xp_earned"],
+            data["gold_earned"],
+            datetime.fromisoformat(data["completed_at"]),
+            data.get("stat"),
+            data.get("hunter_id", DEFAULT_HUNTER_ID)
+        )
+
+    def get_all(self) -> list[QuestLog]:
+        """Get the whole completion history as QuestLog objects, oldest first.
+        Returns:
+            list[QuestLog]: All stored quest logs.
+        """
+
+        return [self._dict_to_quest_log(log) for log in self._load_all()]
+
+    def iter_all(self) -> Iterator[QuestLog]:
+        """Iterate over the completion history one line at a time, oldest first.
+
+        Blank and torn lines are skipped, as in get_all().
+        Yields:
+            QuestLog: Each stored quest log.
+        """
+
+        if not os.path.exists(self.filepath):
+            return
+
+        with open(self.filepath, 'rb') as file:
+            for line in file:
+                for log in self._parse_lines([line]):
+                    yield self._dict_to_quest_log(log)
+
+    def iter_between(self, start: datetime | None = None, end: datetime | None = None,
+                     hunter_id: str | None = None) -> Iterator[QuestLog]:
+        """Iterate over the quest logs completed in [start, end), oldest first.
+
+        Lines are appended in completion order, give or take MAX_DISORDER, so
+        the first line that may be at or after start is found by binary search
+        over byte offsets, and reading stops at the first line MAX_DISORDER
+        past end.
+        Args:
+            start (datetime | None): Inclusive lower bound, or None for the beginning.
+            end (datetime | None): Exclusive upper bound, or None for the end.
+            hunter_id (str | None): Only this hunter's logs, or None for every hunter.
+        Yields:
+            QuestLog: Each quest log in the range.
+        """
+
+        if not os.path.exists(self.filepath):
+            return
+
+        with open(self.filepath, 'rb') as file:
+            if start is not None:
+                file.seek(self._find_offset(file, widen_start(start)))
+            stop = widen_end(end) if end is not None else None
+            for line in file:
+                for log in self._parse_lines([line]):
+                    quest_log = self._dict_to_quest_log(log)
+                    if stop is not None and quest_log.completed_at >= end:
+                        if quest_log.completed_at >= stop:
+                            return
+                        continue
+                    if hunter_id is not None and quest_log.hunter_id != hunter_id:
+                        continue
+                    if start is None or quest_log.completed_at >= start:
+                        yield quest_log
+
+    def iter_from(self, position: int = 0, hunter_id: str | None = None) -> Iterator[tuple[int, QuestLog]]:
+        """Iterate over the quest logs stored at or after a position, in log order.
+
+        A hunter's entries are read through the offset index, skipping the
+        lines of every other hunter.
+        Args:
+            position (int): Position to start at: 0, or one returned by this method.
+            hunter_id (str | None): Only this hunter's logs, or None for every hunter.
+        Yields:
+            tuple[int, QuestLog]: Position right after each quest log, and the quest log.
+        """
+
+        if not os.path.exists(self.filepath):
+            return
+
+        with open(self.filepath, 'rb') as file:
+            if hunter_id is None:
+                file.seek(position)
+                for line in file:
+                    position += len(line)
+                    if not line.endswith(b"\n"):
+                        return
+                    for log in self._parse_lines([line]):
+                        yield position, self._dict_to_quest_log(log)
+                return
+
+            offsets = self._offsets_of(hunter_id)
+            for index in range(bisect_left(offsets, position), len(offsets)):
+                file.seek(offsets[index])
+                line = file.readline()
+                for log in self._parse_lines([line]):
+                    yield offsets[index] + len(line), self._dict_to_quest_log(log)
+
+    def count_from(self, position: int = 0, hunter_id: str | None = None) -> int:
+        """Number of quest logs stored at or after a position, from the offset index.
+        Args:
+            position (int): Position to start at, as for iter_from().
+            hunter_id (str | None): Only this hunter's logs, or None for every hunter.
+        Returns:
+            int: Number of quest logs.
+        """
+
+        if hunter_id is not None:
+            offsets = self._offsets_of(hunter_id)
+            return len(offsets) - bisect_left(offsets, position)
+
+        self._update_index()
+        with self._index_lock:
+            return sum(len(offsets) - bisect_left(offsets, position) for offsets in self._hunter_offsets.values())
+
+    def _offsets_of(self, hunter_id: str) -> array:
+        """Offsets of a hunter's lines, oldest first, as of now."""
+        self._update_index()
+        with self._index_lock:
+            # The index only grows, so a copy of the current length is a stable view
+            offsets = self._hunter_offsets.get(hunter_id)
+            return offsets[:] if offsets is not None else array('q')
+
+    def _update_index(self) -> None:
+        """Index the hunter of every complete line appended since the last update.
+
+        Starts over if the file was replaced or truncated.
+        """
+        try:
+            stat = os.stat(self.filepath)
+        except FileNotFoundError:
+            stat = None
+
+        with self._index_lock:
+            inode = stat.st_ino if stat is not None else None
+            size = stat.st_size if stat is not None else 0
+            if inode != self._indexed_inode or size < self._indexed:
+                self._hunter_offsets, self._indexed, self._indexed_inode = {}, 0, inode
+            if size == self._indexed:
+                return
+
+            with open(self.filepath, 'rb') as file:
+                file.seek(self._indexed)
+                for line in file:
+                    if not line.endswith(b"\n"):
+                        break
+                    for log in self._parse_lines([line]):
+                        hunter_id = log.get("hunter_id", DEFAULT_HUNTER_ID)
+                        offsets = self._hunter_offsets.get(hunter_id)
+                        if offsets is None:
+                            offsets = self._hunter_offsets[hunter_id] = array('q')
+                        offsets.append(self._indexed)
+                    self._indexed += len(line)
+
+    def total_rewards(self, start: datetime | None = None, end: datetime | None = None,
+                      hunter_id: str | None = None) -> dict:
+        """Sum completions, XP and gold over a time range.
+        Args:
+            start (datetime | None): Inclusive lower bound, or None for the beginning.
+            end (datetime | None): Exclusive upper bound, or None for the end.
+            hunter_id (str | None): Only this hunter's logs, or None for every hunter.
+        Returns:
+            dict: completions, total_xp, total_gold and XP per stat.
+        """
+
+        totals = {"completions": 0, "total_xp": 0, "total_gold": 0, "xp_by_stat": dict.fromkeys(VALID_STATS, 0)}
+        for quest_log in self.iter_between(start, end, hunter_id):
+            totals["completions"] += 1
+            totals["total_xp"] += quest_log.xp_earned
+            totals["total_gold"] += quest_log.gold_earned
+            if quest_log.stat in totals["xp_by_stat"]:
+                totals["xp_by_stat"][quest_log.stat] += quest_log.xp_earned
+        return totals
+
+    def _find_offset(self, file, moment: datetime) -> int:
+        """Byte offset to start reading from so no line completed at or after moment is missed.
+
+        Narrows [lo, hi] by probing the first complete line after the midpoint
+        until the window is one read block, which iter_between then scans.
+        """
+
+        lo = 0
+        hi = file.seek(0, os.SEEK_END)
+
+        while hi - lo > self.READ_BLOCK_SIZE:
+            mid = (lo + hi) // 2
+            file.seek(mid - 1)
+            file.readline()
+            line_start = file.tell()
+            line = file.readline()
+
+            logs = self._parse_lines([line])
+            if line_start >= hi or not logs:
+                break
+            if datetime.fromisoformat(logs[0]["completed_at"]) < moment:
+                lo = line_start + len(line)
+            else:
+                hi = line_start
+
+        return lo
+
     def get_recent(self, n: int = 10) -> list[dict]:
-        """Get the N most recent quest logs.
+        """Get the N most recent quest logs, oldest first.
+
+        Reads the file backwards from the end, one block at a time, until N
+        complete lines have been found.
         Args:
             n (int): Number of recent logs to retrieve.
         Returns:
             list[dict]: List of recent quest log entries.
         """
 
-        logs = self._load_all()
+        if n <= 0 or not os.path.exists(self.filepath):
+            return []
+
+        with open(self.filepath, 'rb') as file:
+            position = file.seek(0, os.SEEK_END)
+            buffer = b""
+            logs: list[dict] = []
+
+            while position > 0:
+                size = min(self.READ_BLOCK_SIZE, position)
+                position -= size
+                file.seek(position)
+                buffer = file.read(size) + buffer
+
+                # The first line is only known to be complete at the start of the file
+                if position > 0 and buffer.count(b"\n") <= n:
+                    continue
+                lines = buffer.split(b"\n")
+                logs = self._parse_lines(lines[1:] if position > 0 else lines)
+                if len(logs) >= n:
+                    break
+
         return logs[-n:]
-    
+
+    def _parse_lines(self, lines: list[bytes]) -> list[dict]:
+        """Parse complete JSON lines, skipping blank and torn ones."""
+        logs = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                logs.append(self.codec.loads(line))
+            except CodecError:
+                continue
+        return logs
+
     def _load_all(self) -> list:
-        """Load all quest logs from JSON."""
+        """Load all quest logs from the JSON Lines file."""
         if not os.path.exists(self.filepath):
             return []
-        
-        with open(self.filepath, 'r') as file:
-            return json.load(file)
-    
-    def _save_all(self, logs: list) -> None:
-        """Save all quest logs to JSON.
-        Args:
-            logs (list): List of quest log entries to save.
-        """
-        
-        with open(self.filepath, 'w') as file:
-            json.dump(logs, file, indent=2)
\ No newline at end of file
+
+        with open(self.filepath, 'rb') as file:
+            return self._parse_lines(file.read().split(b"\n"))
+
+
+def convert_json_to_jsonl(json_path: str, jsonl_path: str) -> int:
+    """Convert a legacy quest log stored as a JSON array into JSON Lines.
+
+    The legacy file is left in place.
+    Args:
+        json_path (str): Path to the JSON array file.
+        jsonl_path (str): Path of the JSON Lines file to create.
+    Returns:
+        int: Number of log entries converted.
+    """
+
+    with open(json_path, 'r') as file:
+        logs = json.load(file)
+
+    tmp_path = jsonl_path + ".tmp"
+    with open(tmp_path, 'w') as file:
+        for log in logs:
+            file.write(json.dumps(log) + "\n")
+    os.replace(tmp_path, jsonl_path)
+
+    return len(logs)
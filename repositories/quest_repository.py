@@ -1,11 +1,27 @@
+from collections.abc import Iterator
 from entities.quest import Quest
-from entities.quest_difficulty import QuestDifficulty
+from entities.quest_difficulty import DIFFICULTY_BY_VALUE, QuestDifficulty
+from repositories.codecs import JSON_CODEC, Codec
+from repositories.exceptions import ConcurrentUpdateError
+from repositories.file_lock import atomic_write, get_file_lock
 import os
-import json
 
 class QuestRepository:
-    def __init__(self, filepath: str = "data/quests.json") -> None:
+    """Quest catalog stored as one file mapping quest IDs to quest data.
+
+    Every read-modify-write holds a cross-process file lock and replaces the
+    file atomically. The file also carries a version counter under the
+    reserved META_KEY entry, written first and incremented on every save; a
+    save is rejected with ConcurrentUpdateError if the stored version moved
+    on since the catalog was loaded, e.g. by a writer ignoring the lock.
+    """
+
+    META_KEY = "_meta"
+
+    def __init__(self, filepath: str = "data/quests.json", codec: Codec = JSON_CODEC) -> None:
         self.filepath = filepath
+        self.codec = codec
+        self.lock = get_file_lock(filepath)
         self._ensure_data_directory()
 
     # Private methods
@@ -15,8 +31,24 @@ class QuestRepository:
         if dir_path and not os.path.exists(dir_path):
             os.makedirs(dir_path)
 
+    def _file_signature(self, path: str):
+        """Identity of a file's current contents (inode, mtime, size), or None if it does not exist."""
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _storage_files(self) -> list[str]:
+        """Paths of every file the catalog is stored in."""
+        return [self.filepath]
+
+    def storage_signature(self) -> tuple:
+        """Cheap fingerprint of the stored catalog; changes whenever any storage file changes."""
+        return tuple(self._file_signature(path) for path in self._storage_files())
+
     def _quest_to_dict(self, quest: Quest) -> dict:
-        """Convert a Quest object to a dictionary for JSON serialization.
+        """Convert a Quest object to a dictionary for serialization.
 
         Args:
             quest (Quest): The Quest object to convert.
@@ -45,44 +77,75 @@ class QuestRepository:
             Quest: The constructed Quest object.
         """
 
-        id = data["id"]
-        name = data["name"]
-        stat = data["stat"]
-        difficulty = QuestDifficulty(data["difficulty"])
-        xp_reward = data["xp_reward"]
-        gold_reward = data["gold_reward"]
-        description = data["description"]
-
-        quest = Quest(name, stat, difficulty, xp_reward, gold_reward, description)
-
-        quest.id = id
-
-        return quest
+        return Quest.from_record(
+            data["id"],
+            data["name"],
+            data["stat"],
+            DIFFICULTY_BY_VALUE[data["difficulty"]],
+            data["xp_reward"],
+            data["gold_reward"],
+            data["description"]
+        )
         
     def _load_all_data(self) -> dict:
-        """ Read the RAW JSON and return a dict of all the Quests
+        """ Read the raw file and return a dict of all the Quests
         
         Returns:
             dict: A dictionary with quest_id as keys and quest data as values.
         """
 
+        return self._read_catalog()[0]
+
+    def _read_catalog(self) -> tuple[dict, int]:
+        """Read the raw file and return the quests along with the catalog version.
+
+        Returns:
+            tuple[dict, int]: Quest data keyed by quest_id, and the stored version (0 if none).
+        """
+
         if not os.path.exists(self.filepath):
-            return {}
-        
-        with open(self.filepath, 'r') as file:
-            data = json.load(file)
+            return {}, 0
 
-        return data
+        with open(self.filepath, 'rb') as file:
+            data = self.codec.loads(file.read())
+
+        meta = data.pop(self.META_KEY, None)
+        return data, meta["version"] if meta else 0
+
+    def _stored_version(self) -> int:
+        """Version of the catalog on disk, decoding only the leading META_KEY entry."""
+
+        if not os.path.exists(self.filepath):
+            return 0
 
-    def _save_all_data(self, quest_dict: dict) -> None:
-        """Write the whole dict to the json
+        with open(self.filepath, 'rb') as file:
+            for key, value in self.codec.iter_object(file):
+                return value["version"] if key == self.META_KEY else 0
+        return 0
+
+    def _save_all_data(self, quest_dict: dict, version: int) -> None:
+        """Write the whole dict to the file
         
         Args:
             quest_dict (dict): A dictionary with quest_id as keys and quest data as values.
+            version (int): Catalog version quest_dict was loaded at.
         """
         
-        with open(self.filepath, 'w') as file:
-            json.dump(quest_dict, file, indent = 2)
+        atomic_write(self.filepath, self._encode_catalog(quest_dict, version))
+
+    def _encode_catalog(self, quest_dict: dict, version: int) -> bytes:
+        """Encode the catalog as the version following `version`.
+
+        Must be called with the lock that serializes writers of the file held.
+
+        Raises:
+            ConcurrentUpdateError: If the stored catalog is no longer at `version`.
+        """
+        stored_version = self._stored_version()
+        if stored_version != version:
+            raise ConcurrentUpdateError(self.filepath, version, stored_version)
+
+        return self.codec.dumps({self.META_KEY: {"version": version + 1}, **quest_dict})
 
     # Public methods
 
@@ -92,10 +155,11 @@ class QuestRepository:
         Args:
             quest (Quest): The Quest object to add.
         """
-        data = self._load_all_data()
-        quest_dict = self._quest_to_dict(quest)
-        data[quest.id] = quest_dict
-        self._save_all_data(data)
+        with self.lock:
+            data, version = self._read_catalog()
+            quest_dict = self._quest_to_dict(quest)
+            data[quest.id] = quest_dict
+            self._save_all_data(data, version)
 
     def get_by_id(self, quest_id: str) -> Quest | None:
         """Get a quest by its ID. Returns None if not found.
@@ -116,6 +180,19 @@ class QuestRepository:
 
         return quest
         
+    def get_many(self, quest_ids: list[str]) -> dict[str, Quest]:
+        """Get several quests by ID with a single read of the catalog.
+
+        Args:
+            quest_ids (list[str]): The IDs of the quests to retrieve.
+
+        Returns:
+            dict[str, Quest]: The quests found, keyed by ID. Unknown IDs are left out.
+        """
+
+        data = self._load_all_data()
+        return {quest_id: self._dict_to_quest(data[quest_id]) for quest_id in quest_ids if quest_id in data}
+
     def get_all(self) -> list[Quest]:
         """Get all quests as a list of Quest objects.
         
@@ -127,6 +204,36 @@ class QuestRepository:
         quest_list = [self._dict_to_quest(quest_data) for quest_data in data.values()]
         return quest_list
 
+    def iter_all(self) -> Iterator[Quest]:
+        """Iterate over all quests, parsing the file incrementally.
+
+        Only one quest is decoded at a time, so memory stays flat however
+        large the catalog is. The file is read from the version that was
+        current when iteration started.
+
+        Yields:
+            Quest: Each quest, in catalog order.
+        """
+
+        if not os.path.exists(self.filepath):
+            return
+
+        with open(self.filepath, 'rb') as file:
+            for quest_id, quest_data in self.codec.iter_object(file):
+                if quest_id != self.META_KEY:
+                    yield self._dict_to_quest(quest_data)
+
+    def iter_by_stat(self, stat_name: str) -> Iterator[Quest]:
+        """Iterate over the quests of a specific stat, parsing the file incrementally.
+
+        Args:
+            stat_name (str): The name of the stat to filter quests by.
+        Yields:
+            Quest: Each matching quest, in catalog order.
+        """
+
+        return (quest for quest in self.iter_all() if quest.stat == stat_name)
+
     def update(self, quest: Quest) -> bool:
         """Update an existing quest. Returns True if found and updated.
         
@@ -136,15 +243,16 @@ class QuestRepository:
             bool: True if the quest was found and updated, False otherwise.
         """
 
-        data = self._load_all_data()
-        
-        if quest.id not in data:
-            return False  # Quest no existe
-        
-        quest_dict = self._quest_to_dict(quest)
-        data[quest.id] = quest_dict
-        self._save_all_data(data)
-        return True
+        with self.lock:
+            data, version = self._read_catalog()
+            
+            if quest.id not in data:
+                return False  # Quest no existe
+            
+            quest_dict = self._quest_to_dict(quest)
+            data[quest.id] = quest_dict
+            self._save_all_data(data, version)
+            return True
 
     def delete(self, quest_id: str) -> bool:
         """Delete a quest by its ID. Returns True if found and deleted.
@@ -155,15 +263,16 @@ class QuestRepository:
             bool: True if the quest was found and deleted, False otherwise.
         """
 
-        data = self._load_all_data()
-        if quest_id not in data:
-            return False
-        
-        del data[quest_id]
+        with self.lock:
+            data, version = self._read_catalog()
+            if quest_id not in data:
+                return False
+            
+            del data[quest_id]
 
-        self._save_all_data(data)
+            self._save_all_data(data, version)
 
-        return True
+            return True
     
     def get_by_stat(self, stat_name: str) -> list[Quest]:
         """Get all quests for a specific stat.
@@ -176,4 +285,41 @@ class QuestRepository:
 
         all_quests = self.get_all()
         filtered = [q for q in all_quests if q.stat == stat_name]
-        return filtered
\ No newline at end of file
+        return filtered
+
+    def get_by_difficulty(self, difficulty: QuestDifficulty) -> list[Quest]:
+        """Get all quests with a specific difficulty.
+        
+        Args:
+            difficulty (QuestDifficulty): The difficulty to filter quests by.
+        Returns:
+            list[Quest]: A list of Quest objects with that difficulty.
+        """
+
+        return self.find(difficulty=difficulty)
+
+    def find(self, stat: str | None = None, difficulty: QuestDifficulty | None = None,
+             min_xp: int | None = None, max_xp: int | None = None,
+             min_gold: int | None = None, max_gold: int | None = None) -> list[Quest]:
+        """Get all quests matching every given filter. Reward bounds are inclusive.
+        
+        Args:
+            stat (str | None): Stat name to match.
+            difficulty (QuestDifficulty | None): Difficulty to match.
+            min_xp (int | None): Minimum XP reward.
+            max_xp (int | None): Maximum XP reward.
+            min_gold (int | None): Minimum gold reward.
+            max_gold (int | None): Maximum gold reward.
+        Returns:
+            list[Quest]: A list of Quest objects that match all filters.
+        """
+
+        return [
+            q for q in self.get_all()
+            if (stat is None or q.stat == stat)
+            and (difficulty is None or q.difficulty == difficulty)
+            and (min_xp is None or q.xp_reward >= min_xp)
+            and (max_xp is None or q.xp_reward <= max_xp)
+            and (min_gold is None or q.gold_reward >= min_gold)
+            and (max_gold is None or q.gold_reward <= max_gold)
+        ]
@@ -0,0 +1,15 @@
+"""
+SQLite repositories package.
+Embedded SQLite (WAL mode) repositories with the same interface as the JSON file repositories.
+"""
+from repositories.sqlite.database import SQLiteDatabase
+from repositories.sqlite.hunter_repository_sqlite import HunterRepositorySQLite
+from repositories.sqlite.quest_repository_sqlite import QuestRepositorySQLite
+from repositories.sqlite.quest_log_repository_sqlite import QuestLogRepositorySQLite
+
+__all__ = [
+    "SQLiteDatabase",
+    "HunterRepositorySQLite",
+    "QuestRepositorySQLite",
+    "QuestLogRepositorySQLite",
+]
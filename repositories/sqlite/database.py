@@ -0,0 +1,169 @@
+"""
+SQLite database shared by the SQLite repositories.
+One WAL-mode database file, one connection per thread.
+"""
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hunters (
+    id          TEXT PRIMARY KEY,
+    name        TEXT NOT NULL,
+    gold        INTEGER NOT NULL DEFAULT 0,
+    version     INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS hunter_stats (
+    hunter_id   TEXT NOT NULL REFERENCES hunters(id) ON DELETE CASCADE,
+    stat        TEXT NOT NULL,
+    total_xp    INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (hunter_id, stat)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS quests (
+    seq         INTEGER PRIMARY KEY,
+    id          TEXT NOT NULL UNIQUE,
+    name        TEXT NOT NULL,
+    stat        TEXT NOT NULL,
+    difficulty  TEXT NOT NULL,
+    xp_reward   INTEGER NOT NULL,
+    gold_reward INTEGER NOT NULL,
+    description TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_quests_stat ON quests (stat);
+CREATE INDEX IF NOT EXISTS ix_quests_difficulty ON quests (difficulty);
+CREATE INDEX IF NOT EXISTS ix_quests_xp_reward ON quests (xp_reward);
+CREATE INDEX IF NOT EXISTS ix_quests_gold_reward ON quests (gold_reward);
+
+CREATE TABLE IF NOT EXISTS quest_logs (
+    seq          INTEGER PRIMARY KEY,
+    quest_id     TEXT NOT NULL,
+    hunter_id    TEXT NOT NULL DEFAULT 'default',
+    stat         TEXT,
+    completed_at TEXT NOT NULL,
+    xp_earned    INTEGER NOT NULL,
+    gold_earned  INTEGER NOT NULL
+);
+"""
+
+# Run after SCHEMA, once the columns added since the first release exist
+# Time ranges are paged by (completed_at, seq) keys, so their indexes end with seq;
+# the indexes on completed_at alone of older releases are replaced by them
+INDEXES = """
+CREATE INDEX IF NOT EXISTS ix_quest_logs_completed_at_seq ON quest_logs (completed_at, seq);
+CREATE INDEX IF NOT EXISTS ix_quest_logs_hunter_completed_at_seq ON quest_logs (hunter_id, completed_at, seq);
+CREATE INDEX IF NOT EXISTS ix_quest_logs_hunter_seq ON quest_logs (hunter_id, seq);
+DROP INDEX IF EXISTS ix_quest_logs_completed_at;
+DROP INDEX IF EXISTS ix_quest_logs_hunter_completed_at;
+"""
+
+# Columns added to existing tables: (table, column, definition).
+# Quest logs written before hunters had IDs belong to the default hunter
+ADDED_COLUMNS = (
+    ("quest_logs", "hunter_id", "TEXT NOT NULL DEFAULT 'default'"),
+)
+
+
+class SQLiteDatabase:
+    """
+    Connection manager for the SQLite backend.
+
+    Each thread gets its own connection (sqlite3 connections must not be
+    shared across threads). The database runs in WAL mode, so readers never
+    block the single writer and commits only append to the WAL.
+    Transactions are explicit and may be nested; only the outermost one commits.
+    """
+
+    def __init__(self, path: str = "data/hunter.db", synchronous: str = "NORMAL", busy_timeout_ms: int = 5000):
+        """
+        Args:
+            path (str): Database file path
+            synchronous (str): PRAGMA synchronous level; NORMAL is durable across
+                application crashes in WAL mode, FULL also across power loss
+            busy_timeout_ms (int): How long a writer waits for another process's write lock
+        """
+        self.path = path
+        self.synchronous = synchronous
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+
+        dir_path = os.path.dirname(path)
+        if dir_path and not os.path.exists(dir_path):
+            os.makedirs(dir_path)
+
+        # executescript() would commit on its own, so run the schema statement by statement
+        with self.transaction() as connection:
+            for statement in SCHEMA.split(";"):
+                if statement.strip():
+                    connection.execute(statement)
+            self._add_missing_columns(connection)
+            for statement in INDEXES.split(";"):
+                if statement.strip():
+                    connection.execute(statement)
+
+    @staticmethod
+    def _add_missing_columns(connection: sqlite3.Connection) -> None:
+        """Add the ADDED_COLUMNS a database created by an older release lacks."""
+        for table, column, definition in ADDED_COLUMNS:
+            columns = {row[1] for row in connection.execute(f"PRAGMA table_info({table})")}
+            if column not in columns:
+                connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Connection of the calling thread, opened on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # Autocommit mode: transactions are started explicitly by transaction()
+            connection = sqlite3.connect(self.path, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(f"PRAGMA synchronous={self.synchronous}")
+            connection.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            connection.execute("PRAGMA foreign_keys=ON")
+            self._local.connection = connection
+            self._local.depth = 0
+        return connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run a block in a write transaction (BEGIN IMMEDIATE), committed on success
+        and rolled back on error, including a failed COMMIT. Nested calls join
+        the outer transaction.
+
+        Yields:
+            sqlite3.Connection: The calling thread's connection
+        """
+        connection = self.connection
+        if self._local.depth > 0:
+            self._local.depth += 1
+            try:
+                yield connection
+            finally:
+                self._local.depth -= 1
+            return
+
+        connection.execute("BEGIN IMMEDIATE")
+        self._local.depth = 1
+        try:
+            yield connection
+            connection.execute("COMMIT")
+        except BaseException:
+            # Also reached when COMMIT itself fails (e.g. SQLITE_BUSY), which
+            # leaves the transaction open
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+        finally:
+            self._local.depth = 0
+
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
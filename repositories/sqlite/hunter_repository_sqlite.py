@@ -0,0 +1,147 @@
+"""
+Hunter repository using the embedded SQLite database.
+"""
+from collections.abc import Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+from entities.hunter import DEFAULT_HUNTER_ID, Hunter
+from repositories.exceptions import ConcurrentUpdateError
+from repositories.sqlite.database import SQLiteDatabase
+from utils.valid_stats import VALID_STATS
+
+
+class HunterRepositorySQLite:
+    """
+    Hunter repository with SQLite persistence.
+    Same interface as HunterRepository: load(), save() and transaction().
+
+    A save updates the hunter row and its stats in a single transaction, and
+    is rejected with ConcurrentUpdateError if the stored version moved on
+    since the hunter was loaded.
+    """
+
+    def __init__(self, database: SQLiteDatabase, hunter_id: str = DEFAULT_HUNTER_ID):
+        """
+        Args:
+            database (SQLiteDatabase): Database holding the hunters table
+            hunter_id (str): ID of the hunter profile this repository manages
+        """
+        self.database = database
+        self.hunter_id = hunter_id
+
+    def for_hunter(self, hunter_id: str) -> "HunterRepositorySQLite":
+        """Get the repository of another hunter stored in the same database."""
+        if hunter_id == self.hunter_id:
+            return self
+        return HunterRepositorySQLite(self.database, hunter_id)
+
+    @contextmanager
+    def transaction(self):
+        """Run a load-modify-save sequence in one database transaction."""
+        with self.database.transaction():
+            yield
+
+    def load(self) -> Hunter:
+        """Load the hunter, creating the default profile on first use."""
+        # One statement, so the row and its stats come from the same snapshot
+        rows = self._select()
+
+        if not rows:
+            with self.database.transaction():
+                rows = self._select()
+                if not rows:
+                    default_hunter = Hunter("Player")
+                    self._insert(default_hunter)
+                    return default_hunter
+
+        name, gold, version = rows[0][:3]
+        hunter = Hunter(name)
+        hunter.gold = gold
+        hunter.version = version
+
+        stats = hunter.stats
+        for *_, stat_name, total_xp in rows:
+            if stat_name in stats:
+                stats[stat_name].total_xp = total_xp
+
+        return hunter
+
+    def save(self, hunter: Hunter, wait: bool = True, after: Future | None = None) -> None:
+        """
+        Save the hunter and its stats atomically.
+
+        Saves are committed before returning, so there is never a pending save:
+        wait and after are accepted for compatibility with HunterRepository and ignored.
+
+        Raises:
+            ConcurrentUpdateError: If the stored profile changed since the hunter was loaded.
+        """
+        with self.database.transaction() as connection:
+            row = connection.execute(
+                "SELECT version FROM hunters WHERE id = ?", (self.hunter_id,)
+            ).fetchone()
+
+            if row is None:
+                if hunter.version != 0:
+                    raise ConcurrentUpdateError(self.database.path, hunter.version, 0)
+                self._insert(hunter)
+                return
+
+            if row[0] != hunter.version:
+                raise ConcurrentUpdateError(self.database.path, hunter.version, row[0])
+
+            connection.execute(
+                "UPDATE hunters SET name = ?, gold = ?, version = version + 1 WHERE id = ?",
+                (hunter.name, hunter.gold, self.hunter_id)
+            )
+            self._write_stats(hunter)
+            hunter.version += 1
+
+    def iter_hunters(self) -> Iterator[tuple[str, Hunter]]:
+        """Iterate over every hunter in the database as (hunter_id, Hunter) pairs, in id order."""
+        rows = self.database.connection.execute(
+            "SELECT h.id, h.name, h.gold, h.version, s.stat, s.total_xp FROM hunters h "
+            "LEFT JOIN hunter_stats s ON s.hunter_id = h.id ORDER BY h.id"
+        )
+
+        hunter_id, hunter = None, None
+        for row_id, name, gold, version, stat_name, total_xp in rows:
+            if row_id != hunter_id:
+                if hunter is not None:
+                    yield hunter_id, hunter
+                hunter_id, hunter = row_id, Hunter(name, gold)
+                hunter.version = version
+            if stat_name in hunter.stats:
+                hunter.stats[stat_name].total_xp = total_xp
+
+        if hunter is not None:
+            yield hunter_id, hunter
+
+    # Private methods
+
+    def _select(self) -> list[tuple]:
+        """Rows of (name, gold, version, stat, total_xp) for the hunter; empty if it does not exist."""
+        return self.database.connection.execute(
+            "SELECT h.name, h.gold, h.version, s.stat, s.total_xp FROM hunters h "
+            "LEFT JOIN hunter_stats s ON s.hunter_id = h.id WHERE h.id = ?",
+            (self.hunter_id,)
+        ).fetchall()
+
+    def _insert(self, hunter: Hunter) -> None:
+        """Insert a new hunter row and its stats. Must run inside a transaction."""
+        self.database.connection.execute(
+            "INSERT INTO hunters (id, name, gold, version) VALUES (?, ?, ?, 1)",
+            (self.hunter_id, hunter.name, hunter.gold)
+        )
+        self._write_stats(hunter)
+        hunter.version = 1
+
+    def _write_stats(self, hunter: Hunter) -> None:
+        """Upsert every stat row of the hunter. Must run inside a transaction."""
+        stats = hunter.stats
+        self.database.connection.executemany(
+            "INSERT INTO hunter_stats (hunter_id, stat, total_xp) VALUES (?, ?, ?) "
+            "ON CONFLICT (hunter_id, stat) DO UPDATE SET total_xp = excluded.total_xp",
+            [(self.hunter_id, stat_name, stats[stat_name].total_xp) for stat_name in VALID_STATS]
+        )
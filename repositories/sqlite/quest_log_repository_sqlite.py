@@ -0,0 +1,241 @@
+"""
+QuestLog repository using the embedded SQLite database.
+"""
+from collections.abc import Iterator
+from datetime import datetime
+
+from entities.quest_log import QuestLog
+from repositories.sqlite.database import SQLiteDatabase
+from repositories.sqlite.quest_repository_sqlite import ITER_PAGE_SIZE
+from utils.valid_stats import VALID_STATS
+
+
+class QuestLogRepositorySQLite:
+    """
+    Quest completion history with SQLite persistence.
+    Same interface as QuestLogRepository: add(), get_all() and get_recent().
+    """
+
+    def __init__(self, database: SQLiteDatabase):
+        """
+        Args:
+            database (SQLiteDatabase): Database holding the quest_logs table
+        """
+        self.database = database
+
+    def _quest_log_to_row(self, quest_log: QuestLog) -> tuple:
+        """Convert a QuestLog object to a quest_logs row."""
+        return (quest_log.quest_id, quest_log.hunter_id, quest_log.stat, quest_log.completed_at.isoformat(),
+                quest_log.xp_earned, quest_log.gold_earned)
+
+    def add(self, quest_log: QuestLog) -> int:
+        """
+        Add a quest log entry.
+
+        Args:
+            quest_log (QuestLog): The quest log entry to add.
+        Returns:
+            int: Log position right after the entry, as for iter_from().
+        """
+        return self.add_many([quest_log])
+
+    def add_many(self, quest_logs: list[QuestLog]) -> int:
+        """
+        Add several quest log entries in one transaction.
+
+        Args:
+            quest_logs (list[QuestLog]): The quest log entries to add, in completion order.
+        Returns:
+            int: Log position right after the last entry, as for iter_from().
+        """
+        with self.database.transaction() as connection:
+            connection.executemany(
+                "INSERT INTO quest_logs (quest_id, hunter_id, stat, completed_at, xp_earned, gold_earned) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [self._quest_log_to_row(quest_log) for quest_log in quest_logs]
+            )
+            return self._last_seq(connection)
+
+    def end_position(self) -> int:
+        """Position after the last committed entry; writers commit in seq order."""
+        return self._last_seq(self.database.connection)
+
+    @staticmethod
+    def _last_seq(connection) -> int:
+        """Highest seq stored, or 0 for an empty log."""
+        return connection.execute("SELECT COALESCE(MAX(seq), 0) FROM quest_logs").fetchone()[0]
+
+    def get_all(self) -> list[QuestLog]:
+        """
+        Get the whole completion history as QuestLog objects, oldest first.
+
+        Returns:
+            list[QuestLog]: All stored quest logs.
+        """
+        rows = self.database.connection.execute(
+            "SELECT quest_id, xp_earned, gold_earned, completed_at, stat, hunter_id FROM quest_logs ORDER BY seq"
+        )
+        return [
+            QuestLog.from_record(quest_id, xp_earned, gold_earned, datetime.fromisoformat(completed_at),
+                                 stat, hunter_id)
+            for quest_id, xp_earned, gold_earned, completed_at, stat, hunter_id in rows
+        ]
+
+    def iter_all(self) -> Iterator[QuestLog]:
+        """
+        Iterate over the completion history, oldest first, fetching ITER_PAGE_SIZE rows at a time.
+
+        Yields:
+            QuestLog: Each stored quest log.
+        """
+        last_seq = 0
+        while True:
+            rows = self.database.connection.execute(
+                "SELECT seq, quest_id, xp_earned, gold_earned, completed_at, stat, hunter_id FROM quest_logs "
+                "WHERE seq > ? ORDER BY seq LIMIT ?", (last_seq, ITER_PAGE_SIZE)
+            ).fetchall()
+            for _, quest_id, xp_earned, gold_earned, completed_at, stat, hunter_id in rows:
+                yield QuestLog.from_record(quest_id, xp_earned, gold_earned,
+                                           datetime.fromisoformat(completed_at), stat, hunter_id)
+            if len(rows) < ITER_PAGE_SIZE:
+                return
+            last_seq = rows[-1][0]
+
+    def iter_between(self, start: datetime | None = None, end: datetime | None = None,
+                     hunter_id: str | None = None) -> Iterator[QuestLog]:
+        """
+        Iterate over the quest logs completed in [start, end), using the (completed_at, seq) indexes.
+
+        Pages are fetched by keyset: each one starts after the (completed_at, seq)
+        key of the last row of the previous one, so every page is a single
+        index range scan and the range is never scanned in seq order.
+
+        Args:
+            start (datetime | None): Inclusive lower bound, or None for the beginning.
+            end (datetime | None): Exclusive upper bound, or None for the end.
+            hunter_id (str | None): Only this hunter's logs, or None for every hunter.
+        Yields:
+            QuestLog: Each quest log in the range, oldest first (in log order for equal times).
+        """
+        where, params = self._time_range(start, end, hunter_id)
+        # The empty string sorts before every completed_at
+        last_key = ("", 0)
+        while True:
+            rows = self.database.connection.execute(
+                "SELECT seq, quest_id, xp_earned, gold_earned, completed_at, stat, hunter_id FROM quest_logs "
+                f"WHERE {where}(completed_at, seq) > (?, ?) ORDER BY completed_at, seq LIMIT ?",
+                (*params, *last_key, ITER_PAGE_SIZE)
+            ).fetchall()
+            for _, quest_id, xp_earned, gold_earned, completed_at, stat, log_hunter_id in rows:
+                yield QuestLog.from_record(quest_id, xp_earned, gold_earned,
+                                           datetime.fromisoformat(completed_at), stat, log_hunter_id)
+            if len(rows) < ITER_PAGE_SIZE:
+                return
+            last_key = (rows[-1][4], rows[-1][0])
+
+    def iter_from(self, position: int = 0, hunter_id: str | None = None) -> Iterator[tuple[int, QuestLog]]:
+        """
+        Iterate over the quest logs stored after a position (a seq), in log order,
+        fetching ITER_PAGE_SIZE rows at a time.
+
+        Args:
+            position (int): Position to start at: 0, or one returned by this method.
+            hunter_id (str | None): Only this hunter's logs, or None for every hunter.
+        Yields:
+            tuple[int, QuestLog]: Position right after each quest log, and the quest log.
+        """
+        where, params = ("hunter_id = ? AND ", (hunter_id,)) if hunter_id is not None else ("", ())
+        while True:
+            rows = self.database.connection.execute(
+                "SELECT seq, quest_id, xp_earned, gold_earned, completed_at, stat, hunter_id FROM quest_logs "
+                f"WHERE {where}seq > ? ORDER BY seq LIMIT ?", (*params, position, ITER_PAGE_SIZE)
+            ).fetchall()
+            for seq, quest_id, xp_earned, gold_earned, completed_at, stat, log_hunter_id in rows:
+                yield seq, QuestLog.from_record(quest_id, xp_earned, gold_earned,
+                                                datetime.fromisoformat(completed_at), stat, log_hunter_id)
+            if len(rows) < ITER_PAGE_SIZE:
+                return
+            position = rows[-1][0]
+
+    def count_from(self, position: int = 0, hunter_id: str | None = None) -> int:
+        """Number of quest logs stored after a position, as for iter_from()."""
+        where, params = ("hunter_id = ? AND ", (hunter_id,)) if hunter_id is not None else ("", ())
+        return self.database.connection.execute(
+            f"SELECT COUNT(*) FROM quest_logs WHERE {where}seq > ?", (*params, position)
+        ).fetchone()[0]
+
+    def total_rewards(self, start: datetime | None = None, end: datetime | None = None,
+                      hunter_id: str | None = None) -> dict:
+        """
+        Sum completions, XP and gold over a time range, using the completed_at indexes.
+
+        Args:
+            start (datetime | None): Inclusive lower bound, or None for the beginning.
+            end (datetime | None): Exclusive upper bound, or None for the end.
+            hunter_id (str | None): Only this hunter's logs, or None for every hunter.
+        Returns:
+            dict: completions, total_xp, total_gold and XP per stat.
+        """
+        where, params = self._time_range(start, end, hunter_id)
+        rows = self.database.connection.execute(
+            "SELECT stat, COUNT(*), SUM(xp_earned), SUM(gold_earned) FROM quest_logs "
+            f"WHERE {where}1 GROUP BY stat", params
+        ).fetchall()
+
+        xp_by_stat = dict.fromkeys(VALID_STATS, 0)
+        for stat, _, xp, _ in rows:
+            if stat in xp_by_stat:
+                xp_by_stat[stat] = xp
+        return {
+            "completions": sum(row[1] for row in rows),
+            "total_xp": sum(row[2] for row in rows),
+            "total_gold": sum(row[3] for row in rows),
+            "xp_by_stat": xp_by_stat
+        }
+
+    def _time_range(self, start: datetime | None, end: datetime | None,
+                    hunter_id: str | None = None) -> tuple[str, tuple]:
+        """Build the hunter and completed_at conditions (each followed by AND) for [start, end)."""
+        where = ""
+        params = ()
+        if hunter_id is not None:
+            where += "hunter_id = ? AND "
+            params += (hunter_id,)
+        if start is not None:
+            where += "completed_at >= ? AND "
+            params += (start.isoformat(),)
+        if end is not None:
+            where += "completed_at < ? AND "
+            params += (end.isoformat(),)
+        return where, params
+
+    def get_recent(self, n: int = 10) -> list[dict]:
+        """
+        Get the N most recent quest logs, oldest first.
+
+        Args:
+            n (int): Number of recent logs to retrieve.
+        Returns:
+            list[dict]: List of recent quest log entries.
+        """
+        if n <= 0:
+            return []
+
+        rows = self.database.connection.execute(
+            "SELECT quest_id, hunter_id, completed_at, xp_earned, gold_earned, stat FROM quest_logs "
+            "ORDER BY seq DESC LIMIT ?", (n,)
+        ).fetchall()
+
+        logs = []
+        for quest_id, hunter_id, completed_at, xp_earned, gold_earned, stat in reversed(rows):
+            log = {
+                "quest_id": quest_id,
+                "hunter_id": hunter_id,
+                "completed_at": completed_at,
+                "xp_earned": xp_earned,
+                "gold_earned": gold_earned
+            }
+            if stat is not None:
+                log["stat"] = stat
+            logs.append(log)
+        return logs
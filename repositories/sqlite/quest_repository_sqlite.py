@@ -0,0 +1,225 @@
+"""
+Quest repository using the embedded SQLite database.
+"""
+from collections.abc import Iterator
+
+from entities.quest import Quest
+from entities.quest_difficulty import DIFFICULTY_BY_VALUE, QuestDifficulty
+from repositories.sqlite.database import SQLiteDatabase
+
+
+_COLUMNS = "id, name, stat, difficulty, xp_reward, gold_reward, description"
+
+# Rows fetched per query by iter_all() and iter_by_stat()
+ITER_PAGE_SIZE = 500
+
+
+class QuestRepositorySQLite:
+    """
+    Quest catalog with SQLite persistence.
+    Same interface as QuestRepository; filters are answered from the indexes
+    on stat, difficulty, xp_reward and gold_reward. Results keep insertion order.
+    """
+
+    def __init__(self, database: SQLiteDatabase):
+        """
+        Args:
+            database (SQLiteDatabase): Database holding the quests table
+        """
+        self.database = database
+
+    def _row_to_quest(self, row: tuple) -> Quest:
+        """Convert a quests row to a Quest object."""
+        quest_id, name, stat, difficulty, xp_reward, gold_reward, description = row
+        return Quest.from_record(quest_id, name, stat, DIFFICULTY_BY_VALUE[difficulty],
+                                 xp_reward, gold_reward, description)
+
+    def _quest_to_row(self, quest: Quest) -> tuple:
+        """Convert a Quest object to a quests row."""
+        return (quest.id, quest.name, quest.stat, quest.difficulty.value,
+                quest.xp_reward, quest.gold_reward, quest.description)
+
+    def add(self, quest: Quest) -> None:
+        """
+        Add a new quest; a quest with the same ID is replaced in place.
+
+        Args:
+            quest (Quest): The Quest object to add.
+        """
+        with self.database.transaction() as connection:
+            connection.execute(
+                f"INSERT INTO quests ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET name = excluded.name, stat = excluded.stat, "
+                "difficulty = excluded.difficulty, xp_reward = excluded.xp_reward, "
+                "gold_reward = excluded.gold_reward, description = excluded.description",
+                self._quest_to_row(quest)
+            )
+
+    def get_by_id(self, quest_id: str) -> Quest | None:
+        """
+        Get a quest by its ID. Returns None if not found.
+
+        Args:
+            quest_id (str): The ID of the quest to retrieve.
+        Returns:
+            Quest | None: The Quest object if found, None otherwise.
+        """
+        row = self.database.connection.execute(
+            f"SELECT {_COLUMNS} FROM quests WHERE id = ?", (quest_id,)
+        ).fetchone()
+        return self._row_to_quest(row) if row is not None else None
+
+    def get_many(self, quest_ids: list[str]) -> dict[str, Quest]:
+        """
+        Get several quests by ID in one query.
+
+        Args:
+            quest_ids (list[str]): The IDs of the quests to retrieve.
+        Returns:
+            dict[str, Quest]: The quests found, keyed by ID. Unknown IDs are left out.
+        """
+        unique_ids = list(dict.fromkeys(quest_ids))
+        if not unique_ids:
+            return {}
+
+        placeholders = ", ".join("?" * len(unique_ids))
+        rows = self.database.connection.execute(
+            f"SELECT {_COLUMNS} FROM quests WHERE id IN ({placeholders})", unique_ids
+        )
+        return {row[0]: self._row_to_quest(row) for row in rows}
+
+    def get_all(self) -> list[Quest]:
+        """
+        Get all quests as a list of Quest objects.
+
+        Returns:
+            list[Quest]: A list of all Quest objects.
+        """
+        return self.find()
+
+    def iter_all(self) -> Iterator[Quest]:
+        """
+        Iterate over all quests, fetching ITER_PAGE_SIZE rows at a time.
+
+        Pages are keyed on seq rather than held open as a cursor, so the
+        iterator may be advanced from different threads (each uses its own
+        connection), as a streaming response does.
+
+        Yields:
+            Quest: Each quest, in insertion order.
+        """
+        return self._iter_where("", ())
+
+    def iter_by_stat(self, stat_name: str) -> Iterator[Quest]:
+        """
+        Iterate over the quests of a specific stat, ITER_PAGE_SIZE rows at a time.
+
+        Args:
+            stat_name (str): The name of the stat to filter quests by.
+        Yields:
+            Quest: Each matching quest, in insertion order.
+        """
+        return self._iter_where("stat = ? AND ", (stat_name,))
+
+    def _iter_where(self, condition: str, params: tuple) -> Iterator[Quest]:
+        """Page through the quests matching `condition` (a clause ending in AND, or empty)."""
+        last_seq = 0
+        while True:
+            rows = self.database.connection.execute(
+                f"SELECT seq, {_COLUMNS} FROM quests WHERE {condition}seq > ? ORDER BY seq LIMIT ?",
+                (*params, last_seq, ITER_PAGE_SIZE)
+            ).fetchall()
+            for row in rows:
+                yield self._row_to_quest(row[1:])
+            if len(rows) < ITER_PAGE_SIZE:
+                return
+            last_seq = rows[-1][0]
+
+    def update(self, quest: Quest) -> bool:
+        """
+        Update an existing quest. Returns True if found and updated.
+
+        Args:
+            quest (Quest): The Quest object with updated data.
+        Returns:
+            bool: True if the quest was found and updated, False otherwise.
+        """
+        quest_id, *values = self._quest_to_row(quest)
+        with self.database.transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE quests SET name = ?, stat = ?, difficulty = ?, xp_reward = ?, "
+                "gold_reward = ?, description = ? WHERE id = ?",
+                (*values, quest_id)
+            )
+            return cursor.rowcount > 0
+
+    def delete(self, quest_id: str) -> bool:
+        """
+        Delete a quest by its ID. Returns True if found and deleted.
+
+        Args:
+            quest_id (str): The ID of the quest to delete.
+        Returns:
+            bool: True if the quest was found and deleted, False otherwise.
+        """
+        with self.database.transaction() as connection:
+            cursor = connection.execute("DELETE FROM quests WHERE id = ?", (quest_id,))
+            return cursor.rowcount > 0
+
+    def get_by_stat(self, stat_name: str) -> list[Quest]:
+        """
+        Get all quests for a specific stat.
+
+        Args:
+            stat_name (str): The name of the stat to filter quests by.
+        Returns:
+            list[Quest]: A list of Quest objects that match the stat.
+        """
+        return self.find(stat=stat_name)
+
+    def get_by_difficulty(self, difficulty: QuestDifficulty) -> list[Quest]:
+        """
+        Get all quests with a specific difficulty.
+
+        Args:
+            difficulty (QuestDifficulty): The difficulty to filter quests by.
+        Returns:
+            list[Quest]: A list of Quest objects with that difficulty.
+        """
+        return self.find(difficulty=difficulty)
+
+    def find(self, stat: str | None = None, difficulty: QuestDifficulty | None = None,
+             min_xp: int | None = None, max_xp: int | None = None,
+             min_gold: int | None = None, max_gold: int | None = None) -> list[Quest]:
+        """
+        Get all quests matching every given filter. Reward bounds are inclusive.
+
+        Args:
+            stat (str | None): Stat name to match.
+            difficulty (QuestDifficulty | None): Difficulty to match.
+            min_xp (int | None): Minimum XP reward.
+            max_xp (int | None): Maximum XP reward.
+            min_gold (int | None): Minimum gold reward.
+            max_gold (int | None): Maximum gold reward.
+        Returns:
+            list[Quest]: A list of Quest objects that match all filters.
+        """
+        conditions = []
+        params = []
+        for clause, value in (
+            ("stat = ?", stat),
+            ("difficulty = ?", difficulty.value if difficulty is not None else None),
+            ("xp_reward >= ?", min_xp),
+            ("xp_reward <= ?", max_xp),
+            ("gold_reward >= ?", min_gold),
+            ("gold_reward <= ?", max_gold),
+        ):
+            if value is not None:
+                conditions.append(clause)
+                params.append(value)
+
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self.database.connection.execute(
+            f"SELECT {_COLUMNS} FROM quests{where} ORDER BY seq", params
+        )
+        return [self._row_to_quest(row) for row in rows]
@@ -0,0 +1,161 @@
+"""Streaks and daily activity of hunters, served from rollups.
+
+The activity rollups (ActivityRollupRepository) keep per-hunter daily
+buckets and streaks up to date in O(1) per completion. Completions reach
+them from the quest log writer, once each batch of logs is persisted, so
+recording them costs the request nothing and a batch takes the rollups'
+file lock once; streaks may lag a completion by the writer's batch delay.
+Streak and calendar queries read the rollups only and never scan the quest
+log. The rollups can be rebuilt from the quest log:
+
+    python -m services.activity_service rebuild [--hunter-id default]
+
+A rebuild reads the log without blocking the writer, then takes the rollup
+lock, replays what was appended in the meantime up to the log's current end
+and swaps the result in, recording that position so batches it already
+includes are not recorded again.
+"""
+
+import argparse
+import threading
+from collections import defaultdict
+from datetime import date
+
+from entities.hunter_activity import HunterActivity
+from entities.quest_log import QuestLog
+from repositories.activity_rollup_repository import ActivityRollupRepository
+from repositories.config import StorageConfig, storage_config
+from repositories.factory import create_activity_rollup_repository, create_quest_log_repository
+from utils.valid_stats import VALID_STATS
+
+class ActivityService:
+
+    def __init__(self, rollup_repository: ActivityRollupRepository) -> None:
+        """Initialize ActivityService with the rollups it reads and updates."""
+        self.rollup_repo = rollup_repository
+
+    def record(self, quest_log: QuestLog) -> None:
+        """Add a completion to its hunter's rollups."""
+        self.record_many([quest_log])
+
+    def record_many(self, quest_logs: list[QuestLog], position: int | None = None) -> None:
+        """Add completions of any hunters to their rollups; a QuestLogWriter listener.
+
+        Args:
+            quest_logs: Completions to add
+            position: Quest log position right after them, when they come from the log
+        """
+        self.rollup_repo.record_many([
+            (quest_log.hunter_id, quest_log.stat, quest_log.xp_earned,
+             quest_log.gold_earned, quest_log.completed_at)
+            for quest_log in quest_logs
+        ], position)
+
+    def streaks(self, hunter_id: str, today: date | None = None) -> dict:
+        """Get the hunter's current and longest streaks.
+
+        Args:
+            hunter_id: Hunter to look up
+            today: Day the current streak is evaluated on; defaults to today
+
+        Returns
+            Dictionary with current_streak, longest_streak and last_active
+        """
+        return self.rollup_repo.streaks(hunter_id, today or date.today())
+
+    def calendar(self, hunter_id: str, start: date, end: date) -> list[dict]:
+        """Get the hunter's activity per day from start to end, both included.
+
+        Returns
+            One dictionary per active day, oldest first, with the day,
+            completions, gold, total XP and XP per stat
+        """
+        return [
+            {
+                "day": day,
+                "completions": bucket.completions,
+                "gold": bucket.gold,
+                "total_xp": bucket.total_xp,
+                "xp_by_stat": dict(zip(VALID_STATS, bucket.xp_by_stat))
+            }
+            for day, bucket in self.rollup_repo.days(hunter_id, start, end)
+        ]
+
+    def rebuild(self, quest_log_repository, hunter_id: str | None = None) -> int:
+        """Rebuild rollups from a quest log, replacing the stored ones.
+
+        Completions persisted while the log is read are replayed under the
+        rollup lock before the result replaces the stored rollups.
+
+        Args:
+            quest_log_repository: Quest log with iter_from() and end_position()
+            hunter_id: Only rebuild this hunter's rollups; None rebuilds every
+                hunter's and drops rollups of hunters without completions
+
+        Returns
+            Number of completions replayed
+        """
+        activities: dict[str, HunterActivity] = defaultdict(HunterActivity)
+        count = 0
+        position = 0
+
+        for position, quest_log in quest_log_repository.iter_from(0, hunter_id):
+            activities[quest_log.hunter_id].record(quest_log.completed_at.date(), quest_log.stat,
+                                                   quest_log.xp_earned, quest_log.gold_earned)
+            count += 1
+
+        with self.rollup_repo.lock:
+            # Batches persisted up to here are either in the rollups replaced
+            # below or get skipped when their listener call comes in
+            through = quest_log_repository.end_position()
+            for next_position, quest_log in quest_log_repository.iter_from(position, hunter_id):
+                if next_position > through:
+                    break
+                activities[quest_log.hunter_id].record(quest_log.completed_at.date(), quest_log.stat,
+                                                       quest_log.xp_earned, quest_log.gold_earned)
+                count += 1
+
+            if hunter_id is None:
+                self.rollup_repo.replace_all(activities, through)
+            else:
+                self.rollup_repo.replace(hunter_id, activities[hunter_id], through)
+        return count
+
+
+# Shared by the API routes, so the rollups are held in memory once
+_activity_service: ActivityService | None = None
+_activity_service_lock = threading.Lock()
+
+
+def get_activity_service(config: StorageConfig = storage_config) -> ActivityService:
+    """Get the process-wide activity service."""
+    global _activity_service
+
+    with _activity_service_lock:
+        if _activity_service is None:
+            _activity_service = ActivityService(create_activity_rollup_repository(config))
+
+    return _activity_service
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Maintain the activity rollups")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    rebuild = subparsers.add_parser("rebuild", help="Rebuild the rollups from the quest log")
+    rebuild.add_argument("--hunter-id", default=None,
+                         help="Only rebuild this hunter's rollups (default: every hunter)")
+    args = parser.parse_args()
+
+    service = get_activity_service()
+    count = service.rebuild(create_quest_log_repository(), args.hunter_id)
+    if args.hunter_id is None:
+        print(f"Rebuilt rollups of every hunter from {count} completions")
+        return
+
+    streaks = service.streaks(args.hunter_id)
+    print(f"Rebuilt rollups of '{args.hunter_id}' from {count} completions "
+          f"(current streak {streaks['current_streak']}, longest {streaks['longest_streak']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Hunter state rebuilt from the quest log.
+
+The quest log is the hunters' event stream: every completion records the
+hunter, stat, XP and gold it granted. HunterHistoryService derives a
+hunter's stat XP and earned gold from it, either as of now or as of any
+point in time. Periodic HunterSnapshots (one every `snapshot_interval`
+completions of the hunter) bound the work: a query finds the latest snapshot
+before its point in time by binary search and only reads that hunter's
+completions stored after the snapshot's quest log position, which the log
+repositories reach without reading other hunters' entries.
+
+Queries never write. Snapshots are cut as the quest log writer persists
+completions (refresh_for() is one of its listeners), reading each hunter's
+completions since its latest snapshot, including those logged by other
+processes.
+
+Gold spent or set by hand (PUT /hunter/profile) is not part of the quest
+log, so rebuilt gold is the gold earned from completions.
+"""
+
+from collections.abc import Callable, Iterator
+from datetime import datetime
+
+from entities.hunter import DEFAULT_HUNTER_ID, Hunter
+from entities.hunter_snapshot import HunterSnapshot
+from entities.quest_log import QuestLog
+from repositories.hunter_snapshot_repository import HunterSnapshotRepository
+from repositories.quest_log_repository import widen_end
+from utils.valid_stats import STAT_INDEX, VALID_STATS
+
+# Maps a completion to the (stat, xp, gold) it should grant under a new rule, or None to skip it
+RewardRule = Callable[[QuestLog], tuple[str, int, int] | None]
+
+
+class HunterHistoryService:
+
+    def __init__(self, quest_log_repository, snapshot_repository: HunterSnapshotRepository,
+                 snapshot_interval: int = 1000) -> None:
+        """Initialize HunterHistoryService.
+
+        Args:
+            quest_log_repository: Quest log with iter_from() and count_from()
+            snapshot_repository: Where snapshots are stored
+            snapshot_interval: Completions between two snapshots
+        """
+        self.quest_log_repo = quest_log_repository
+        self.snapshot_repo = snapshot_repository
+        self.snapshot_interval = snapshot_interval
+
+    def state_at(self, hunter_id: str = DEFAULT_HUNTER_ID, moment: datetime | None = None,
+                 name: str = "Hunter") -> dict:
+        """Rebuild a hunter from its nearest snapshot plus its completions after it.
+
+        Args:
+            hunter_id: Hunter to rebuild
+            moment: Include completions at or before this time; None for all of them
+            name: Name given to the rebuilt hunter
+
+        Returns
+            Dictionary with the rebuilt Hunter, the number of completions it
+            reflects and how many of them were replayed past the snapshot
+        """
+        snapshot = self.snapshot_repo.at_or_before(hunter_id, moment) or HunterSnapshot.empty(hunter_id)
+
+        stat_xp = list(snapshot.stat_xp)
+        gold = snapshot.gold
+        replayed = 0
+        for _, quest_log in self._completions(hunter_id, snapshot.position, moment):
+            if quest_log.stat in STAT_INDEX:
+                stat_xp[STAT_INDEX[quest_log.stat]] += quest_log.xp_earned
+            gold += quest_log.gold_earned
+            replayed += 1
+
+        hunter = Hunter(name, gold)
+        for index, stat_name in enumerate(VALID_STATS):
+            hunter.stats[stat_name].total_xp = stat_xp[index]
+
+        return {
+            "hunter": hunter,
+            "completions": snapshot.events + replayed,
+            "replayed": replayed
+        }
+
+    def refresh_for(self, quest_logs: list[QuestLog], position: int | None = None) -> None:
+        """Refresh the snapshots of every hunter with a completion in quest_logs; a QuestLogWriter listener.
+
+        Each hunter is caught up from its latest snapshot, so the batch's position is not needed.
+        """
+        for hunter_id in {quest_log.hunter_id for quest_log in quest_logs}:
+            self.refresh_snapshots(hunter_id)
+
+    def refresh_snapshots(self, hunter_id: str = DEFAULT_HUNTER_ID) -> int:
+        """Snapshot a hunter's completions logged since its latest snapshot, every snapshot_interval completions.
+
+        Args:
+            hunter_id: Hunter to snapshot
+
+        Returns
+            Number of snapshots created
+        """
+        with self.snapshot_repo.lock:
+            latest = self.snapshot_repo.at_or_before(hunter_id) or HunterSnapshot.empty(hunter_id)
+            if self.quest_log_repo.count_from(latest.position, hunter_id) < self.snapshot_interval:
+                return 0
+
+            stat_xp = list(latest.stat_xp)
+            gold = latest.gold
+            events = latest.events
+            until = latest.until
+            since_snapshot = 0
+            created = 0
+
+            for position, quest_log in self.quest_log_repo.iter_from(latest.position, hunter_id):
+                if quest_log.stat in STAT_INDEX:
+                    stat_xp[STAT_INDEX[quest_log.stat]] += quest_log.xp_earned
+                gold += quest_log.gold_earned
+                events += 1
+                until = max(until, quest_log.completed_at)
+                since_snapshot += 1
+
+                if since_snapshot == self.snapshot_interval:
+                    self.snapshot_repo.add(HunterSnapshot(hunter_id, position, until, events, tuple(stat_xp), gold))
+                    since_snapshot = 0
+                    created += 1
+
+            return created
+
+    def _completions(self, hunter_id: str, position: int,
+                     moment: datetime | None) -> Iterator[tuple[int, QuestLog]]:
+        """A hunter's completions stored from a position and completed at or before moment.
+
+        Entries are in completion order give or take MAX_DISORDER, so reading
+        stops at the first one that much past moment.
+        """
+        stop = widen_end(moment) if moment is not None else None
+        for position, quest_log in self.quest_log_repo.iter_from(position, hunter_id):
+            if moment is not None and quest_log.completed_at > moment:
+                if quest_log.completed_at > stop:
+                    return
+                continue
+            yield position, quest_log
+
+    def recompute(self, reward_rule: RewardRule, hunter_id: str = DEFAULT_HUNTER_ID,
+                  moment: datetime | None = None, name: str = "Hunter") -> dict:
+        """Replay every completion of a hunter under a different reward rule, e.g. after changing rewards.
+
+        Snapshots hold the rewards as they were granted, so this replays every
+        completion of the hunter and leaves the snapshots untouched.
+
+        Args:
+            reward_rule: Maps each completion to the (stat, xp, gold) it grants, or None to skip it
+            hunter_id: Hunter to rebuild
+            moment: Include completions at or before this time; None for all of them
+            name: Name given to the rebuilt hunter
+
+        Returns
+            Dictionary with the rebuilt Hunter and the number of completions that granted rewards
+        """
+        stat_xp = [0] * len(VALID_STATS)
+        gold = 0
+        completions = 0
+
+        for _, quest_log in self._completions(hunter_id, 0, moment):
+            reward = reward_rule(quest_log)
+            if reward is None:
+                continue
+            stat_name, xp, reward_gold = reward
+            if stat_name in STAT_INDEX:
+                stat_xp[STAT_INDEX[stat_name]] += xp
+            gold += reward_gold
+            completions += 1
+
+        hunter = Hunter(name, gold)
+        for index, stat_name in enumerate(VALID_STATS):
+            hunter.stats[stat_name].total_xp = stat_xp[index]
+
+        return {
+            "hunter": hunter,
+            "completions": completions
+        }
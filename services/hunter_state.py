@@ -0,0 +1,109 @@
+"""Per-hunter locking and in-memory hunter state for ProgressionService.
+
+Completions are load -> apply -> save sequences on one hunter. Holding a
+single lock around them would serialize every hunter, so HunterLockManager
+hands out one of a fixed set of striped locks per hunter id: completions for
+the same hunter are serialized, completions for different hunters almost
+always take different locks and run in parallel.
+
+HunterStateTable keeps the hunters loaded by those completions, split into
+shards that each have their own lock, so lookups for different hunters do
+not contend either. Each shard evicts its least recently used hunter when
+full, so memory stays bounded as the number of hunters grows. Cached hunters
+carry the version they were saved at; if another process saved the hunter
+since, the next save raises ConcurrentUpdateError and the service reloads it.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from entities.hunter import Hunter
+
+
+class HunterLockManager:
+    """Fixed pool of striped locks, chosen by hunter id.
+
+    Memory stays bounded however many hunters there are; two hunters sharing
+    a stripe only means their completions are serialized.
+    """
+
+    def __init__(self, stripes: int = 64) -> None:
+        """
+        Args:
+            stripes (int): Number of locks in the pool
+        """
+        if stripes < 1:
+            raise ValueError("A lock manager needs at least one stripe")
+        self._locks = [threading.RLock() for _ in range(stripes)]
+
+    def lock_for(self, hunter_id: str) -> threading.RLock:
+        """Get the lock guarding a hunter."""
+        return self._locks[hash(hunter_id) % len(self._locks)]
+
+    @contextmanager
+    def hold(self, hunter_id: str) -> Iterator[None]:
+        """Hold the hunter's lock for the duration of the block.
+
+        Usage:
+            with locks.hold(hunter_id):
+                hunter = ...
+                ...
+        """
+        with self.lock_for(hunter_id):
+            yield
+
+
+class HunterStateTable:
+    """Hunters kept in memory by id, split into independently locked LRU shards."""
+
+    def __init__(self, shards: int = 16, max_hunters: int = 10_000) -> None:
+        """
+        Args:
+            shards (int): Number of shards
+            max_hunters (int): Most hunters kept, spread evenly over the shards
+        """
+        if shards < 1:
+            raise ValueError("A state table needs at least one shard")
+        self._shards: list[OrderedDict[str, Hunter]] = [OrderedDict() for _ in range(shards)]
+        self._shard_locks = [threading.Lock() for _ in range(shards)]
+        self._shard_capacity = max(1, -(-max_hunters // shards))
+
+    def _shard(self, hunter_id: str) -> int:
+        return hash(hunter_id) % len(self._shards)
+
+    def get(self, hunter_id: str) -> Hunter | None:
+        """Get the cached hunter, or None if it is not loaded."""
+        index = self._shard(hunter_id)
+        with self._shard_locks[index]:
+            shard = self._shards[index]
+            hunter = shard.get(hunter_id)
+            if hunter is not None:
+                shard.move_to_end(hunter_id)
+            return hunter
+
+    def put(self, hunter_id: str, hunter: Hunter) -> None:
+        """Cache a hunter as it was last saved."""
+        index = self._shard(hunter_id)
+        with self._shard_locks[index]:
+            shard = self._shards[index]
+            shard[hunter_id] = hunter
+            shard.move_to_end(hunter_id)
+            if len(shard) > self._shard_capacity:
+                shard.popitem(last=False)
+
+    def discard(self, hunter_id: str) -> None:
+        """Drop a cached hunter, e.g. after a failed save left it out of step with storage."""
+        index = self._shard(hunter_id)
+        with self._shard_locks[index]:
+            self._shards[index].pop(hunter_id, None)
+
+    def clear(self) -> None:
+        """Drop every cached hunter."""
+        for shard, lock in zip(self._shards, self._shard_locks):
+            with lock:
+                shard.clear()
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
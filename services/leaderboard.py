@@ -0,0 +1,382 @@
+"""Hunter leaderboards kept up to date as XP is granted.
+
+LeaderboardIndex holds one sorted index of hunters by global XP and one per
+stat in VALID_STATS. ProgressionService records every saved hunter, so the
+indexes never need a full sort: each board is an indexable skip list, so an
+update, the rank of a hunter and the hunters around it all take O(log n).
+
+The indexes live in memory and are rebuilt from the hunter store when the API
+starts. A worker only records its own completions, so with several workers
+LeaderboardRefresher rebuilds the indexes from the store periodically to pick
+up the completions recorded by the others.
+"""
+
+import logging
+import random
+import threading
+from collections.abc import Callable, Iterable
+
+from entities.hunter import Hunter
+from utils import level_resolver
+from utils.valid_stats import VALID_STATS
+
+logger = logging.getLogger(__name__)
+
+# Board ranking hunters by the XP of all their stats
+GLOBAL_BOARD = "global"
+
+# Levels of the skip lists; enough for 2**32 hunters per board
+_MAX_LEVELS = 32
+
+
+class _Node:
+    """A key of a skip list, with its links and the number of positions each one skips."""
+
+    __slots__ = ("key", "links", "widths")
+
+    def __init__(self, key, levels: int) -> None:
+        self.key = key
+        self.links: list[_Node | None] = [None] * levels
+        self.widths = [1] * levels
+
+
+class _RankedKeys:
+    """Unique sorted keys in an indexable skip list.
+
+    Every link also stores how many positions it skips, so inserting or
+    removing a key, counting the keys below a key and finding the key at a
+    position all take O(log n).
+    """
+
+    def __init__(self) -> None:
+        self._tail = _Node(None, 0)
+        self._head = _Node(None, _MAX_LEVELS)
+        self._head.links = [self._tail] * _MAX_LEVELS
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def bisect_left(self, key) -> int:
+        """Number of keys lower than `key`."""
+        return self._path(key)[1][0]
+
+    def insert(self, key) -> None:
+        """Add a key that is not in the list yet."""
+        chain, positions = self._path(key)
+        levels = 1
+        while levels < _MAX_LEVELS and random.random() < 0.5:
+            levels += 1
+
+        node = _Node(key, levels)
+        for level in range(levels):
+            previous = chain[level]
+            skipped = positions[0] - positions[level]
+            node.links[level] = previous.links[level]
+            node.widths[level] = previous.widths[level] - skipped
+            previous.links[level] = node
+            previous.widths[level] = skipped + 1
+        for level in range(levels, _MAX_LEVELS):
+            chain[level].widths[level] += 1
+        self._size += 1
+
+    def remove(self, key) -> None:
+        """
+        Remove a key.
+
+        Raises:
+            KeyError: If the key is not in the list
+        """
+        chain, _ = self._path(key)
+        node = chain[0].links[0]
+        if node is self._tail or node.key != key:
+            raise KeyError(key)
+
+        for level in range(_MAX_LEVELS):
+            previous = chain[level]
+            if previous.links[level] is node:
+                previous.widths[level] += node.widths[level] - 1
+                previous.links[level] = node.links[level]
+            else:
+                previous.widths[level] -= 1
+        self._size -= 1
+
+    def slice(self, start: int, count: int) -> list:
+        """The keys at positions [start, start + count), lowest first."""
+        if start >= self._size or count <= 0:
+            return []
+
+        # Positions of the nodes start at 1, the head is at 0
+        node, position = self._head, 0
+        for level in reversed(range(_MAX_LEVELS)):
+            while node.links[level] is not self._tail and position + node.widths[level] <= start + 1:
+                position += node.widths[level]
+                node = node.links[level]
+
+        keys = []
+        while node is not self._tail and len(keys) < count:
+            keys.append(node.key)
+            node = node.links[0]
+        return keys
+
+    def _path(self, key) -> tuple[list[_Node], list[int]]:
+        """The last node lower than `key` at every level, and the position of each."""
+        chain: list[_Node] = [self._head] * _MAX_LEVELS
+        positions = [0] * _MAX_LEVELS
+        node, position = self._head, 0
+
+        for level in reversed(range(_MAX_LEVELS)):
+            while node.links[level] is not self._tail and node.links[level].key < key:
+                position += node.widths[level]
+                node = node.links[level]
+            chain[level] = node
+            positions[level] = position
+
+        return chain, positions
+
+
+class Leaderboard:
+    """Hunters sorted by XP, highest first; ties are ordered by hunter id.
+
+    Entries are (-xp, hunter_id) keys in an indexable skip list, plus each
+    hunter's XP by id, so a hunter's position is found in O(log n).
+    """
+
+    def __init__(self) -> None:
+        self._keys = _RankedKeys()
+        self._xp: dict[str, int] = {}
+
+    def update(self, hunter_id: str, xp: int) -> None:
+        """Set a hunter's XP, adding the hunter if it is not ranked yet."""
+        previous = self._xp.get(hunter_id)
+        if previous == xp:
+            return
+        if previous is not None:
+            self._keys.remove((-previous, hunter_id))
+        self._keys.insert((-xp, hunter_id))
+        self._xp[hunter_id] = xp
+
+    def remove(self, hunter_id: str) -> None:
+        """Drop a hunter from the board."""
+        previous = self._xp.pop(hunter_id, None)
+        if previous is not None:
+            self._keys.remove((-previous, hunter_id))
+
+    def rank(self, hunter_id: str) -> int | None:
+        """Rank of a hunter, starting at 1; hunters with the same XP share a rank.
+
+        Returns:
+            int | None: The rank, or None if the hunter is not ranked
+        """
+        xp = self._xp.get(hunter_id)
+        if xp is None:
+            return None
+        # (-xp,) sorts before every key with that XP, so this counts the hunters with more XP
+        return self._keys.bisect_left((-xp,)) + 1
+
+    def top(self, limit: int) -> list[dict]:
+        """The `limit` hunters with the most XP, best first."""
+        return self._entries(0, limit)
+
+    def around(self, hunter_id: str, radius: int) -> list[dict]:
+        """The hunter and up to `radius` hunters ranked right above and right below it.
+
+        Returns:
+            list[dict]: The entries, best first; empty if the hunter is not ranked
+        """
+        xp = self._xp.get(hunter_id)
+        if xp is None:
+            return []
+        position = self._keys.bisect_left((-xp, hunter_id))
+        start = max(0, position - radius)
+        return self._entries(start, position + radius + 1 - start)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _entries(self, start: int, count: int) -> list[dict]:
+        """Entries for the positions [start, start + count) of the board."""
+        entries = []
+        rank = None
+        previous_xp = None
+
+        for position, (negative_xp, hunter_id) in enumerate(self._keys.slice(start, count), start):
+            xp = -negative_xp
+            if xp != previous_xp:
+                rank = self._keys.bisect_left((negative_xp,)) + 1
+                previous_xp = xp
+            entries.append({
+                "rank": rank,
+                "hunter_id": hunter_id,
+                "xp": xp,
+                "level": level_resolver.get_level(xp)
+            })
+
+        return entries
+
+
+class LeaderboardIndex:
+    """The global board and one board per stat, updated together under one lock."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._boards = self._empty_boards()
+        # Hunters recorded while a rebuild reads the store, replayed on the rebuilt boards
+        self._recorded_during_rebuild: dict[str, Hunter] | None = None
+        self._rebuild_lock = threading.Lock()
+
+    @staticmethod
+    def _empty_boards() -> dict[str, Leaderboard]:
+        boards = {GLOBAL_BOARD: Leaderboard()}
+        for stat_name in VALID_STATS:
+            boards[stat_name] = Leaderboard()
+        return boards
+
+    @staticmethod
+    def _record(boards: dict[str, Leaderboard], hunter_id: str, hunter: Hunter) -> None:
+        boards[GLOBAL_BOARD].update(hunter_id, hunter.get_global_exp())
+        for stat_name, stat in hunter.stats.items():
+            boards[stat_name].update(hunter_id, stat.total_xp)
+
+    # Public methods
+
+    @property
+    def board_names(self) -> list[str]:
+        return list(self._boards)
+
+    def record(self, hunter_id: str, hunter: Hunter) -> None:
+        """Update every board with the hunter's current XP."""
+        with self._lock:
+            self._record(self._boards, hunter_id, hunter)
+            if self._recorded_during_rebuild is not None:
+                self._recorded_during_rebuild[hunter_id] = hunter
+
+    def rebuild(self, hunters: Iterable[tuple[str, Hunter]]) -> int:
+        """
+        Replace the boards with the given hunters, e.g. every hunter in storage.
+
+        The new boards are built without holding the lock, so completions keep
+        being recorded on the current boards meanwhile. Those completions are
+        then replayed on the new boards, unless the hunter was read at a newer
+        version, so none is lost when the boards are swapped.
+
+        Returns:
+            int: Number of hunters ranked
+        """
+        with self._rebuild_lock:
+            with self._lock:
+                self._recorded_during_rebuild = {}
+
+            try:
+                boards = self._empty_boards()
+                versions = {}
+                for hunter_id, hunter in hunters:
+                    self._record(boards, hunter_id, hunter)
+                    versions[hunter_id] = hunter.version
+
+                with self._lock:
+                    for hunter_id, hunter in self._recorded_during_rebuild.items():
+                        if hunter.version >= versions.get(hunter_id, 0):
+                            self._record(boards, hunter_id, hunter)
+                    self._boards = boards
+                    return len(boards[GLOBAL_BOARD])
+            finally:
+                with self._lock:
+                    self._recorded_during_rebuild = None
+
+    def top(self, board: str, limit: int = 10) -> list[dict]:
+        """
+        The best hunters of a board.
+
+        Raises:
+            KeyError: If the board does not exist
+        """
+        with self._lock:
+            return self._boards[board].top(limit)
+
+    def size(self, board: str) -> int:
+        """
+        Number of hunters ranked on a board.
+
+        Raises:
+            KeyError: If the board does not exist
+        """
+        with self._lock:
+            return len(self._boards[board])
+
+    def standing(self, board: str, hunter_id: str, radius: int = 2) -> dict | None:
+        """
+        A hunter's rank on a board and the hunters around it.
+
+        Returns:
+            dict | None: rank, xp, total_hunters and neighbors (entries best
+            first, including the hunter); None if the hunter is not ranked
+
+        Raises:
+            KeyError: If the board does not exist
+        """
+        with self._lock:
+            leaderboard = self._boards[board]
+            rank = leaderboard.rank(hunter_id)
+            if rank is None:
+                return None
+            neighbors = leaderboard.around(hunter_id, radius)
+            return {
+                "rank": rank,
+                "xp": next(entry["xp"] for entry in neighbors if entry["hunter_id"] == hunter_id),
+                "total_hunters": len(leaderboard),
+                "neighbors": neighbors
+            }
+
+
+class LeaderboardRefresher:
+    """Rebuilds a leaderboard index from storage at a fixed interval, in a background thread.
+
+    Each worker of the API only records its own completions, so this is what
+    brings the completions of the other workers (and of the CLI) onto its boards.
+    """
+
+    def __init__(self, index: LeaderboardIndex, hunters: Callable[[], Iterable[tuple[str, Hunter]]],
+                 interval: float) -> None:
+        """
+        Args:
+            index: The index to rebuild
+            hunters: Returns every stored hunter as (hunter_id, Hunter) pairs
+            interval: Seconds between two rebuilds
+        """
+        self.index = index
+        self.hunters = hunters
+        self.interval = interval
+        self.rebuilds = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="leaderboard-refresher", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop refreshing; an ongoing rebuild is finished first."""
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.index.rebuild(self.hunters())
+                self.rebuilds += 1
+            except Exception:
+                logger.exception("Failed to refresh the leaderboards, keeping the current boards")
+
+
+# Shared by every ProgressionService of the process
+_leaderboard_index: LeaderboardIndex | None = None
+_leaderboard_index_lock = threading.Lock()
+
+
+def get_leaderboard_index() -> LeaderboardIndex:
+    """Get the process-wide leaderboard index."""
+    global _leaderboard_index
+
+    with _leaderboard_index_lock:
+        if _leaderboard_index is None:
+            _leaderboard_index = LeaderboardIndex()
+
+    return _leaderboard_index
@@ -1,6 +1,24 @@
+import logging
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import TypeVar
+
+from entities.hunter import DEFAULT_HUNTER_ID, Hunter
+from entities.quest import Quest
 from entities.quest_difficulty import QuestDifficulty
+from entities.quest_log import QuestLog
+from repositories.exceptions import ConcurrentUpdateError
 from repositories.hunter_repository import HunterRepository
 from repositories.quest_repository import QuestRepository
+from services.activity_service import ActivityService
+from services.hunter_state import HunterLockManager, HunterStateTable
+from services.leaderboard import LeaderboardIndex
+from services.quest_log_writer import QuestLogWriter
+from utils.xp_curve import DEFAULT_XP_CURVE, XPCurve
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
 
 class ProgressionService:
 
@@ -13,38 +31,137 @@ class ProgressionService:
         QuestDifficulty.LEGENDARY: (5000, 1000)
     }
 
+    # Attempts at load -> apply -> save before giving up on a contended hunter profile
+    MAX_SAVE_ATTEMPTS = 5
+
     @staticmethod
     def get_difficulty_rewards(difficulty: QuestDifficulty) -> tuple[int, int]:
         """Get XP and gold rewards for a given difficulty level."""
         return ProgressionService.DIFFICULTY_REWARDS[difficulty]
 
-    def __init__(self, hunter_repository: HunterRepository, quest_repository: QuestRepository):
-        """Initialize ProgressionService with required repositories."""
+    def __init__(self, hunter_repository: HunterRepository, quest_repository: QuestRepository,
+                 xp_curve: XPCurve = DEFAULT_XP_CURVE, quest_log_writer: QuestLogWriter | None = None,
+                 hunter_locks: HunterLockManager | None = None, hunter_states: HunterStateTable | None = None,
+                 leaderboard: LeaderboardIndex | None = None, activity_service: ActivityService | None = None):
+        """Initialize ProgressionService with required repositories and the XP curve used for levels.
+
+        Completions are recorded to the quest log through quest_log_writer, when given.
+        Completions for one hunter are serialized by hunter_locks, and the
+        hunters they load are kept in hunter_states between completions.
+        Saved hunters are recorded on leaderboard, and completions in the
+        activity rollups of activity_service, when given; with a quest log
+        writer the rollups are updated from its persisted batches.
+        """
         self.hunter_repo = hunter_repository
         self.quest_repo = quest_repository  
+        self.xp_curve = xp_curve
+        self.quest_log_writer = quest_log_writer
+        self.hunter_locks = hunter_locks if hunter_locks is not None else HunterLockManager()
+        self.hunter_states = hunter_states if hunter_states is not None else HunterStateTable()
+        self.leaderboard = leaderboard
+        self.activity_service = activity_service
+        # Latest save of each hunter that may not be persisted yet, guarded by the hunter's lock
+        self._pending_saves: dict[str, Future] = {}
+
+        if quest_log_writer is not None and activity_service is not None:
+            quest_log_writer.add_listener(activity_service.record_many)
+
+    def _record_completion(self, quest: Quest, hunter_id: str) -> None:
+        """Queue a quest log for a saved completion; its activity is recorded once it is written.
+
+        The hunter is already saved, so failing to record the activity is
+        logged instead of failing the completion.
+        """
+        quest_log = QuestLog(quest.id, quest.xp_reward, quest.gold_reward, quest.stat, hunter_id)
+        if self.quest_log_writer is not None:
+            self.quest_log_writer.submit(quest_log)
+        elif self.activity_service is not None:
+            try:
+                self.activity_service.record(quest_log)
+            except Exception:
+                logger.exception("Could not record the activity of hunter %s", hunter_id)
+
+    def _update_hunter(self, hunter_id: str, apply: Callable[[Hunter], T]) -> tuple[Hunter, T]:
+        """Apply a change to a hunter and save it, holding the hunter's lock.
+
+        The hunter comes from the in-memory state table when it is there. If
+        another process saved the hunter since, the save is rejected; the
+        hunter is then reloaded and the change applied again.
+
+        The lock is released before waiting for the save to be persisted, so
+        the next change of the hunter builds on the saved state meanwhile and
+        a group-commit writer can coalesce both saves into one write. A save
+        building on one that gets rejected is rejected as well.
+
+        Args:
+            hunter_id: ID of the hunter to change
+            apply: Mutates the hunter and returns the outcome of the change
+
+        Returns
+            The saved hunter and the value returned by apply
 
-    def _calculate_level_change(self, stat, xp_to_add: int) -> tuple[int, int]:
-        """Calculate level before and after adding XP.
-        Returns:
-            Tuple of (level_before, level_after)
+        Raises:
+            ValueError: If the hunter is unknown or apply rejects the change; nothing is saved
+            ConcurrentUpdateError: If every attempt at saving was rejected
         """
-        level_before = stat.get_level()
-        stat.add_exp(xp_to_add)
-        level_after = stat.get_level()
-        return (level_before, level_after)
-    
+        hunter_repo = self.hunter_repo.for_hunter(hunter_id)
+
+        for attempt in range(self.MAX_SAVE_ATTEMPTS):
+            with self.hunter_locks.hold(hunter_id):
+                after = self._pending_saves.get(hunter_id)
+                if after is not None and after.done():
+                    # A rejected save leaves the cached state ahead of storage
+                    if after.exception() is not None:
+                        self.hunter_states.discard(hunter_id)
+                    del self._pending_saves[hunter_id]
+                    after = None
+
+                hunter = self.hunter_states.get(hunter_id) or hunter_repo.load()
+                # The hunter is changed in place, so it only goes back in the table once saved
+                self.hunter_states.discard(hunter_id)
+
+                try:
+                    outcome = apply(hunter)
+                    pending = hunter_repo.save(hunter, wait=False, after=after)
+                except ConcurrentUpdateError:
+                    if attempt == self.MAX_SAVE_ATTEMPTS - 1:
+                        raise
+                    continue
+
+                self.hunter_states.put(hunter_id, hunter.copy())
+                if pending is not None:
+                    self._pending_saves[hunter_id] = pending
+                if self.leaderboard is not None:
+                    self.leaderboard.record(hunter_id, hunter)
+
+            if pending is None:
+                return hunter, outcome
+            try:
+                pending.result()
+            except ConcurrentUpdateError:
+                if attempt == self.MAX_SAVE_ATTEMPTS - 1:
+                    raise
+                continue
+            finally:
+                with self.hunter_locks.hold(hunter_id):
+                    if pending.exception() is not None:
+                        self.hunter_states.discard(hunter_id)
+                    if self._pending_saves.get(hunter_id) is pending:
+                        del self._pending_saves[hunter_id]
+            return hunter, outcome
+
     # El método más importante de todo
-    def complete_quest(self, quest_id: str) -> dict:
+    def complete_quest(self, quest_id: str, hunter_id: str = DEFAULT_HUNTER_ID) -> dict:
         """Complete a quest and apply rewards to hunter.
         
         Args:
             quest_id: ID of the completed Quest
+            hunter_id: ID of the hunter who completed it
             
         Returns
-            Dictionary with completion results
+            Dictionary with the quest name and the RewardResult of the completion
         """
         
-        hunter = self.hunter_repo.load()
         quest = self.quest_repo.get_by_id(quest_id)
 
         if quest is None:
@@ -53,23 +170,88 @@ class ProgressionService:
                 "error": "Quest not found"
             }
 
-        stat = hunter.stats[quest.stat]
+        try:
+            _, result = self._update_hunter(
+                hunter_id,
+                lambda hunter: hunter.apply_rewards({quest.stat: quest.xp_reward}, quest.gold_reward, self.xp_curve)
+            )
+        except ValueError as error:
+            return {
+                "success": False,
+                "error": str(error)
+            }
+        except ConcurrentUpdateError:
+            return {
+                "success": False,
+                "error": "Hunter profile is being updated concurrently, try again"
+            }
+
+        self._record_completion(quest, hunter_id)
+
+        return {
+            "success": True,
+            "quest_name": quest.name,
+            "result": result
+        }
+
+    def complete_many(self, quest_ids: list[str], hunter_id: str = DEFAULT_HUNTER_ID) -> dict:
+        """Complete several quests in order with one hunter load and one save.
 
-        level_before, level_after = self._calculate_level_change(stat, quest.xp_reward)
+        The batch is all-or-nothing: if any quest is unknown or cannot be
+        applied, nothing is saved.
 
-        hunter.add_gold(quest.gold_reward)
+        Args:
+            quest_ids: IDs of the completed quests, in completion order. A quest may repeat.
+            hunter_id: ID of the hunter who completed them
 
-        self.hunter_repo.save(hunter)
+        Returns
+            Dictionary with a (quest, RewardResult) pair per completion, in order,
+            and the hunter's gold after the batch
+        """
 
+        if not quest_ids:
+            return {
+                "success": False,
+                "error": "No quests to complete"
+            }
+
+        quests = self.quest_repo.get_many(quest_ids)
+        missing = [quest_id for quest_id in dict.fromkeys(quest_ids) if quest_id not in quests]
+        if missing:
+            return {
+                "success": False,
+                "error": f"Quests not found: {', '.join(missing)}"
+            }
+
+        def apply_all(hunter: Hunter) -> list:
+            completed = []
+            for quest_id in quest_ids:
+                quest = quests[quest_id]
+                try:
+                    result = hunter.apply_rewards({quest.stat: quest.xp_reward}, quest.gold_reward, self.xp_curve)
+                except ValueError as error:
+                    raise ValueError(f"Quest '{quest.name}': {error}") from error
+                completed.append((quest, result))
+            return completed
+
+        try:
+            hunter, completed = self._update_hunter(hunter_id, apply_all)
+        except ValueError as error:
+            return {
+                "success": False,
+                "error": str(error)
+            }
+        except ConcurrentUpdateError:
+            return {
+                "success": False,
+                "error": "Hunter profile is being updated concurrently, try again"
+            }
+
+        for quest, _ in completed:
+            self._record_completion(quest, hunter_id)
 
         return {
             "success": True,
-            "quest_name": quest.name,
-            "stat": quest.stat,
-            "xp_gained": quest.xp_reward,
-            "level_before": level_before,
-            "level_after": level_after,
-            "leveled_up": level_after > level_before,
-            "gold_gained": quest.gold_reward,
+            "completed": completed,
             "total_gold": hunter.gold
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,270 @@
+"""Background writer for the quest completion log.
+
+Completions are recorded without touching the log storage on the request
+path: ProgressionService hands each QuestLog to QuestLogWriter.submit(),
+which only puts it on a bounded in-memory queue. A background thread drains
+the queue and persists the records in batches through the configured quest
+log repository (one add_many() per batch). When the queue is full, submit()
+blocks until the writer catches up, so records are never dropped for lack
+of space. close() writes everything still queued before returning; the API
+calls it on shutdown and it is registered with atexit for the CLI.
+
+Every completion keeps the time it was stamped with. Each batch is written
+sorted by completion time, but a completion stamped before the last one
+already written (a request that lost the race to the queue, or another
+process's writer) lands slightly out of order. The log readers bisect on
+completed_at with bounds widened by MAX_DISORDER, so that is harmless;
+completions later than that are logged and counted as `late`, since range
+reads may miss them.
+
+A batch that fails to persist is retried. The log repositories remove any
+part of a failed append before raising, so a retry never duplicates entries.
+
+Listeners added with add_listener() are called from the background thread
+with every batch once it is persisted, and the log position right after it,
+e.g. to keep rollups derived from the log up to date. A failing listener is
+logged and does not affect the log.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
+
+from entities.quest_log import QuestLog
+from repositories.config import StorageConfig, storage_config
+from repositories.factory import create_quest_log_repository
+from repositories.quest_log_repository import MAX_DISORDER
+
+logger = logging.getLogger(__name__)
+
+
+class QuestLogWriter:
+    """Bounded queue of quest logs drained in batches by a background thread.
+
+    Attributes:
+        max_queue: Records the queue holds before submit() blocks
+        batch_size: Most records persisted by one add_many() call
+        max_delay: Seconds the writer waits for a batch to fill after its first record
+        max_attempts: Tries at persisting a batch before it is dropped and logged
+    """
+
+    # Marks the end of the queue on close()
+    _STOP = object()
+
+    def __init__(self, repository, max_queue: int = 10_000, batch_size: int = 256,
+                 max_delay: float = 0.05, max_attempts: int = 3) -> None:
+        """
+        Args:
+            repository: Quest log repository with an add_many(quest_logs) method
+            max_queue (int): Records the queue holds before submit() blocks
+            batch_size (int): Most records persisted per batch
+            max_delay (float): Seconds to wait for a batch to fill
+            max_attempts (int): Tries at persisting a batch before dropping it
+        """
+        self.repository = repository
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+
+        # Items are (enqueue time, QuestLog), so the lag of the oldest record is known
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._stats_lock = threading.Lock()
+        self._submitted = 0
+        self._written = 0
+        self._dropped = 0
+        self._batches = 0
+        self._full_waits = 0
+        self._listener_errors = 0
+        self._late = 0
+        self._last_batch_lag = 0.0
+        self._last_completed_at: datetime | None = None
+        self._closed = False
+        self._listeners: list[Callable[[list[QuestLog], int], None]] = []
+
+        self._thread = threading.Thread(target=self._run, name="quest-log-writer", daemon=True)
+        self._thread.start()
+
+    # Public methods
+
+    def submit(self, quest_log: QuestLog) -> None:
+        """
+        Queue a quest log for writing. Blocks only while the queue is full.
+
+        Raises:
+            RuntimeError: If the writer is closed
+        """
+        if self._closed:
+            raise RuntimeError("Quest log writer is closed")
+
+        item = (time.monotonic(), quest_log)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._stats_lock:
+                self._full_waits += 1
+            self._queue.put(item)
+
+        with self._stats_lock:
+            self._submitted += 1
+
+    def add_listener(self, listener: Callable[[list[QuestLog], int], None]) -> None:
+        """
+        Call listener with each batch of quest logs after it is persisted, and
+        the log position right after the batch (see the repositories' iter_from()).
+        Adding the same listener again has no effect.
+        """
+        with self._stats_lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def flush(self) -> None:
+        """Block until every record submitted so far has been written (or dropped)."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write every queued record, then stop the background thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put((time.monotonic(), self._STOP))
+        self._thread.join()
+
+    def metrics(self) -> dict:
+        """
+        Get queue and throughput metrics.
+
+        Returns:
+            dict: queue_depth and max_queue; pending (queued or in the batch
+            being written); submitted, written and dropped record counts;
+            batches written; full_waits (submissions that had to wait for
+            space); listener_errors (batches a listener failed on); late
+            (records written more than MAX_DISORDER behind an earlier one);
+            oldest_pending_seconds (age of the oldest queued record)
+            and last_batch_lag_seconds (age of the oldest record of the last
+            batch when it was written)
+        """
+        with self._queue.mutex:
+            depth = len(self._queue.queue)
+            oldest = self._queue.queue[0][0] if depth else None
+
+        with self._stats_lock:
+            return {
+                "queue_depth": depth,
+                "max_queue": self.max_queue,
+                "pending": self._submitted - self._written - self._dropped,
+                "submitted": self._submitted,
+                "written": self._written,
+                "dropped": self._dropped,
+                "batches": self._batches,
+                "full_waits": self._full_waits,
+                "listener_errors": self._listener_errors,
+                "late": self._late,
+                "oldest_pending_seconds": time.monotonic() - oldest if oldest is not None else 0.0,
+                "last_batch_lag_seconds": self._last_batch_lag,
+            }
+
+    # Background thread
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_delay
+
+            while len(batch) < self.batch_size and batch[-1][1] is not self._STOP:
+                timeout = deadline - time.monotonic()
+                try:
+                    batch.append(self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if batch[-1][1] is self._STOP:
+                stopping = True
+                batch.pop()
+                self._queue.task_done()
+
+            if batch:
+                self._write(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    def _write(self, batch: list[tuple[float, QuestLog]]) -> None:
+        """Persist one batch in completion order, retrying failures with a short backoff."""
+        quest_logs = sorted((quest_log for _, quest_log in batch), key=lambda quest_log: quest_log.completed_at)
+        late = 0
+        if self._last_completed_at is not None:
+            cutoff = self._last_completed_at - MAX_DISORDER
+            while late < len(quest_logs) and quest_logs[late].completed_at < cutoff:
+                late += 1
+        if late:
+            logger.warning("Writing %d quest logs more than %s behind the last one written",
+                           late, MAX_DISORDER)
+
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                position = self.repository.add_many(quest_logs)
+                break
+            except Exception:
+                if attempt == self.max_attempts:
+                    logger.exception("Dropping %d quest logs after %d failed writes", len(quest_logs), attempt)
+                    with self._stats_lock:
+                        self._dropped += len(quest_logs)
+                    return
+                time.sleep(0.05 * attempt)
+
+        if self._last_completed_at is None or quest_logs[-1].completed_at > self._last_completed_at:
+            self._last_completed_at = quest_logs[-1].completed_at
+        with self._stats_lock:
+            self._late += late
+            self._written += len(quest_logs)
+            self._batches += 1
+            self._last_batch_lag = time.monotonic() - batch[0][0]
+            listeners = list(self._listeners)
+
+        for listener in listeners:
+            try:
+                listener(quest_logs, position)
+            except Exception:
+                logger.exception("Quest log listener %r failed on a batch of %d logs", listener, len(quest_logs))
+                with self._stats_lock:
+                    self._listener_errors += 1
+
+
+# Shared by every ProgressionService of the process
+_quest_log_writer: QuestLogWriter | None = None
+_quest_log_writer_lock = threading.Lock()
+
+
+def get_quest_log_writer(config: StorageConfig = storage_config) -> QuestLogWriter | None:
+    """Get the process-wide quest log writer, or None when QUEST_LOG_ENABLED is off."""
+    global _quest_log_writer
+
+    if not config.QUEST_LOG_ENABLED:
+        return None
+
+    with _quest_log_writer_lock:
+        if _quest_log_writer is None:
+            _quest_log_writer = QuestLogWriter(
+                create_quest_log_repository(config),
+                max_queue=config.QUEST_LOG_QUEUE_SIZE,
+                batch_size=config.QUEST_LOG_BATCH_SIZE,
+                max_delay=config.QUEST_LOG_MAX_DELAY_MS / 1000
+            )
+            atexit.register(close_quest_log_writer)
+
+    return _quest_log_writer
+
+
+def close_quest_log_writer() -> None:
+    """Write the queued quest logs and stop the writer, if one was started."""
+    global _quest_log_writer
+
+    with _quest_log_writer_lock:
+        if _quest_log_writer is not None:
+            _quest_log_writer.close()
+            _quest_log_writer = None
@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 from entities.quest import Quest
 from entities.quest_difficulty import QuestDifficulty
 from repositories.quest_repository import QuestRepository
@@ -10,6 +12,13 @@ class QuestService:
 
     def get_all(self) -> list[Quest]:
         return self.quest_repository.get_all()
+
+    def iter_all(self) -> Iterator[Quest]:
+        """Iterate over all quests one at a time, without building the full list.
+        Returns:
+            Iterator[Quest]: The quests in catalog order.
+        """
+        return self.quest_repository.iter_all()
     
     def create_quest(self, name: str, stat_type: str, difficulty: QuestDifficulty,
                      xp_reward: int, gold_reward: int, description: str) -> tuple[bool, str]:
@@ -53,7 +62,47 @@ class QuestService:
         
         listed_quests = self.quest_repository.get_by_stat(stat_name)
         return listed_quests
+
+    def iter_by_stat(self, stat_name: str) -> Iterator[Quest]:
+        """Iterate over the quests of a specific stat one at a time.
+        Args:
+            stat_name (str): The stat name to filter quests by.
+        Returns:
+            Iterator[Quest]: The matching quests; empty for an unknown stat.
+        """
+
+        if stat_name not in VALID_STATS:
+            return iter(())
+
+        return self.quest_repository.iter_by_stat(stat_name)
     
+    def find_quests(self, stat_name: str | None = None, difficulty: QuestDifficulty | None = None,
+                    min_xp: int | None = None, max_xp: int | None = None,
+                    min_gold: int | None = None, max_gold: int | None = None) -> list[Quest]:
+        """List quests matching every given filter. Reward bounds are inclusive.
+        Args:
+            stat_name (str | None): The stat name to filter quests by.
+            difficulty (QuestDifficulty | None): The difficulty to filter quests by.
+            min_xp (int | None): Minimum XP reward.
+            max_xp (int | None): Maximum XP reward.
+            min_gold (int | None): Minimum gold reward.
+            max_gold (int | None): Maximum gold reward.
+        Returns:
+            list[Quest]: A list of Quest objects that match all filters.
+        """
+
+        if stat_name is not None and stat_name not in VALID_STATS:
+            return []
+
+        return self.quest_repository.find(
+            stat=stat_name,
+            difficulty=difficulty,
+            min_xp=min_xp,
+            max_xp=max_xp,
+            min_gold=min_gold,
+            max_gold=max_gold
+        )
+
     def delete_quest(self, quest_id: str) -> bool:
         """Delete a quest by its ID.
         Args:
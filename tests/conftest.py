@@ -0,0 +1,14 @@
+"""Shared fixtures of the test suite."""
+
+import pytest
+
+from entities.quest import Quest
+from entities.quest_difficulty import QuestDifficulty
+
+
+@pytest.fixture
+def make_quest():
+    """Build a Quest with small default rewards."""
+    def make(name: str = "Run", stat: str = "Agility", xp_reward: int = 100, gold_reward: int = 10) -> Quest:
+        return Quest(name, stat, QuestDifficulty.EASY, xp_reward, gold_reward, f"{name} quest")
+    return make
@@ -0,0 +1,99 @@
+"""Streak and daily-activity rollups, their journal, and rebuilds from the quest log."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from entities.quest_log import QuestLog
+from repositories.activity_rollup_repository import ActivityRollupRepository
+from repositories.quest_log_repository import QuestLogRepository
+from services.activity_service import ActivityService
+
+DAY = date(2026, 3, 2)
+
+
+def completion(day_offset: int, hunter_id: str = "alpha", stat: str = "Agility", xp: int = 10) -> QuestLog:
+    completed_at = datetime.combine(DAY + timedelta(days=day_offset), datetime.min.time()) + timedelta(hours=9)
+    return QuestLog.from_record("quest", xp, 1, completed_at, stat, hunter_id)
+
+
+@pytest.fixture
+def rollups(tmp_path):
+    return ActivityRollupRepository(str(tmp_path / "activity_rollups.json"), compact_threshold=5)
+
+
+def test_streaks_follow_consecutive_active_days(rollups):
+    service = ActivityService(rollups)
+    service.record_many([completion(offset) for offset in (0, 1, 2, 5, 6)])
+
+    assert service.streaks("alpha", DAY + timedelta(days=6)) == {
+        "current_streak": 2, "longest_streak": 3, "last_active": DAY + timedelta(days=6)}
+    # The streak stays current through the day after the last active one
+    assert service.streaks("alpha", DAY + timedelta(days=7))["current_streak"] == 2
+    assert service.streaks("alpha", DAY + timedelta(days=9))["current_streak"] == 0
+    assert service.streaks("nobody", DAY)["longest_streak"] == 0
+
+
+def test_calendar_sums_each_day_per_stat(rollups):
+    service = ActivityService(rollups)
+    service.record_many([completion(0, stat="Agility", xp=10), completion(0, stat="Strength", xp=5),
+                         completion(2, xp=7)])
+
+    calendar = service.calendar("alpha", DAY, DAY + timedelta(days=3))
+
+    assert [entry["day"] for entry in calendar] == [DAY, DAY + timedelta(days=2)]
+    assert (calendar[0]["completions"], calendar[0]["total_xp"], calendar[0]["gold"]) == (2, 15, 2)
+    assert calendar[0]["xp_by_stat"]["Strength"] == 5
+
+
+def test_another_instance_reads_the_journal_and_compactions(tmp_path, rollups):
+    service = ActivityService(rollups)
+    for offset in range(12):
+        service.record(completion(offset))
+
+    reopened = ActivityRollupRepository(str(tmp_path / "activity_rollups.json"))
+    assert reopened.streaks("alpha", DAY + timedelta(days=11))["current_streak"] == 12
+    assert len(reopened.days("alpha", DAY, DAY + timedelta(days=30))) == 12
+
+
+def test_rebuild_matches_incremental_rollups(tmp_path, rollups):
+    log = QuestLogRepository(str(tmp_path / "quest_logs.jsonl"))
+    logs = [completion(offset % 9, hunter_id) for offset in range(30) for hunter_id in ("alpha", "beta")]
+    log.add_many(logs)
+    incremental = ActivityService(ActivityRollupRepository(str(tmp_path / "incremental.json")))
+    incremental.record_many(logs)
+
+    rebuilt = ActivityService(rollups)
+    assert rebuilt.rebuild(log) == len(logs)
+
+    for hunter_id in ("alpha", "beta"):
+        assert rebuilt.calendar(hunter_id, DAY, DAY + timedelta(days=9)) == \
+            incremental.calendar(hunter_id, DAY, DAY + timedelta(days=9))
+
+
+def test_batches_a_rebuild_already_read_are_not_counted_twice(tmp_path, rollups):
+    log = QuestLogRepository(str(tmp_path / "quest_logs.jsonl"))
+    service = ActivityService(rollups)
+    first = [completion(0), completion(1)]
+    first_position = log.add_many(first)
+
+    # The rebuild reads the batch before the writer's listener call for it comes in
+    service.rebuild(log)
+    service.record_many(first, first_position)
+    assert rollups.get("alpha").days[DAY].completions == 1
+
+    second = [completion(1)]
+    service.record_many(second, log.add_many(second))
+    assert rollups.get("alpha").days[DAY + timedelta(days=1)].completions == 2
+
+
+def test_rebuilding_one_hunter_leaves_the_others(tmp_path, rollups):
+    log = QuestLogRepository(str(tmp_path / "quest_logs.jsonl"))
+    service = ActivityService(rollups)
+    service.record_many([completion(0, "beta")])
+    log.add_many([completion(0, "alpha"), completion(1, "alpha")])
+
+    assert service.rebuild(log, "alpha") == 2
+
+    assert rollups.get("beta").days[DAY].completions == 1
+    assert rollups.get("alpha").longest_streak == 2
@@ -0,0 +1,82 @@
+"""Batch completions of ProgressionService: one save, in order, all or nothing."""
+
+import pytest
+
+from repositories.hunter_repository import HunterRepository
+from repositories.quest_log_repository import QuestLogRepository
+from repositories.quest_repository import QuestRepository
+from services.progression_service import ProgressionService
+from services.quest_log_writer import QuestLogWriter
+
+
+@pytest.fixture
+def quests(tmp_path):
+    return QuestRepository(str(tmp_path / "quests.json"))
+
+
+def test_batch_applies_every_completion_in_order_with_one_save(tmp_path, quests, make_quest):
+    run = make_quest("Run", stat="Agility", xp_reward=100, gold_reward=10)
+    read = make_quest("Read", stat="Intelligence", xp_reward=50, gold_reward=5)
+    quests.add(run)
+    quests.add(read)
+    hunter_path = str(tmp_path / "hunter.json")
+    service = ProgressionService(HunterRepository(hunter_path), quests)
+    version = HunterRepository(hunter_path).load().version
+
+    result = service.complete_many([run.id, read.id, run.id])
+
+    assert result["success"]
+    assert [quest.id for quest, _ in result["completed"]] == [run.id, read.id, run.id]
+    assert result["total_gold"] == 25
+    hunter = HunterRepository(hunter_path).load()
+    assert hunter.version == version + 1
+    assert hunter.stats["Agility"].total_xp == 200
+    assert hunter.stats["Intelligence"].total_xp == 50
+
+
+def test_unknown_quest_rejects_the_whole_batch(tmp_path, quests, make_quest):
+    run = make_quest()
+    quests.add(run)
+    hunter_path = str(tmp_path / "hunter.json")
+    service = ProgressionService(HunterRepository(hunter_path), quests)
+
+    result = service.complete_many([run.id, "missing", "missing"])
+
+    assert result == {"success": False, "error": "Quests not found: missing"}
+    assert HunterRepository(hunter_path).load().gold == 0
+
+
+def test_invalid_completion_leaves_no_partial_change(tmp_path, quests, make_quest):
+    run = make_quest("Run", gold_reward=10)
+    broken = make_quest("Broken", stat="Charisma")
+    quests.add(run)
+    quests.add(broken)
+    hunter_path = str(tmp_path / "hunter.json")
+    service = ProgressionService(HunterRepository(hunter_path), quests)
+
+    result = service.complete_many([run.id, broken.id])
+
+    assert not result["success"]
+    assert "Broken" in result["error"]
+    assert HunterRepository(hunter_path).load().gold == 0
+    # The cached hunter was not left with the first completion applied either
+    assert service.complete_quest(run.id)["success"]
+    assert HunterRepository(hunter_path).load().gold == 10
+
+
+def test_empty_batch_is_rejected(tmp_path, quests):
+    service = ProgressionService(HunterRepository(str(tmp_path / "hunter.json")), quests)
+    assert not service.complete_many([])["success"]
+
+
+def test_every_completion_of_a_batch_is_logged(tmp_path, quests, make_quest):
+    run = make_quest()
+    quests.add(run)
+    log = QuestLogRepository(str(tmp_path / "quest_logs.jsonl"))
+    writer = QuestLogWriter(log, max_delay=0.01)
+    service = ProgressionService(HunterRepository(str(tmp_path / "hunter.json")), quests, quest_log_writer=writer)
+
+    assert service.complete_many([run.id] * 3)["success"]
+    writer.close()
+
+    assert [quest_log.quest_id for quest_log in log.get_all()] == [run.id] * 3
@@ -0,0 +1,95 @@
+"""Optimistic version checks of the file repositories, and retries on conflicts."""
+
+import threading
+
+import pytest
+
+from repositories.exceptions import ConcurrentUpdateError
+from repositories.hunter_repository import HunterRepository
+from repositories.quest_repository import QuestRepository
+from services.progression_service import ProgressionService
+
+
+def test_stale_hunter_save_is_rejected(tmp_path):
+    path = str(tmp_path / "hunter.json")
+    first = HunterRepository(path).load()
+    second = HunterRepository(path).load()
+
+    first.gold = 10
+    HunterRepository(path).save(first)
+
+    second.gold = 20
+    with pytest.raises(ConcurrentUpdateError) as error:
+        HunterRepository(path).save(second)
+
+    assert (error.value.expected_version, error.value.stored_version) == (1, 2)
+    assert HunterRepository(path).load().gold == 10
+
+
+def test_reloaded_hunter_saves_after_conflict(tmp_path):
+    repository = HunterRepository(str(tmp_path / "hunter.json"))
+    stale = repository.load()
+    fresh = repository.load()
+    fresh.gold = 5
+    repository.save(fresh)
+
+    with pytest.raises(ConcurrentUpdateError):
+        repository.save(stale)
+
+    hunter = repository.load()
+    hunter.gold += 1
+    repository.save(hunter)
+    assert repository.load().gold == 6
+    assert repository.load().version == hunter.version
+
+
+def test_progression_retries_after_another_process_saved(tmp_path, make_quest):
+    """Two services stand in for two processes: each caches the hunter it last saved."""
+    hunter_path = str(tmp_path / "hunter.json")
+    quests = QuestRepository(str(tmp_path / "quests.json"))
+    quest = make_quest(gold_reward=10)
+    quests.add(quest)
+
+    first = ProgressionService(HunterRepository(hunter_path), quests)
+    second = ProgressionService(HunterRepository(hunter_path), quests)
+
+    assert first.complete_quest(quest.id)["success"]
+    assert second.complete_quest(quest.id)["success"]
+    # first still caches the hunter at the version it saved, so its save conflicts and is retried
+    assert first.complete_quest(quest.id)["success"]
+
+    assert HunterRepository(hunter_path).load().gold == 30
+
+
+def test_concurrent_completions_lose_no_update(tmp_path, make_quest):
+    hunter_path = str(tmp_path / "hunter.json")
+    quests = QuestRepository(str(tmp_path / "quests.json"))
+    quest = make_quest(gold_reward=1)
+    quests.add(quest)
+    services = [ProgressionService(HunterRepository(hunter_path), quests) for _ in range(4)]
+    results = []
+
+    def complete(service):
+        for _ in range(10):
+            results.append(service.complete_quest(quest.id)["success"])
+
+    threads = [threading.Thread(target=complete, args=(service,)) for service in services]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert HunterRepository(hunter_path).load().gold == results.count(True)
+    assert results.count(True) > 0
+
+
+def test_stale_quest_catalog_save_is_rejected(tmp_path, make_quest):
+    repository = QuestRepository(str(tmp_path / "quests.json"))
+    repository.add(make_quest("First"))
+    data, version = repository._read_catalog()
+
+    repository.add(make_quest("Second"))
+
+    with pytest.raises(ConcurrentUpdateError):
+        repository._save_all_data(data, version)
+    assert {quest.name for quest in repository.get_all()} == {"First", "Second"}
@@ -0,0 +1,163 @@
+"""Batched flushes and preconditions of the group-commit writer."""
+
+import threading
+
+import pytest
+
+from repositories.exceptions import ConcurrentUpdateError
+from repositories.group_commit import GroupCommitWriter
+from repositories.hunter_repository import HunterRepository
+
+
+@pytest.fixture
+def writer():
+    writer = GroupCommitWriter(max_delay=0.05, fsync=False)
+    yield writer
+    writer.close()
+
+
+def read(path) -> bytes:
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+def test_replacements_of_a_file_collapse_into_the_newest(tmp_path, writer):
+    path = str(tmp_path / "profile")
+    futures = [writer.replace(path, data) for data in (b"1", b"2", b"3")]
+    assert writer.unflushed(path) == b"3"
+
+    for future in futures:
+        assert future.result(timeout=5) is None
+    assert read(path) == b"3"
+    assert writer.unflushed(path) is None
+    assert (writer.batches, writer.requests) == (1, 3)
+
+
+def test_appends_are_written_in_submission_order(tmp_path, writer):
+    path = str(tmp_path / "log")
+    futures = [writer.append(path, f"{i}\n".encode()) for i in range(5)]
+    for future in futures:
+        future.result(timeout=5)
+
+    assert read(path) == b"0\n1\n2\n3\n4\n"
+    assert writer.batches == 1
+
+
+def test_every_merged_precondition_is_checked(tmp_path, writer):
+    path = str(tmp_path / "profile")
+    checked = []
+
+    def passes():
+        checked.append("passes")
+
+    def fails():
+        checked.append("fails")
+        raise ConcurrentUpdateError(path, 1, 2)
+
+    futures = [writer.replace(path, b"first", precondition=passes),
+               writer.replace(path, b"second", precondition=fails)]
+
+    for future in futures:
+        with pytest.raises(ConcurrentUpdateError):
+            future.result(timeout=5)
+    assert checked == ["passes", "fails"]
+    assert not (tmp_path / "profile").exists()
+    assert writer.unflushed(path) is None
+
+
+def test_wait_for_returns_once_the_file_is_flushed(tmp_path, writer):
+    path = str(tmp_path / "profile")
+    writer.replace(path, b"data")
+    writer.wait_for(path)
+    assert read(path) == b"data"
+
+
+def test_close_flushes_pending_writes(tmp_path):
+    writer = GroupCommitWriter(max_delay=10, fsync=False)
+    path = str(tmp_path / "profile")
+    future = writer.replace(path, b"data")
+    writer.close()
+
+    assert future.done()
+    assert read(path) == b"data"
+    with pytest.raises(RuntimeError):
+        writer.replace(path, b"late")
+
+
+def test_hunter_loads_only_return_flushed_saves(tmp_path, writer):
+    path = str(tmp_path / "hunter.json")
+    repository = HunterRepository(path, writer=writer)
+    hunter = repository.load()
+    hunter.gold = 42
+    repository.save(hunter)
+
+    assert writer.unflushed(path) is None
+    assert HunterRepository(path).load().gold == 42
+
+
+def test_concurrent_hunter_saves_are_batched_and_checked(tmp_path, writer):
+    repositories = [HunterRepository(str(tmp_path / f"hunter_{i}.json"), writer=writer) for i in range(4)]
+    conflicts = []
+
+    def earn(repository):
+        for _ in range(10):
+            while True:
+                hunter = repository.load()
+                hunter.gold += 1
+                try:
+                    repository.save(hunter)
+                    break
+                except ConcurrentUpdateError:
+                    conflicts.append(repository.filepath)
+
+    threads = [threading.Thread(target=earn, args=(repository,)) for repository in repositories for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [HunterRepository(repository.filepath).load().gold for repository in repositories] == [20] * 4
+    # Saves of different hunters share flushes
+    assert writer.batches < writer.requests
+
+
+def test_saves_building_on_a_pending_save_are_coalesced(tmp_path):
+    writer = GroupCommitWriter(max_delay=10, fsync=False)
+    path = str(tmp_path / "hunter.json")
+    repository = HunterRepository(path, writer=writer)
+    hunter = repository.load()
+    after = None
+    futures = []
+    for _ in range(3):
+        hunter.gold += 1
+        after = repository.save(hunter, wait=False, after=after)
+        futures.append(after)
+    writer.close()
+
+    for future in futures:
+        assert future.result(timeout=5) is None
+    assert HunterRepository(path).load().gold == 3
+    assert (writer.batches, writer.requests) == (1, 3)
+
+
+def test_a_rejected_save_rejects_the_saves_built_on_it(tmp_path):
+    writer = GroupCommitWriter(max_delay=10, fsync=False)
+    path = str(tmp_path / "hunter.json")
+    repository = HunterRepository(path, writer=writer)
+    hunter = repository.load()
+    writer.wait_for(path)
+
+    hunter.gold = 1
+    first = repository.save(hunter, wait=False)
+    hunter.gold = 2
+    second = repository.save(hunter, wait=False, after=first)
+    # Another process saves the profile before the queued saves are flushed
+    other = HunterRepository(path).load()
+    other.gold = 100
+    HunterRepository(path).save(other)
+    writer.close()
+
+    for future in (first, second):
+        with pytest.raises(ConcurrentUpdateError):
+            future.result(timeout=5)
+    assert HunterRepository(path).load().gold == 100
@@ -0,0 +1,28 @@
+"""Running global totals of a hunter."""
+
+from entities.hunter import Hunter
+from utils.xp_curve import DEFAULT_XP_CURVE, XPCurve
+
+
+def test_global_totals_follow_the_curve_given_to_apply_rewards():
+    steep = XPCurve(base_increment=1000, increment_step=1000)
+    hunter = Hunter("Steep")
+    hunter.apply_rewards({"Strength": 1500}, curve=steep)
+
+    assert hunter.get_global_level() == steep.level_for_xp(1500) == 2
+    assert hunter.get_global_xp_for_next_level() == steep.xp_for_next_level(1500)
+
+    # Invalidated totals are recomputed on the same curve
+    hunter.stats["Agility"].total_xp = 2000
+    assert hunter.get_global_level() == steep.level_for_xp(3500)
+    assert hunter.copy().get_global_level() == steep.level_for_xp(3500)
+
+
+def test_switching_curves_resolves_the_totals_again():
+    steep = XPCurve(base_increment=1000, increment_step=1000)
+    hunter = Hunter("Switch")
+    hunter.apply_rewards({"Strength": 1500}, curve=steep)
+    hunter.apply_rewards({"Strength": 1})
+
+    assert hunter.get_global_level() == DEFAULT_XP_CURVE.level_for_xp(1501)
+    assert hunter.get_global_xp_for_next_level() == DEFAULT_XP_CURVE.xp_for_next_level(1501)
@@ -0,0 +1,115 @@
+"""Hunter state rebuilt from the quest log through snapshots at per-hunter log positions."""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from entities.quest_log import QuestLog
+from repositories.hunter_snapshot_repository import HunterSnapshotRepository
+from repositories.quest_log_repository import QuestLogRepository
+from repositories.sqlite import QuestLogRepositorySQLite, SQLiteDatabase
+from services.hunter_history_service import HunterHistoryService
+from utils.valid_stats import VALID_STATS
+
+START = datetime(2026, 1, 1)
+HUNTERS = ["alpha", "beta", "gamma"]
+
+
+def make_logs(count: int, seed: int = 3) -> list[QuestLog]:
+    """Completions one second apart, each stored up to 20 seconds out of order."""
+    rng = random.Random(seed)
+    return [QuestLog.from_record("quest", rng.randint(1, 50), rng.randint(0, 5),
+                                 START + timedelta(seconds=i - rng.uniform(0, 20)),
+                                 rng.choice(VALID_STATS), rng.choice(HUNTERS)) for i in range(count)]
+
+
+def expected(logs: list[QuestLog], hunter_id: str, moment: datetime | None) -> tuple[int, int, int]:
+    completed = [log for log in logs if log.hunter_id == hunter_id and (moment is None or log.completed_at <= moment)]
+    return len(completed), sum(log.gold_earned for log in completed), sum(log.xp_earned for log in completed)
+
+
+@pytest.fixture(params=["jsonl", "binary", "sqlite"])
+def quest_logs(request, tmp_path):
+    if request.param == "jsonl":
+        return QuestLogRepository(str(tmp_path / "quest_logs.jsonl"))
+    if request.param == "binary":
+        pytest.importorskip("numpy")
+        from repositories.binary_quest_log_repository import BinaryQuestLogRepository
+        return BinaryQuestLogRepository(str(tmp_path / "quest_logs.bin"))
+    return QuestLogRepositorySQLite(SQLiteDatabase(str(tmp_path / "hunter.db")))
+
+
+def test_states_match_the_log_at_any_moment(tmp_path, quest_logs):
+    logs = make_logs(900)
+    service = HunterHistoryService(quest_logs, HunterSnapshotRepository(str(tmp_path / "snapshots.jsonl")), 50)
+    for start in range(0, len(logs), 100):
+        batch = logs[start:start + 100]
+        service.refresh_for(batch, quest_logs.add_many(batch))
+    assert service.snapshot_repo.count() > 0
+
+    rng = random.Random(5)
+    moments = [None, START - timedelta(seconds=30)] + [START + timedelta(seconds=rng.uniform(0, 920)) for _ in range(30)]
+    for moment in moments:
+        for hunter_id in HUNTERS:
+            state = service.state_at(hunter_id, moment)
+            hunter = state["hunter"]
+            assert (state["completions"], hunter.gold, hunter.get_global_exp()) == expected(logs, hunter_id, moment)
+
+
+def test_queries_read_only_the_completions_after_the_snapshot(tmp_path, quest_logs):
+    logs = make_logs(300)
+    snapshots = HunterSnapshotRepository(str(tmp_path / "snapshots.jsonl"))
+    service = HunterHistoryService(quest_logs, snapshots, 25)
+    quest_logs.add_many(logs)
+    for hunter_id in HUNTERS:
+        service.refresh_snapshots(hunter_id)
+    count = snapshots.count()
+
+    state = service.state_at("alpha")
+    assert state["replayed"] < 25
+    # Reads never cut snapshots, even when completions were logged since the last one
+    quest_logs.add_many(make_logs(100, seed=4))
+    service.state_at("alpha")
+    assert snapshots.count() == count
+
+
+def test_snapshots_are_reloaded_by_another_process(tmp_path, quest_logs):
+    logs = make_logs(300)
+    path = str(tmp_path / "snapshots.jsonl")
+    quest_logs.add_many(logs)
+    HunterHistoryService(quest_logs, HunterSnapshotRepository(path), 20).refresh_snapshots("beta")
+
+    reopened = HunterHistoryService(quest_logs, HunterSnapshotRepository(path), 20)
+    snapshot = reopened.snapshot_repo.at_or_before("beta")
+    assert snapshot is not None and snapshot.events % 20 == 0
+    assert reopened.state_at("beta")["completions"] == expected(logs, "beta", None)[0]
+    # Catching up again from the stored positions adds no duplicate snapshot
+    assert reopened.refresh_snapshots("beta") == 0
+
+
+def test_iter_from_resumes_a_hunter_after_a_position(quest_logs):
+    logs = make_logs(200)
+    quest_logs.add_many(logs)
+    entries = list(quest_logs.iter_from(0, "gamma"))
+    position = entries[len(entries) // 2][0]
+
+    resumed = [quest_log for _, quest_log in quest_logs.iter_from(position, "gamma")]
+
+    assert [log.completed_at for _, log in entries[len(entries) // 2 + 1:]] == [log.completed_at for log in resumed]
+    assert quest_logs.count_from(position, "gamma") == len(resumed)
+    assert quest_logs.count_from(quest_logs.end_position(), "gamma") == 0
+
+
+def test_recompute_replays_every_completion_under_a_new_rule(tmp_path, quest_logs):
+    logs = make_logs(200)
+    quest_logs.add_many(logs)
+    service = HunterHistoryService(quest_logs, HunterSnapshotRepository(str(tmp_path / "snapshots.jsonl")), 10)
+    service.refresh_snapshots("alpha")
+
+    result = service.recompute(lambda log: (log.stat, log.xp_earned * 2, 0), "alpha")
+
+    completions, _, xp = expected(logs, "alpha", None)
+    assert result["completions"] == completions
+    assert result["hunter"].get_global_exp() == 2 * xp
+    assert result["hunter"].gold == 0
@@ -0,0 +1,85 @@
+"""Striped per-hunter locks and the sharded table of hunters kept between completions."""
+
+import threading
+
+import pytest
+
+from entities.hunter import Hunter
+from repositories.hunter_store import HunterStore
+from repositories.quest_repository import QuestRepository
+from services.hunter_state import HunterLockManager, HunterStateTable
+from services.progression_service import ProgressionService
+
+
+def test_a_hunter_always_gets_the_same_reentrant_lock():
+    locks = HunterLockManager(stripes=8)
+    assert locks.lock_for("alpha") is locks.lock_for("alpha")
+
+    with locks.hold("alpha"):
+        with locks.hold("alpha"):
+            pass
+
+
+def test_invalid_sizes_are_rejected():
+    with pytest.raises(ValueError):
+        HunterLockManager(stripes=0)
+    with pytest.raises(ValueError):
+        HunterStateTable(shards=0)
+
+
+def test_state_table_evicts_the_least_recently_used_hunter_of_a_shard():
+    table = HunterStateTable(shards=1, max_hunters=2)
+    table.put("alpha", Hunter("Alpha"))
+    table.put("beta", Hunter("Beta"))
+    assert table.get("alpha") is not None
+
+    table.put("gamma", Hunter("Gamma"))
+
+    assert table.get("beta") is None
+    assert table.get("alpha").name == "Alpha"
+    assert len(table) == 2
+    table.discard("alpha")
+    table.clear()
+    assert len(table) == 0
+
+
+def test_concurrent_completions_of_many_hunters_lose_no_update(tmp_path, make_quest):
+    quests = QuestRepository(str(tmp_path / "quests.json"))
+    quest = make_quest(gold_reward=1)
+    quests.add(quest)
+    store = HunterStore(str(tmp_path / "hunters"))
+    service = ProgressionService(store, quests, hunter_locks=HunterLockManager(stripes=2),
+                                 hunter_states=HunterStateTable(shards=2, max_hunters=2))
+    hunter_ids = [f"hunter-{i}" for i in range(6)]
+    failures = []
+
+    def complete(hunter_id):
+        for _ in range(15):
+            if not service.complete_quest(quest.id, hunter_id)["success"]:
+                failures.append(hunter_id)
+
+    threads = [threading.Thread(target=complete, args=(hunter_id,)) for hunter_id in hunter_ids for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert failures == []
+    assert [HunterStore(str(tmp_path / "hunters")).load(hunter_id).gold for hunter_id in hunter_ids] == [30] * 6
+
+
+def test_a_rejected_change_leaves_no_cached_state(tmp_path, make_quest):
+    quests = QuestRepository(str(tmp_path / "quests.json"))
+    good = make_quest("Good", gold_reward=5)
+    bad = make_quest("Bad", stat="Charisma", gold_reward=100)
+    quests.add(good)
+    quests.add(bad)
+    states = HunterStateTable()
+    service = ProgressionService(HunterStore(str(tmp_path / "hunters")), quests, hunter_states=states)
+
+    assert service.complete_quest(good.id, "alpha")["success"]
+    assert not service.complete_quest(bad.id, "alpha")["success"]
+
+    assert states.get("alpha") is None
+    assert service.complete_quest(good.id, "alpha")["success"]
+    assert states.get("alpha").gold == 10
@@ -0,0 +1,96 @@
+"""Multi-hunter file store: sharded profile files and the revalidated LRU of loaded hunters."""
+
+import os
+import time
+
+import pytest
+
+from repositories.group_commit import GroupCommitWriter
+from repositories.hunter_repository import HunterRepository
+from repositories.hunter_store import RACY_WINDOW_NS, HunterStore
+
+
+def settle():
+    """Wait until files written so far are old enough to be served from the cache."""
+    time.sleep(2 * RACY_WINDOW_NS / 1e9)
+
+
+def earn(store: HunterStore, hunter_id: str, gold: int) -> None:
+    hunter = store.load(hunter_id)
+    hunter.gold += gold
+    store.save(hunter_id, hunter)
+
+
+def test_each_hunter_gets_its_own_sharded_file(tmp_path):
+    default_path = str(tmp_path / "hunter.json")
+    store = HunterStore(str(tmp_path / "hunters"), default_path=default_path)
+
+    assert store.path_for("default") == default_path
+    path = store.path_for("alpha")
+    assert os.path.dirname(os.path.dirname(path)) == str(tmp_path / "hunters")
+    with pytest.raises(ValueError):
+        store.path_for("../escape")
+
+    earn(store, "alpha", 5)
+    earn(store, "default", 7)
+    assert HunterRepository(path).load().gold == 5
+    assert dict((hunter_id, hunter.gold) for hunter_id, hunter in store.iter_hunters()) == {"default": 7, "alpha": 5}
+
+
+def test_unchanged_profiles_are_served_from_the_cache(tmp_path):
+    store = HunterStore(str(tmp_path / "hunters"))
+    earn(store, "alpha", 5)
+    settle()
+
+    store.load("alpha")
+    hits = store.stats()["hits"]
+    hunter = store.load("alpha")
+    assert store.stats()["hits"] == hits + 1
+
+    # Callers get copies, so changing one does not change the cache
+    hunter.gold = 1000
+    assert store.load("alpha").gold == 5
+
+
+def test_saves_of_another_process_are_picked_up(tmp_path):
+    store = HunterStore(str(tmp_path / "hunters"))
+    earn(store, "alpha", 5)
+    settle()
+    store.load("alpha")
+
+    other = HunterStore(str(tmp_path / "hunters"))
+    earn(other, "alpha", 10)
+
+    assert store.load("alpha").gold == 15
+
+
+def test_recent_writes_are_never_trusted_by_signature(tmp_path):
+    store = HunterStore(str(tmp_path / "hunters"))
+    earn(store, "alpha", 5)
+
+    store.load("alpha")
+    store.load("alpha")
+
+    assert store.stats()["hits"] == 0
+
+
+def test_least_recently_used_hunters_are_evicted(tmp_path):
+    store = HunterStore(str(tmp_path / "hunters"), cache_size=2)
+    for hunter_id in ("alpha", "beta", "gamma"):
+        earn(store, hunter_id, 1)
+    for hunter_id in ("alpha", "beta", "gamma"):
+        store.load(hunter_id)
+
+    stats = store.stats()
+    assert (stats["cached"], stats["evictions"]) == (2, 1)
+
+
+def test_group_committed_saves_are_loaded_once_flushed(tmp_path):
+    writer = GroupCommitWriter(max_delay=0.01, fsync=False)
+    try:
+        store = HunterStore(str(tmp_path / "hunters"), writer=writer)
+        for _ in range(3):
+            earn(store, "alpha", 2)
+        assert HunterStore(str(tmp_path / "hunters")).load("alpha").gold == 6
+    finally:
+        writer.close()
@@ -0,0 +1,100 @@
+"""Journal replay and compaction of the journaled quest catalog."""
+
+import os
+
+from repositories.journaled_quest_repository import JournaledQuestRepository
+
+
+def make_repository(tmp_path, compact_threshold: int = 1000) -> JournaledQuestRepository:
+    return JournaledQuestRepository(str(tmp_path / "quests.json"), compact_threshold=compact_threshold, fsync=False)
+
+
+def catalog(repository: JournaledQuestRepository) -> dict:
+    return {quest.id: (quest.name, quest.xp_reward) for quest in repository.get_all()}
+
+
+def test_new_instance_replays_the_journal(tmp_path, make_quest):
+    writer = make_repository(tmp_path)
+    kept, updated, deleted = make_quest("Kept"), make_quest("Updated"), make_quest("Deleted")
+    for quest in (kept, updated, deleted):
+        writer.add(quest)
+    updated.xp_reward = 500
+    assert writer.update(updated)
+    assert writer.delete(deleted.id)
+
+    assert not os.path.exists(writer.filepath)
+    assert catalog(make_repository(tmp_path)) == {kept.id: ("Kept", 100), updated.id: ("Updated", 500)}
+
+
+def test_instances_catch_up_on_each_others_appends(tmp_path, make_quest):
+    first, second = make_repository(tmp_path), make_repository(tmp_path)
+    quest = make_quest()
+    first.add(quest)
+    assert second.get_by_id(quest.id) is not None
+
+    assert second.delete(quest.id)
+    assert first.get_by_id(quest.id) is None
+
+
+def test_torn_trailing_record_is_ignored_and_overwritten(tmp_path, make_quest):
+    repository = make_repository(tmp_path)
+    first = make_quest("First")
+    repository.add(first)
+    with open(repository.journal_path, 'ab') as file:
+        file.write(b'{"op": "put", "quest": {"id": "torn"')
+
+    reader = make_repository(tmp_path)
+    assert set(catalog(reader)) == {first.id}
+
+    second = make_quest("Second")
+    reader.add(second)
+    assert set(catalog(make_repository(tmp_path))) == {first.id, second.id}
+
+
+def test_compaction_folds_the_journal_into_the_base(tmp_path, make_quest):
+    repository = make_repository(tmp_path)
+    quests = [make_quest(f"Quest {i}") for i in range(5)]
+    for quest in quests:
+        repository.add(quest)
+    repository.delete(quests[0].id)
+    expected = catalog(repository)
+
+    repository.compact()
+
+    assert os.path.exists(repository.filepath)
+    assert not os.path.exists(repository.old_journal_path)
+    assert repository._stored_version() == 1
+    assert catalog(repository) == expected
+    assert catalog(make_repository(tmp_path)) == expected
+
+    repository.add(make_quest("After"))
+    repository.compact()
+    assert repository._stored_version() == 2
+    assert len(catalog(make_repository(tmp_path))) == 5
+
+
+def test_threshold_starts_a_background_compaction(tmp_path, make_quest):
+    repository = make_repository(tmp_path, compact_threshold=3)
+    for i in range(3):
+        repository.add(make_quest(f"Quest {i}"))
+    repository._compactor.join()
+
+    assert os.path.exists(repository.filepath)
+    assert len(catalog(make_repository(tmp_path))) == 3
+
+
+def test_journal_left_by_an_interrupted_compaction_is_replayed(tmp_path, make_quest):
+    repository = make_repository(tmp_path)
+    rotated = make_quest("Rotated")
+    repository.add(rotated)
+    # A compaction that crashed after rotating the journal, before writing the base
+    os.replace(repository.journal_path, repository.old_journal_path)
+
+    reader = make_repository(tmp_path)
+    later = make_quest("Later")
+    reader.add(later)
+    assert set(catalog(reader)) == {rotated.id, later.id}
+
+    reader.compact()
+    assert not os.path.exists(reader.old_journal_path)
+    assert set(catalog(make_repository(tmp_path))) == {rotated.id, later.id}
@@ -0,0 +1,130 @@
+"""Leaderboards: ranked skip lists, standings, and rebuilds racing with completions."""
+
+import random
+import threading
+import time
+
+from entities.hunter import Hunter
+from services.leaderboard import GLOBAL_BOARD, Leaderboard, LeaderboardIndex, LeaderboardRefresher, _RankedKeys
+
+
+def hunter_with(xp: int, version: int = 1) -> Hunter:
+    hunter = Hunter("Hunter")
+    hunter.stats["Strength"].total_xp = xp
+    hunter.version = version
+    return hunter
+
+
+def test_ranked_keys_match_a_sorted_list():
+    rng = random.Random(11)
+    keys = _RankedKeys()
+    expected = []
+
+    for i in range(3000):
+        if expected and rng.random() < 0.4:
+            key = expected.pop(rng.randrange(len(expected)))
+            keys.remove(key)
+        else:
+            key = (rng.randint(-100, 0), str(i))
+            keys.insert(key)
+            expected.append(key)
+            expected.sort()
+
+        if i % 250 == 0:
+            assert len(keys) == len(expected)
+            assert keys.slice(0, len(expected)) == expected
+            start = rng.randrange(len(expected) + 2)
+            assert keys.slice(start, 10) == expected[start:start + 10]
+            probe = (rng.randint(-100, 0),)
+            assert keys.bisect_left(probe) == sum(1 for key in expected if key < probe)
+
+
+def test_ties_share_a_rank_and_are_ordered_by_id():
+    board = Leaderboard()
+    for hunter_id, xp in (("c", 50), ("a", 100), ("b", 100), ("d", 10)):
+        board.update(hunter_id, xp)
+
+    assert [(entry["rank"], entry["hunter_id"]) for entry in board.top(10)] == [(1, "a"), (1, "b"), (3, "c"), (4, "d")]
+    assert board.rank("c") == 3
+    assert [entry["hunter_id"] for entry in board.around("c", 1)] == ["b", "c", "d"]
+    assert board.rank("missing") is None and board.around("missing", 1) == []
+
+
+def test_updates_and_removals_move_hunters():
+    board = Leaderboard()
+    board.update("a", 10)
+    board.update("b", 20)
+    board.update("a", 30)
+    board.update("a", 30)
+
+    assert [entry["hunter_id"] for entry in board.top(2)] == ["a", "b"]
+    board.remove("a")
+    board.remove("a")
+    assert len(board) == 1 and board.rank("b") == 1
+
+
+def test_standing_reports_every_board():
+    index = LeaderboardIndex()
+    index.record("alpha", hunter_with(100))
+    index.record("beta", hunter_with(300))
+
+    standing = index.standing(GLOBAL_BOARD, "alpha", radius=1)
+    assert (standing["rank"], standing["xp"], standing["total_hunters"]) == (2, 100, 2)
+    assert [entry["hunter_id"] for entry in index.top("Strength")] == ["beta", "alpha"]
+    assert index.standing(GLOBAL_BOARD, "missing") is None
+
+
+def test_completions_recorded_during_a_rebuild_are_kept():
+    index = LeaderboardIndex()
+    stored = [(f"hunter-{i}", hunter_with(10, version=1)) for i in range(100)]
+
+    def complete():
+        for i in range(100):
+            index.record(f"hunter-{i}", hunter_with(1000 + i, version=2))
+            time.sleep(0.0002)
+
+    thread = threading.Thread(target=complete)
+
+    def slow_scan():
+        # Completions start once the store is being read, and outlast the scan
+        thread.start()
+        for hunter_id, hunter in stored:
+            time.sleep(0.0001)
+            yield hunter_id, hunter
+
+    index.rebuild(slow_scan())
+    thread.join()
+
+    assert index.size(GLOBAL_BOARD) == 100
+    assert all(entry["xp"] >= 1000 for entry in index.top(GLOBAL_BOARD, 100))
+
+
+def test_rebuild_keeps_a_newer_stored_version_over_an_older_record():
+    index = LeaderboardIndex()
+
+    def scan():
+        # Another worker saved version 3 before this worker's record of version 2 is replayed
+        index.record("alpha", hunter_with(50, version=2))
+        yield "alpha", hunter_with(80, version=3)
+
+    index.rebuild(scan())
+
+    assert index.standing(GLOBAL_BOARD, "alpha")["xp"] == 80
+
+
+def test_refresher_rebuilds_from_storage_until_closed():
+    index = LeaderboardIndex()
+    stored = {"alpha": hunter_with(10)}
+    refresher = LeaderboardRefresher(index, lambda: list(stored.items()), interval=0.01)
+    try:
+        deadline = time.monotonic() + 5
+        while index.size(GLOBAL_BOARD) == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stored["beta"] = hunter_with(20)
+        while index.size(GLOBAL_BOARD) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        refresher.close()
+
+    assert [entry["hunter_id"] for entry in index.top(GLOBAL_BOARD)] == ["beta", "alpha"]
+    assert refresher.rebuilds >= 2
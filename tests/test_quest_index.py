@@ -0,0 +1,111 @@
+"""Secondary indexes of the quest catalog and the cached repository that keeps them."""
+
+import random
+
+import pytest
+
+from entities.quest import Quest
+from entities.quest_difficulty import QuestDifficulty
+from repositories.cached_quest_repository import CachedQuestRepository
+from repositories.quest_index import QuestIndex
+from repositories.quest_repository import QuestRepository
+
+STATS = ["Strength", "Agility", "Intelligence"]
+
+
+def random_catalog(count: int, seed: int = 7) -> list[Quest]:
+    rng = random.Random(seed)
+    return [Quest(f"Quest {i}", rng.choice(STATS), rng.choice(list(QuestDifficulty)),
+                  rng.randint(1, 20) * 10, rng.randint(0, 10) * 5, "") for i in range(count)]
+
+
+def scan(quests, stat=None, difficulty=None, min_xp=None, max_xp=None, min_gold=None, max_gold=None):
+    return [quest.id for quest in quests
+            if (stat is None or quest.stat == stat)
+            and (difficulty is None or quest.difficulty == difficulty)
+            and (min_xp is None or quest.xp_reward >= min_xp) and (max_xp is None or quest.xp_reward <= max_xp)
+            and (min_gold is None or quest.gold_reward >= min_gold) and (max_gold is None or quest.gold_reward <= max_gold)]
+
+
+FILTERS = [
+    {},
+    {"stat": "Agility"},
+    {"difficulty": QuestDifficulty.HARD},
+    {"min_xp": 50, "max_xp": 120},
+    {"max_gold": 10},
+    {"stat": "Strength", "difficulty": QuestDifficulty.EASY, "min_gold": 20},
+    {"stat": "Unknown"},
+    {"min_xp": 150, "max_xp": 100},
+]
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_queries_match_a_scan_in_catalog_order(filters):
+    quests = random_catalog(300)
+    index = QuestIndex()
+    for quest in quests:
+        index.add(quest)
+
+    assert index.query(**filters) == scan(quests, **filters)
+    assert QuestIndex.build(quests).query(**filters) == scan(quests, **filters)
+
+
+def test_build_matches_adding_one_quest_at_a_time_with_repeated_ids():
+    quests = random_catalog(100)
+    updated = Quest.from_record(quests[10].id, "Renamed", "Agility", QuestDifficulty.EPIC, 999, 1, "")
+    catalog = quests + [updated]
+
+    added = QuestIndex()
+    for quest in catalog:
+        added.add(quest)
+    built = QuestIndex.build(catalog)
+
+    assert len(built) == len(added) == 100
+    for filters in FILTERS + [{"min_xp": 999}]:
+        assert built.query(**filters) == added.query(**filters)
+    # The updated quest keeps its position and takes its new values
+    assert built.query(min_xp=999) == [quests[10].id]
+
+
+def test_updated_and_removed_quests_leave_the_old_entries():
+    quests = random_catalog(50)
+    index = QuestIndex.build(quests)
+    moved = quests[0]
+    index.add(Quest.from_record(moved.id, moved.name, "Spirit", moved.difficulty, 5, 0, ""))
+    index.remove(quests[1].id)
+    index.remove("missing")
+
+    assert index.query(stat="Spirit") == [moved.id]
+    assert moved.id not in index.query(stat=moved.stat)
+    assert quests[1].id not in index.query()
+    assert index.query(max_xp=5) == [moved.id]
+
+
+def test_cached_repository_sees_writes_from_another_repository(tmp_path, make_quest):
+    path = str(tmp_path / "quests.json")
+    cached = CachedQuestRepository(QuestRepository(path))
+    other = QuestRepository(path)
+
+    first = make_quest("First", stat="Strength", xp_reward=100)
+    cached.add(first)
+    assert [quest.id for quest in cached.find(stat="Strength")] == [first.id]
+
+    second = make_quest("Second", stat="Strength", xp_reward=300)
+    other.add(second)
+    assert [quest.id for quest in cached.find(stat="Strength", min_xp=200)] == [second.id]
+    assert cached.reloads >= 2
+
+    first.stat = "Agility"
+    assert cached.update(first)
+    assert [quest.id for quest in cached.get_by_stat("Agility")] == [first.id]
+    assert cached.delete(second.id)
+    assert cached.find(stat="Strength") == []
+
+
+def test_cached_quests_are_copies(tmp_path, make_quest):
+    cached = CachedQuestRepository(QuestRepository(str(tmp_path / "quests.json")))
+    quest = make_quest("Original")
+    cached.add(quest)
+
+    cached.get_by_id(quest.id).name = "Changed"
+    assert cached.get_by_id(quest.id).name == "Original"
@@ -0,0 +1,131 @@
+"""Quest log rollup tables of the database layer, their backfill and their migration."""
+
+import importlib.util
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sa = pytest.importorskip("sqlalchemy")
+
+from sqlalchemy.orm import Session
+
+from database.base import Base
+from database.migrate_data import create_target_engine
+from database.models import HunterModel, QuestLogModel, QuestLogRollupModel, QuestModel
+from repositories.db.quest_log_repository_db import QuestLogRepositoryDB
+
+MIGRATIONS = Path(__file__).resolve().parent.parent / "database" / "migrations" / "versions"
+MONDAY = datetime(2026, 3, 2, 9, 0)
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_target_engine(f"sqlite:///{tmp_path / 'rollups.db'}", 1)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def add_catalog(session: Session) -> tuple[str, str, str]:
+    hunter = HunterModel(name="Hunter")
+    run = QuestModel(name="Run", stat_name="Agility", difficulty="EASY", exp_reward=10, gold_reward=2)
+    lift = QuestModel(name="Lift", stat_name="Strength", difficulty="EASY", exp_reward=20, gold_reward=3)
+    session.add_all([hunter, run, lift])
+    session.commit()
+    return hunter.id, run.id, lift.id
+
+
+def import_logs(session: Session, hunter_id: str, quest_id: str, days: list[int]) -> None:
+    """Insert logs around the repository, like a bulk import, so they are not rolled up."""
+    session.add_all([QuestLogModel(quest_id=quest_id, hunter_id=hunter_id, exp_gained=10, gold_gained=2,
+                                   completed_at=MONDAY + timedelta(days=day)) for day in days])
+    session.commit()
+
+
+def test_logged_completions_are_rolled_up_as_they_are_written(session):
+    hunter_id, run_id, lift_id = add_catalog(session)
+    repository = QuestLogRepositoryDB(session)
+
+    repository.log_completion(run_id, hunter_id, 10, 2)
+    repository.log_completion(lift_id, hunter_id, 20, 3)
+    repository.log_completion(run_id, hunter_id, 10, 2)
+
+    assert repository.get_completion_count(hunter_id) == 3
+    assert repository.get_total_rewards(hunter_id) == {"total_exp": 40.0, "total_gold": 7}
+    assert session.query(QuestLogModel).filter(QuestLogModel.rolled_up.is_(False)).count() == 0
+    rows = {(row["stat_name"], row["completions"]) for row in repository.get_rollups(hunter_id, "week")}
+    assert rows == {("Agility", 2), ("Strength", 1)}
+
+
+def test_imported_logs_count_before_and_after_the_backfill(session):
+    hunter_id, run_id, _ = add_catalog(session)
+    import_logs(session, hunter_id, run_id, [0, 1, 8])
+    repository = QuestLogRepositoryDB(session)
+    before = (repository.get_completion_count(hunter_id), repository.get_rollups(hunter_id, "week"))
+
+    assert repository.backfill_rollups(batch_size=2) == 3
+    assert repository.backfill_rollups() == 0
+
+    assert (repository.get_completion_count(hunter_id), repository.get_rollups(hunter_id, "week")) == before
+    weeks = repository.get_rollups(hunter_id, "week")
+    assert [(row["bucket_start"], row["completions"]) for row in weeks] == [(date(2026, 3, 2), 2), (date(2026, 3, 9), 1)]
+    assert session.query(QuestLogRollupModel).filter_by(period="day").count() == 3
+
+
+def test_unknown_periods_are_rejected(session):
+    with pytest.raises(ValueError):
+        QuestLogRepositoryDB(session).get_rollups("hunter", "month")
+
+
+def load_revision(name: str):
+    spec = importlib.util.spec_from_file_location(name, MIGRATIONS / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_migration_creates_the_rollups_and_backfills_existing_logs(tmp_path):
+    pytest.importorskip("alembic")
+    from alembic.autogenerate import compare_metadata
+    from alembic.migration import MigrationContext
+    from alembic.operations import Operations
+
+    initial = load_revision("3f9c2a7d1b04_initial_schema")
+    rollups = load_revision("8d41e6b2c5a9_quest_log_rollups")
+    assert rollups.down_revision == initial.revision
+
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'migrated.db'}")
+    with engine.begin() as connection, Operations.context(MigrationContext.configure(connection)):
+        initial.upgrade()
+    with engine.begin() as connection:
+        now = datetime(2026, 1, 1)
+        connection.execute(sa.text("INSERT INTO hunters (id, name, global_level, global_exp, gold, created_at, "
+                                   "updated_at) VALUES ('h', 'Hunter', 1, 0, 0, :now, :now)"), {"now": now})
+        connection.execute(sa.text("INSERT INTO quests (id, name, stat_name, difficulty, exp_reward, gold_reward, "
+                                   "created_at, updated_at) VALUES ('q', 'Run', 'Agility', 'EASY', 10, 2, :now, :now)"),
+                           {"now": now})
+        for i, day in enumerate([0, 0, 1, 7]):
+            connection.execute(sa.text("INSERT INTO quest_logs (id, quest_id, hunter_id, completed_at, exp_gained, "
+                                       "gold_gained, created_at, updated_at) VALUES (:id, 'q', 'h', :at, 10, 2, :now, :now)"),
+                               {"id": str(i), "at": MONDAY + timedelta(days=day), "now": now})
+
+    with engine.begin() as connection, Operations.context(MigrationContext.configure(connection)):
+        rollups.upgrade()
+
+    with engine.connect() as connection:
+        assert compare_metadata(MigrationContext.configure(connection), Base.metadata) == []
+    with Session(engine) as session:
+        repository = QuestLogRepositoryDB(session)
+        assert session.query(QuestLogModel).filter(QuestLogModel.rolled_up.is_(False)).count() == 0
+        assert repository.get_total_rewards("h") == {"total_exp": 40.0, "total_gold": 8}
+        days = [(row["bucket_start"], row["completions"]) for row in repository.get_rollups("h", "day")]
+        assert days == [(date(2026, 3, 2), 2), (date(2026, 3, 3), 1), (date(2026, 3, 9), 1)]
+
+    with engine.begin() as connection, Operations.context(MigrationContext.configure(connection)):
+        rollups.downgrade()
+    with engine.connect() as connection:
+        inspector = sa.inspect(connection)
+        assert "quest_log_rollups" not in inspector.get_table_names()
+        assert "rolled_up" not in {column["name"] for column in inspector.get_columns("quest_logs")}
+    engine.dispose()
@@ -0,0 +1,102 @@
+"""Background quest log writer: real completion times, late entries and retried appends."""
+
+from datetime import datetime, timedelta
+
+from entities.quest_log import QuestLog
+from repositories.quest_log_repository import MAX_DISORDER, QuestLogRepository
+from services.quest_log_writer import QuestLogWriter
+
+
+def quest_log(quest_id: str, completed_at: datetime) -> QuestLog:
+    return QuestLog.from_record(quest_id, 10, 1, completed_at, "Agility", "default")
+
+
+class TornAppends(QuestLogRepository):
+    """Fails its first appends after writing part of a line, like a write cut short by a full disk."""
+
+    failures = 2
+
+    def _line_separator(self, file) -> bytes:
+        separator = super()._line_separator(file)
+        if self.failures:
+            self.failures -= 1
+            file.write(b'{"quest_id": "torn')
+            file.flush()
+            raise OSError("No space left on device")
+        return separator
+
+
+def test_completion_times_are_kept_and_late_entries_counted(tmp_path):
+    repository = QuestLogRepository(str(tmp_path / "quest_logs.jsonl"))
+    writer = QuestLogWriter(repository, max_delay=0.01)
+    now = datetime(2026, 5, 1, 12, 0)
+    late = now - MAX_DISORDER - timedelta(minutes=5)
+
+    writer.submit(quest_log("now", now))
+    writer.flush()
+    writer.submit(quest_log("late", late))
+    writer.close()
+
+    stored = {entry.quest_id: entry.completed_at for entry in repository.get_all()}
+    assert stored == {"now": now, "late": late}
+    assert writer.metrics()["late"] == 1
+
+
+def test_entries_out_of_order_within_the_tolerance_are_found_by_range_reads(tmp_path):
+    repository = QuestLogRepository(str(tmp_path / "quest_logs.jsonl"))
+    writer = QuestLogWriter(repository, max_delay=0.01)
+    now = datetime(2026, 5, 1, 12, 0)
+    behind = now - MAX_DISORDER / 2
+
+    writer.submit(quest_log("now", now))
+    writer.flush()
+    writer.submit(quest_log("behind", behind))
+    writer.close()
+
+    assert [entry.quest_id for entry in repository.get_all()] == ["now", "behind"]
+    assert [entry.quest_id for entry in repository.iter_between(behind, behind + timedelta(seconds=1))] == ["behind"]
+    assert [entry.quest_id for entry in repository.iter_between(behind, now)] == ["behind"]
+    assert writer.metrics()["late"] == 0
+
+
+def test_a_batch_is_written_in_completion_order(tmp_path):
+    repository = QuestLogRepository(str(tmp_path / "quest_logs.jsonl"))
+    writer = QuestLogWriter(repository, max_delay=0.5)
+    start = datetime(2026, 5, 1)
+
+    for seconds in (3, 1, 2):
+        writer.submit(quest_log(str(seconds), start + timedelta(seconds=seconds)))
+    writer.close()
+
+    assert [entry.quest_id for entry in repository.get_all()] == ["1", "2", "3"]
+    assert writer.metrics()["late"] == 0
+
+
+def test_retried_appends_leave_no_torn_or_repeated_lines(tmp_path):
+    repository = TornAppends(str(tmp_path / "quest_logs.jsonl"))
+    writer = QuestLogWriter(repository, max_delay=0.01, max_attempts=3)
+    positions = []
+    writer.add_listener(lambda quest_logs, position: positions.append(position))
+    start = datetime(2026, 5, 1)
+
+    writer.submit(quest_log("first", start))
+    writer.submit(quest_log("second", start + timedelta(seconds=1)))
+    writer.close()
+
+    assert [entry.quest_id for entry in repository.get_all()] == ["first", "second"]
+    assert b"torn" not in (tmp_path / "quest_logs.jsonl").read_bytes()
+    assert writer.metrics()["written"] == 2
+    assert positions == [repository.end_position()]
+
+
+def test_a_batch_failing_every_attempt_is_dropped(tmp_path):
+    repository = TornAppends(str(tmp_path / "quest_logs.jsonl"))
+    repository.failures = 3
+    writer = QuestLogWriter(repository, max_delay=0.01, max_attempts=3)
+
+    writer.submit(quest_log("lost", datetime(2026, 5, 1)))
+    writer.close()
+
+    assert writer.metrics()["dropped"] == 1
+    assert repository.get_all() == []
+    assert repository.end_position() == 0
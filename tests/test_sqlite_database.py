@@ -0,0 +1,77 @@
+"""Explicit and nested transactions of the SQLite connection manager."""
+
+import sqlite3
+
+import pytest
+
+from repositories.sqlite import SQLiteDatabase
+
+
+class FailingCommitConnection:
+    """Forwards to a connection, failing COMMIT the way SQLITE_BUSY does: the transaction stays open."""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+
+    def execute(self, sql: str, *args):
+        if sql == "COMMIT":
+            raise sqlite3.OperationalError("database is locked")
+        return self._connection.execute(sql, *args)
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = SQLiteDatabase(str(tmp_path / "hunter.db"))
+    database.connection.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    yield database
+    database.close()
+
+
+def count(database) -> int:
+    return database.connection.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+
+def test_transaction_commits_on_success(database):
+    with database.transaction() as connection:
+        connection.execute("INSERT INTO items VALUES (1)")
+    assert count(database) == 1
+    assert not database.connection.in_transaction
+
+
+def test_transaction_rolls_back_on_error(database):
+    with pytest.raises(ValueError):
+        with database.transaction() as connection:
+            connection.execute("INSERT INTO items VALUES (1)")
+            raise ValueError("abort")
+    assert count(database) == 0
+
+
+def test_nested_transactions_join_the_outer_one(database):
+    with pytest.raises(ValueError):
+        with database.transaction() as connection:
+            with database.transaction() as inner:
+                inner.execute("INSERT INTO items VALUES (1)")
+            connection.execute("INSERT INTO items VALUES (2)")
+            raise ValueError("abort")
+    assert count(database) == 0
+
+
+def test_failed_commit_rolls_back(database):
+    real = database.connection
+    database._local.connection = FailingCommitConnection(real)
+
+    with pytest.raises(sqlite3.OperationalError):
+        with database.transaction() as connection:
+            connection.execute("INSERT INTO items VALUES (1)")
+
+    database._local.connection = real
+    assert not real.in_transaction
+    assert database._local.depth == 0
+    assert count(database) == 0
+
+    with database.transaction() as connection:
+        connection.execute("INSERT INTO items VALUES (2)")
+    assert count(database) == 1
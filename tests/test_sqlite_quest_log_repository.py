@@ -0,0 +1,53 @@
+"""Time range reads of the SQLite quest log, paged by (completed_at, seq) keys."""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+import repositories.sqlite.quest_log_repository_sqlite as quest_log_module
+from entities.quest_log import QuestLog
+from repositories.sqlite import QuestLogRepositorySQLite, SQLiteDatabase
+
+START = datetime(2026, 1, 1)
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = SQLiteDatabase(str(tmp_path / "hunter.db"))
+    yield database
+    database.close()
+
+
+def test_ranges_are_read_in_time_order_across_pages(database, monkeypatch):
+    monkeypatch.setattr(quest_log_module, "ITER_PAGE_SIZE", 7)
+    rng = random.Random(9)
+    logs = [QuestLog.from_record(f"quest-{i}", 1, 1,
+                                 START + timedelta(seconds=rng.randint(0, 300), microseconds=rng.choice([0, 500000])),
+                                 "Agility", rng.choice(["alpha", "beta"])) for i in range(400)]
+    repository = QuestLogRepositorySQLite(database)
+    repository.add_many(logs)
+    stored = list(enumerate(logs))
+
+    for _ in range(40):
+        start = START + timedelta(seconds=rng.randint(-5, 305))
+        end = start + timedelta(seconds=rng.randint(0, 120))
+        hunter_id = rng.choice([None, "alpha"])
+        expected = [log.quest_id for _, log in sorted(stored, key=lambda item: (item[1].completed_at, item[0]))
+                    if start <= log.completed_at < end and hunter_id in (None, log.hunter_id)]
+        assert [log.quest_id for log in repository.iter_between(start, end, hunter_id)] == expected
+
+    assert len(list(repository.iter_between())) == 400
+
+
+def test_time_ranges_are_scanned_on_the_keyset_indexes(database):
+    connection = database.connection
+    indexes = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"ix_quest_logs_completed_at_seq", "ix_quest_logs_hunter_completed_at_seq"} <= indexes
+    assert "ix_quest_logs_completed_at" not in indexes
+
+    plan = " ".join(row[3] for row in connection.execute(
+        "EXPLAIN QUERY PLAN SELECT seq FROM quest_logs WHERE hunter_id = ? AND (completed_at, seq) > (?, ?) "
+        "ORDER BY completed_at, seq LIMIT 10", ("alpha", "", 0)))
+    assert "ix_quest_logs_hunter_completed_at_seq" in plan
+    assert "TEMP B-TREE" not in plan
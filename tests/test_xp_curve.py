@@ -0,0 +1,61 @@
+"""Thresholds and level lookups of the XP curve, inside and past the cache."""
+
+import pytest
+
+from utils.level_constants import XP_THRESHOLDS
+from utils.xp_curve import DEFAULT_XP_CURVE, XPCurve
+
+
+def brute_force_level(curve: XPCurve, total_xp: int) -> int:
+    level = 1
+    while curve.threshold(level + 1) <= total_xp:
+        level += 1
+    return level
+
+
+def test_seed_table_is_kept_and_the_formula_continues_it():
+    curve = XPCurve(seed_thresholds=XP_THRESHOLDS)
+    top = len(XP_THRESHOLDS)
+
+    assert [curve.threshold(level) for level in range(1, top + 1)] == XP_THRESHOLDS
+    assert curve.threshold(top + 1) - curve.threshold(top) == curve.level_increment(top + 1)
+    assert curve.threshold(top + 2) - curve.threshold(top + 1) == curve.level_increment(top + 1) + curve.increment_step
+
+
+@pytest.mark.parametrize("curve", [
+    XPCurve(seed_thresholds=XP_THRESHOLDS),
+    XPCurve(base_increment=70, increment_step=0),
+    XPCurve(base_increment=100, increment_step=50, max_cached_level=5),
+])
+def test_levels_match_the_thresholds(curve):
+    for total_xp in [0, 1, 99, 100, 101, 5_000, 123_456, 10**9]:
+        level = curve.level_for_xp(total_xp)
+        assert curve.threshold(level) <= total_xp < curve.threshold(level + 1)
+        assert curve.xp_for_next_level(total_xp) == curve.threshold(level + 1) - total_xp
+
+
+def test_levels_past_the_cache_use_the_closed_form():
+    curve = XPCurve(max_cached_level=10)
+    total_xp = curve.threshold(500) + 1
+
+    assert curve.level_for_xp(total_xp) == 500
+    assert len(curve._thresholds) <= 10
+    assert brute_force_level(XPCurve(), total_xp) == 500
+
+
+def test_resolve_many_agrees_with_single_lookups():
+    pytest.importorskip("numpy")
+    totals = [0, 1, 99, 100, 150, 4_999, 5_000, DEFAULT_XP_CURVE.threshold(50),
+              DEFAULT_XP_CURVE.threshold(51) - 1, DEFAULT_XP_CURVE.threshold(51), 10**9]
+
+    levels, xp_to_next = DEFAULT_XP_CURVE.resolve_many(totals)
+
+    assert levels.tolist() == [DEFAULT_XP_CURVE.level_for_xp(xp) for xp in totals]
+    assert xp_to_next.tolist() == [DEFAULT_XP_CURVE.xp_for_next_level(xp) for xp in totals]
+
+
+def test_invalid_increments_are_rejected():
+    with pytest.raises(ValueError):
+        XPCurve(base_increment=0)
+    with pytest.raises(ValueError):
+        XPCurve(increment_step=-1)
@@ -1,17 +1,18 @@
 import os
-from repositories.hunter_repository import HunterRepository
-from repositories.quest_repository import QuestRepository
+from repositories.factory import create_hunter_repository, create_quest_repository
 from services.quest_service import QuestService
 from services.progression_service import ProgressionService
+from services.quest_log_writer import get_quest_log_writer
 
 class CLI:
     def __init__(self) -> None:
         """Initialize the CLI with repositories and services."""
 
-        self.hunter_repo = HunterRepository("data/hunter.json")
-        self.quest_repo = QuestRepository("data/quests.json")
+        self.hunter_repo = create_hunter_repository()
+        self.quest_repo = create_quest_repository()
         self.quest_service = QuestService(self.quest_repo)
-        self.progression_service = ProgressionService(self.hunter_repo, self.quest_repo)
+        self.progression_service = ProgressionService(self.hunter_repo, self.quest_repo,
+                                                      quest_log_writer=get_quest_log_writer())
         self.hunter = self.hunter_repo.load()
 
     def run(self):
@@ -180,17 +181,16 @@ class CLI:
         print("=" * 50)
         print()
 
-        quests = self.quest_service.get_all()
-
-        if not quests:
-            print("No quests available. Add a new quest first")
-            return
-        
-        for i, quest in enumerate(quests, 1):
-            print(f"{i}. [{quest.stat}] {quest.name} ({quest.difficuly.name})")
+        count = 0
+        for i, quest in enumerate(self.quest_service.iter_all(), 1):
+            print(f"{i}. [{quest.stat}] {quest.name} ({quest.difficulty.name})")
             print(f"   {quest.xp_reward} XP, {quest.gold_reward} Gold")
             print(f"   \"{quest.description}\"")
             print()
+            count = i
+
+        if count == 0:
+            print("No quests available. Add a new quest first")
 
 
     def filter_quests_by_stat(self):
@@ -216,20 +216,19 @@ class CLI:
             print("Invalid selection.")
             return
         
-        quests = self.quest_service.list_by_stat(stat_name)
-
         print()
         print(f"=== {stat_name} Quests ===")
         print()
 
-        if not quests:
-            print(f"No quests found for {stat_name}.")
-            return
-        
-        for i, quest in enumerate(quests, 1):
+        count = 0
+        for i, quest in enumerate(self.quest_service.iter_by_stat(stat_name), 1):
             print(f"{i}. {quest.name} ({quest.difficulty.name})")
             print(f"   {quest.xp_reward} XP, {quest.gold_reward} Gold")
             print()
+            count = i
+
+        if count == 0:
+            print(f"No quests found for {stat_name}.")
 
     def delete_quest_flow(self):
         """Delete a quest with confirmation."""
@@ -326,18 +325,22 @@ class CLI:
             print(f"Error: {result.get('error', 'Unknown error')}")
             return
         
+        reward = result["result"]
+        progress = reward.stats[0]
+
         # Show feedback
         print()
         print("=" * 50)
         print(f"✓ Quest Completed: {result['quest_name']}")
-        print(f"  +{result['xp_gained']} XP {result['stat']}")
-        print(f"  +{result['gold_gained']} Gold")
+        print(f"  +{progress.xp_gained} XP {progress.stat}")
+        print(f"  +{reward.gold_gained} Gold")
 
         # If there was a level up
-        if result['leveled_up']:
+        if progress.leveled_up:
             print()
-            print(f"🎉 LEVEL UP! {result['stat']} {result['level_before']} → {result['level_after']}")
+            print(f"🎉 LEVEL UP! {progress.stat} {progress.level_before} → {progress.level_after}")
 
+        print(f"  {progress.xp_to_next_level} XP to next level")
         print("=" * 50)
 
         self.hunter = self.hunter_repo.load()
@@ -19,3 +19,8 @@ XP_THRESHOLDS: Final[list[int]] = [
     45100, 47250, 49450, 51700, 54000,     # Up to level 45
     56350, 58750, 61200, 63700, 65000      # Up to level 50
 ]
+
+# Past the table, each level costs XP_INCREMENT_STEP more XP than the previous
+# one, starting from XP_BASE_INCREMENT for level 2 (the same rule the table follows).
+XP_BASE_INCREMENT: Final[int] = 100
+XP_INCREMENT_STEP: Final[int] = 50
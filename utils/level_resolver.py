@@ -0,0 +1,51 @@
+"""
+Level resolution helpers.
+
+Resolves levels and XP-to-next-level from total XP through the shared XP
+curve (binary search inside the cached thresholds, closed-form inverse past
+them), plus a batch API that resolves many XP totals in a single NumPy pass.
+"""
+
+from utils.xp_curve import DEFAULT_XP_CURVE, XPCurve
+
+
+def get_level(total_xp: int, curve: XPCurve = DEFAULT_XP_CURVE) -> int:
+    """Resolve the level reached with the given total XP.
+
+    Args:
+        total_xp: Total experience points accumulated
+        curve: XP curve to resolve against
+
+    Returns:
+        Level reached, starting at 1
+    """
+    return curve.level_for_xp(total_xp)
+
+
+def xp_for_next_level(total_xp: int, curve: XPCurve = DEFAULT_XP_CURVE) -> int:
+    """Calculate XP needed to reach the level after the one reached with total_xp.
+
+    Args:
+        total_xp: Total experience points accumulated
+        curve: XP curve to resolve against
+
+    Returns:
+        XP needed for next level
+    """
+    return curve.xp_for_next_level(total_xp)
+
+
+def resolve_levels(xp_totals, curve: XPCurve = DEFAULT_XP_CURVE):
+    """Resolve levels and XP-to-next-level for many XP totals at once.
+
+    Meant for reports and reconciliation jobs that recompute levels for large
+    numbers of stat rows; the whole array is resolved in one vectorized pass.
+
+    Args:
+        xp_totals: Sequence or NumPy array of total XP values
+        curve: XP curve to resolve against
+
+    Returns:
+        Tuple of (levels, xp_to_next) NumPy int64 arrays with the same shape as xp_totals
+    """
+    return curve.resolve_many(xp_totals)
@@ -1,3 +1,6 @@
 """Valid stat types for the Hunter System."""
 
-VALID_STATS = ["Strength", "Agility", "Intelligence", "Spirit", "Domain"]
\ No newline at end of file
+VALID_STATS = ["Strength", "Agility", "Intelligence", "Spirit", "Domain"]
+
+# Ordinal of each stat, used to index array-backed stat storage
+STAT_INDEX = {stat_name: index for index, stat_name in enumerate(VALID_STATS)}
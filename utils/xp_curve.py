@@ -0,0 +1,169 @@
+"""
+XP curve engine.
+
+Generates level thresholds from an arithmetic-increment formula: reaching
+level L costs `base_increment + (L - 2) * increment_step` XP more than level
+L - 1. An optional seed table (the legacy XP_THRESHOLDS) fixes the first
+levels; the formula continues from its last entry with no level cap.
+
+Thresholds are cached lazily as higher levels are reached, and levels past
+the cache are resolved with the closed-form inverse of the formula, so level
+lookups stay O(log n) inside the cache and O(1) beyond it.
+"""
+
+import threading
+from bisect import bisect_right
+from math import isqrt
+
+from utils.level_constants import XP_BASE_INCREMENT, XP_INCREMENT_STEP, XP_THRESHOLDS
+
+
+class XPCurve:
+    """Formula-driven XP threshold curve with a lazily extended cache."""
+
+    def __init__(self, base_increment: int = XP_BASE_INCREMENT,
+                 increment_step: int = XP_INCREMENT_STEP,
+                 seed_thresholds: list[int] | None = None,
+                 max_cached_level: int = 10_000) -> None:
+        """Initialize the curve.
+
+        Args:
+            base_increment: XP needed to go from level 1 to level 2
+            increment_step: Extra XP each following level costs over the previous one
+            seed_thresholds: Fixed thresholds for the first levels, starting at 0 for level 1
+            max_cached_level: Highest level whose threshold is kept in the cache
+        """
+        if base_increment <= 0 or increment_step < 0:
+            raise ValueError("XP curve increments must be positive")
+
+        self.base_increment = base_increment
+        self.increment_step = increment_step
+        self.max_cached_level = max_cached_level
+
+        self._thresholds: list[int] = list(seed_thresholds) if seed_thresholds else [0]
+        self._seed_level = len(self._thresholds)
+        self._seed_xp = self._thresholds[-1]
+        self._lock = threading.Lock()
+
+    def level_increment(self, level: int) -> int:
+        """XP needed to go from level - 1 to level according to the formula."""
+        return self.base_increment + (level - 2) * self.increment_step
+
+    def threshold(self, level: int) -> int:
+        """Total XP needed to reach a level.
+
+        Args:
+            level: Level to look up (1 or higher)
+
+        Returns:
+            Total XP at which the level is reached
+        """
+        if level <= len(self._thresholds):
+            return self._thresholds[max(level, 1) - 1]
+
+        if level > self.max_cached_level:
+            return self._formula_threshold(level)
+
+        self._extend_to(level)
+        return self._thresholds[level - 1]
+
+    def level_for_xp(self, total_xp: int) -> int:
+        """Resolve the level reached with the given total XP."""
+        thresholds = self._thresholds
+        if total_xp < thresholds[-1]:
+            return max(1, bisect_right(thresholds, total_xp))
+
+        level = self._seed_level + self._levels_past_seed(total_xp - self._seed_xp)
+        if level < self.max_cached_level:
+            self._extend_to(level + 1)
+        return level
+
+    def xp_for_next_level(self, total_xp: int) -> int:
+        """XP still needed to reach the level after the one reached with total_xp."""
+        return self.threshold(self.level_for_xp(total_xp) + 1) - total_xp
+
+    def resolve_many(self, xp_totals):
+        """Resolve levels and XP-to-next-level for many XP totals in one NumPy pass.
+
+        Args:
+            xp_totals: Sequence or NumPy array of total XP values
+
+        Returns:
+            Tuple of (levels, xp_to_next) NumPy int64 arrays with the same shape as xp_totals
+        """
+        import numpy as np
+
+        totals = np.asarray(xp_totals, dtype=np.int64)
+        seed = np.asarray(self._thresholds[:self._seed_level], dtype=np.int64)
+
+        # Inside the seed table: binary search
+        levels = np.maximum(np.searchsorted(seed, totals, side="right"), 1)
+
+        # Past the seed table: closed-form inverse, corrected by one step for float rounding
+        past = totals >= self._seed_xp
+        if past.any():
+            extra = totals[past] - self._seed_xp
+            n = self._levels_past_seed_approx(np, extra)
+            n += self._formula_offset(n + 1) <= extra
+            n -= self._formula_offset(n) > extra
+            levels[past] = self._seed_level + n
+
+        next_thresholds = np.where(
+            levels < self._seed_level,
+            seed[np.minimum(levels, self._seed_level - 1)],
+            self._seed_xp + self._formula_offset(levels + 1 - self._seed_level)
+        )
+
+        return levels.astype(np.int64), (next_thresholds - totals).astype(np.int64)
+
+    # Private methods
+
+    def _extend_to(self, level: int) -> None:
+        """Grow the cached thresholds up to the given level."""
+        with self._lock:
+            thresholds = self._thresholds
+            while len(thresholds) < level:
+                next_level = len(thresholds) + 1
+                thresholds.append(thresholds[-1] + self.level_increment(next_level))
+
+    def _formula_offset(self, n):
+        """XP between the last seed threshold and the threshold n levels past it.
+
+        Works on ints and NumPy arrays alike.
+        """
+        s = self._seed_level
+        return n * self.base_increment + self.increment_step * (n * (s - 1) + n * (n - 1) // 2)
+
+    def _formula_threshold(self, level: int) -> int:
+        """Total XP needed to reach a level past the seed table, without touching the cache."""
+        return self._seed_xp + self._formula_offset(level - self._seed_level)
+
+    def _levels_past_seed(self, extra_xp: int) -> int:
+        """Number of levels past the seed table reached with extra_xp (closed-form inverse)."""
+        a, step = self.base_increment, self.increment_step
+        if step == 0:
+            return extra_xp // a
+
+        # _formula_offset(n) <= extra_xp  <=>  step*n^2 + b*n - 2*extra_xp <= 0
+        b = 2 * a + step * (2 * self._seed_level - 3)
+        n = (isqrt(b * b + 8 * step * extra_xp) - b) // (2 * step)
+
+        while self._formula_offset(n + 1) <= extra_xp:
+            n += 1
+        while n > 0 and self._formula_offset(n) > extra_xp:
+            n -= 1
+        return n
+
+    def _levels_past_seed_approx(self, np, extra_xp):
+        """Vectorized floating-point version of _levels_past_seed, exact up to one level."""
+        a, step = self.base_increment, self.increment_step
+        if step == 0:
+            return extra_xp // a
+
+        b = 2 * a + step * (2 * self._seed_level - 3)
+        roots = np.sqrt(b * b + 8.0 * step * extra_xp.astype(np.float64))
+        return np.floor((roots - b) / (2 * step)).astype(np.int64)
+
+
+# Shared curve used by Stat, Hunter and ProgressionService
+DEFAULT_XP_CURVE = XPCurve(seed_thresholds=XP_THRESHOLDS)